@@ -0,0 +1,91 @@
+"""
+Timing helpers and JSON baselines of the browser benchmark suite (tests/benchmark_test).
+
+Baselines live in benchmarks/baselines/<browser>.json and are rewritten with
+    pytest tests/benchmark_test --run-benchmarks --browser=chrome --update-benchmark-baseline
+"""
+import json
+import math
+import os
+import platform
+import time
+from collections import namedtuple
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+
+BenchmarkResult = namedtuple("BenchmarkResult", "name iterations p50 p95 mean")
+
+
+def percentile(samples, pct):
+    """
+    Nearest-rank percentile of a list of samples.
+    """
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def measure(name, func, iterations, warmup=2, setup=None):
+    """
+    Time func over a number of iterations. setup runs before every call and is not timed.
+    :return: BenchmarkResult with timings in milliseconds.
+    :raises AssertionError: if func returns a falsy value, a broken primitive must not look fast.
+    """
+    samples = []
+    for i in range(warmup + iterations):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        result = func()
+        elapsed = (time.perf_counter() - start) * 1000
+        assert result is not False and result is not None, f"{name} failed on iteration {i}"
+        if i >= warmup:
+            samples.append(elapsed)
+    return BenchmarkResult(name, iterations, round(percentile(samples, 50), 3), round(percentile(samples, 95), 3),
+                           round(sum(samples) / len(samples), 3))
+
+
+class Baseline:
+    """
+    Stored p50/p95 per benchmark for one browser.
+    """
+
+    def __init__(self, browser, directory=BASELINE_DIR):
+        self.path = os.path.join(directory, f"{browser}.json")
+        self.browser = browser
+        self.results = {}
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as fh:
+                self.results = json.load(fh)["results"]
+
+    def compare(self, result, threshold, floor_ms):
+        """
+        :param threshold: Allowed relative regression, 0.2 = 20 %.
+        :param floor_ms: Absolute slack in ms so sub-millisecond noise never fails a run.
+        :return: List of regression messages, empty when within the threshold or without a baseline.
+        """
+        stored = self.results.get(result.name)
+        if not stored:
+            return []
+        regressions = []
+        for metric in ("p50", "p95"):
+            limit = stored[metric] * (1 + threshold) + floor_ms
+            value = getattr(result, metric)
+            if value > limit:
+                regressions.append(f"{result.name} {metric} {value:.1f}ms > {limit:.1f}ms "
+                                   f"(baseline {stored[metric]:.1f}ms + {threshold:.0%} + {floor_ms}ms)")
+        return regressions
+
+    def save(self, results):
+        """
+        Replace the stored baseline with the given results.
+        """
+        self.results = {result.name: result._asdict() for result in results}
+        write_results(self.path, self.browser, results)
+
+
+def write_results(path, browser, results):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump({"browser": browser, "platform": platform.platform(), "python": platform.python_version(),
+                   "results": {result.name: result._asdict() for result in results}}, fh, indent=2, sort_keys=True)
@@ -0,0 +1,86 @@
+"""
+Per-interaction logging overhead: legacy custom_logger vs the queue based logging subsystem.
+
+Usage (from the framework root):
+    python -m benchmarks.logging_benchmark
+"""
+import inspect
+import logging
+import os
+import tempfile
+import timeit
+
+from utils import logger_utility
+
+ITERATIONS = 20000
+LOGGER_ITERATIONS = 200
+LOCATOR = "//span[text()='Mumbai, Maharashtra']//parent::li"
+
+
+def legacy_custom_logger(log_dir, log_level=logging.INFO):
+    """
+    custom_logger as it was before the logging subsystem: stack inspection,
+    directory checks and basicConfig on every call.
+    """
+    if not os.path.exists(log_dir):
+        os.mkdir(log_dir)
+    caller_name = inspect.stack()[1][1] + " - \tLN:" + str(inspect.stack()[1][2])
+    logging.basicConfig(filename=os.path.join(log_dir, "legacy.log"),
+                        format='%(asctime)s - %(levelname)s - %(message)s')
+    logger = logging.getLogger(caller_name)
+    logger.setLevel(log_level)
+    return logger
+
+
+def isolated_logger(name, handler, level):
+    logger = logging.getLogger(name)
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(level)
+    return logger
+
+
+def per_call_us(func, number):
+    return min(timeit.repeat(func, number=number, repeat=3)) / number * 1e6
+
+
+def main():
+    tmp_dir = tempfile.mkdtemp(prefix="log_bench_")
+    rows = []
+
+    rows.append(("logger creation (legacy)",
+                 per_call_us(lambda: legacy_custom_logger(tmp_dir), LOGGER_ITERATIONS)))
+    rows.append(("logger creation (custom_logger)",
+                 per_call_us(lambda: logger_utility.custom_logger(logging.INFO), LOGGER_ITERATIONS)))
+
+    filtered = isolated_logger("bench.filtered", logging.NullHandler(), logging.WARNING)
+    locator, locator_type = LOCATOR, "xpath"
+    rows.append(("filtered INFO, f-string",
+                 per_call_us(lambda: filtered.info(f"Clicked on element with locator: {locator} locator_type: {locator_type}"),
+                             ITERATIONS)))
+    rows.append(("filtered INFO, lazy %-args",
+                 per_call_us(lambda: filtered.info("Clicked on element with locator: %s locator_type: %s", locator, locator_type),
+                             ITERATIONS)))
+
+    file_handler = logging.FileHandler(os.path.join(tmp_dir, "sync.log"))
+    file_handler.setFormatter(logging.Formatter(logger_utility.LOG_FORMAT))
+    sync_logger = isolated_logger("bench.sync", file_handler, logging.INFO)
+    rows.append(("enabled INFO, synchronous FileHandler",
+                 per_call_us(lambda: sync_logger.info("Clicked on element with locator: %s locator_type: %s", locator, locator_type),
+                             ITERATIONS)))
+
+    listener = logger_utility.setup_logging()
+    queue_logger = isolated_logger("bench.queue", logger_utility.DeferredQueueHandler(listener.queue), logging.INFO)
+    rows.append(("enabled INFO, DeferredQueueHandler",
+                 per_call_us(lambda: queue_logger.info("Clicked on element with locator: %s locator_type: %s", locator, locator_type),
+                             ITERATIONS)))
+    file_handler.close()
+
+    width = max(len(name) for name, _ in rows)
+    print(f"{'case'.ljust(width)}  us/call")
+    for name, value in rows:
+        print(f"{name.ljust(width)}  {value:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import logging
+from collections import namedtuple
+
+from selenium.webdriver.common.action_chains import ActionChains
+
+import utils.logger_utility as log_utils
+from common.base import scripts
+
+StepResult = namedtuple("StepResult", "action locator ok error")
+
+TYPE, CLICK, HOVER, WAIT, SETTLE = "type", "click", "hover", "wait", "settle"
+_BARRIERS = (WAIT, SETTLE)
+
+
+class _Step:
+    __slots__ = ("action", "locator_type", "locator", "text", "timeout")
+
+    def __init__(self, action, locator_type=None, locator=None, text=None, timeout=None):
+        self.action = action
+        self.locator_type = locator_type
+        self.locator = locator
+        self.text = text
+        self.timeout = timeout
+
+
+class ActionBatch:
+    """
+    Queue of interactions executed with as few WebDriver round trips as possible:
+
+        results = self.batch().type(input_locator, "Mumbai", "name").settle(300) \\
+                      .click(city_locator, "xpath").perform()
+
+    Steps are split into segments at every wait_for/settle. Each segment costs one
+    RESOLVE_ELEMENTS script per poll (its elements, plus the settle state when it follows a
+    settle) and one W3C Actions request for all of its clicks, hovers and keystrokes.
+    Interactions always go through W3C Actions: they are trusted input events, which
+    autosuggest fields and framework event handlers rely on, a synthetic JavaScript
+    click or value change would not be equivalent.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, base):
+        """
+        :param base: SeleniumBase the batch runs on (driver, wait engine, find_timeout).
+        """
+        self.base = base
+        self.driver = base.driver
+        self._steps = []
+
+    def type(self, locator, text, locator_type="id"):
+        """
+        Click the element to focus it, then type text at the caret (the end of an empty field).
+        """
+        self._steps.append(_Step(TYPE, locator_type, locator, text))
+        return self
+
+    def click(self, locator, locator_type="id"):
+        self._steps.append(_Step(CLICK, locator_type, locator))
+        return self
+
+    def hover(self, locator, locator_type="id"):
+        self._steps.append(_Step(HOVER, locator_type, locator))
+        return self
+
+    def wait_for(self, locator, locator_type="id", timeout=None):
+        """
+        Wait until the element is displayed before the next steps run.
+        :param timeout: Seconds, defaults to the wait engine timeout.
+        """
+        self._steps.append(_Step(WAIT, locator_type, locator, timeout=timeout))
+        return self
+
+    def settle(self, quiet_ms=500, timeout=None):
+        """
+        Wait until the page is quiet (see SeleniumBase.wait_for_page_settle) before the next steps run.
+        Best effort like the page objects' settle calls: on timeout the next steps still run.
+        """
+        self._steps.append(_Step(SETTLE, text=quiet_ms, timeout=timeout))
+        return self
+
+    def _segments(self):
+        """
+        Split the steps in segments: the barriers (wait_for/settle) a segment starts with and its interactions.
+        """
+        segments = []
+        barriers, actions = [], []
+        for step in self._steps:
+            if step.action in _BARRIERS and actions:
+                segments.append((barriers, actions))
+                barriers, actions = [], []
+            (barriers if step.action in _BARRIERS else actions).append(step)
+        if barriers or actions:
+            segments.append((barriers, actions))
+        return segments
+
+    def perform(self, poll_frequency=0.1):
+        """
+        Run the queued steps. A failed step fails the rest of its segment and skips the following ones.
+        :return: List of StepResult(action, locator, ok, error), one per queued step.
+        """
+        results = []
+        failed = False
+        for barriers, actions in self._segments():
+            segment = barriers + actions
+            if failed:
+                results.extend(StepResult(step.action, step.locator, False, "skipped") for step in segment)
+                continue
+            error = self._run_segment(barriers, actions, poll_frequency)
+            if error:
+                failed = True
+                self.log.error(f"Batch segment {[(s.action, s.locator) for s in segment]} failed: {error}")
+            results.extend(StepResult(step.action, step.locator, not error, error) for step in segment)
+        self._steps = []
+        return results
+
+    def _run_segment(self, barriers, actions, poll_frequency):
+        """
+        :return: Error message, None when every step of the segment succeeded.
+        """
+        located = [step for step in barriers + actions if step.locator is not None]
+        settle = next((step for step in barriers if step.action == SETTLE), None)
+        timeouts = [self.base.wait.timeout if step.timeout is None else step.timeout for step in barriers]
+        timeout = max(timeouts) if timeouts else self.base.find_timeout
+        clock = self.base.wait.clock
+        try:
+            for step in located:
+                self.base.get_by_type(step.locator_type)
+            specs = [[step.locator_type.lower(), step.locator, True] for step in located]
+            deadline = clock.perf_counter() + timeout
+            while True:
+                state = self.driver.execute_script(scripts.RESOLVE_ELEMENTS, specs, settle is not None)
+                elements = state["elements"]
+                settled = settle is None or self._is_settled(state["settle"], settle.text)
+                if (all(elements) and settled) or clock.perf_counter() >= deadline:
+                    break
+                clock.sleep(poll_frequency)
+        except Exception as e:
+            return f"locating failed: {e}"
+        missing = [step.locator for step, element in zip(located, elements) if not element]
+        if missing:
+            return f"not displayed within {timeout}s: {missing}"
+        if not settled:
+            self.log.warning(f"Page did not settle within {timeout}s, performing "
+                             f"{[(step.action, step.locator) for step in actions]} anyway")
+        if not actions:
+            return None
+        # Every action has a locator and comes after the segment's wait_for steps
+        chain = ActionChains(self.driver, duration=0)
+        for step, element in zip(actions, elements[len(located) - len(actions):]):
+            chain.move_to_element(element)
+            if step.action in (CLICK, TYPE):
+                chain.click()
+            if step.action == TYPE:
+                chain.send_keys(step.text)
+        try:
+            chain.perform()
+        except Exception as e:
+            return f"actions failed: {e}"
+        self.log.info(f"Batch performed {[(step.action, step.locator) for step in actions]}")
+        return None
+
+    @staticmethod
+    def _is_settled(state, quiet_ms):
+        state = state or {}
+        return not state.get("inflight") and not state.get("loading") and \
+            state.get("quiet_ms", float("inf")) >= quiet_ms
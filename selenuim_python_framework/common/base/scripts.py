@@ -0,0 +1,145 @@
+# JavaScript snippets executed through driver.execute_script by SeleniumBase.
+
+# resolve(locator_type, locator): elements matching a SeleniumBase locator, shared by the scripts below
+_RESOLVE = """
+function resolve(type, value) {
+  switch (type) {
+    case 'id': return document.querySelectorAll('#' + CSS.escape(value));
+    case 'name': return document.querySelectorAll('[name="' + CSS.escape(value) + '"]');
+    case 'css': return document.querySelectorAll(value);
+    case 'class': return document.getElementsByClassName(value);
+    case 'link': return Array.from(document.links).filter(a => a.innerText.trim() === value);
+    case 'xpath': {
+      const res = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+      const out = [];
+      for (let i = 0; i < res.snapshotLength; i++) out.push(res.snapshotItem(i));
+      return out;
+    }
+  }
+  throw new Error('Unsupported locator_type: ' + type);
+}
+"""
+
+# Resolves a list of [locator_type, locator] pairs (SeleniumBase locator types)
+# and returns, for each pair, the list of matching elements described as
+# {text, attributes, visible, rect}. arguments: [specs, attribute_names]
+BULK_SNAPSHOT = """
+const specs = arguments[0], attrNames = arguments[1];
+""" + _RESOLVE + """
+function describe(el) {
+  const r = el.getBoundingClientRect();
+  const style = window.getComputedStyle(el);
+  const attributes = {};
+  for (const name of attrNames) attributes[name] = el.getAttribute(name);
+  return {
+    text: (el.innerText || el.textContent || '').trim(),
+    attributes: attributes,
+    visible: style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0,
+    rect: {x: r.x, y: r.y, width: r.width, height: r.height}
+  };
+}
+return specs.map(spec => Array.from(resolve(spec[0], spec[1])).map(describe));
+"""
+
+# Installs (once per document) a MutationObserver and a fetch/XHR in-flight counter,
+# then returns {quiet_ms, inflight, loading}: the time since the last DOM mutation or
+# network activity, the number of requests in flight and whether the document is still parsing.
+PAGE_SETTLE_STATE = """
+const w = window;
+if (!w.__pageSettle) {
+  const s = w.__pageSettle = {last: performance.now(), inflight: 0};
+  const touch = () => { s.last = performance.now(); };
+  new MutationObserver(touch).observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+  if (w.fetch) {
+    const fetch_ = w.fetch;
+    w.fetch = function () {
+      s.inflight++; touch();
+      return fetch_.apply(this, arguments).finally(() => { s.inflight--; touch(); });
+    };
+  }
+  const send = XMLHttpRequest.prototype.send;
+  XMLHttpRequest.prototype.send = function () {
+    s.inflight++; touch();
+    this.addEventListener('loadend', () => { s.inflight--; touch(); }, {once: true});
+    return send.apply(this, arguments);
+  };
+}
+const s = w.__pageSettle;
+return {quiet_ms: performance.now() - s.last, inflight: s.inflight, loading: document.readyState === 'loading'};
+"""
+
+# Captures the restorable page state: URL, web storage and the values of form fields.
+# Fields are addressed by a CSS path (id, else name, else nth-of-type chain).
+CAPTURE_STATE = """
+function dump(storage) {
+  const out = {};
+  for (let i = 0; i < storage.length; i++) { const k = storage.key(i); out[k] = storage.getItem(k); }
+  return out;
+}
+function cssPath(el) {
+  if (el.id) return '#' + CSS.escape(el.id);
+  if (el.name && document.querySelectorAll(el.tagName + '[name="' + CSS.escape(el.name) + '"]').length === 1)
+    return el.tagName.toLowerCase() + '[name="' + CSS.escape(el.name) + '"]';
+  const parts = [];
+  for (let node = el; node && node.nodeType === 1 && node !== document.documentElement; node = node.parentElement) {
+    let index = 1;
+    for (let sib = node.previousElementSibling; sib; sib = sib.previousElementSibling)
+      if (sib.tagName === node.tagName) index++;
+    parts.unshift(node.tagName.toLowerCase() + ':nth-of-type(' + index + ')');
+  }
+  return parts.join(' > ');
+}
+const fields = [];
+document.querySelectorAll('input, textarea, select').forEach(el => {
+  const type = (el.type || '').toLowerCase();
+  if (['password', 'file', 'hidden', 'submit', 'button'].includes(type)) return;
+  fields.push({selector: cssPath(el), value: el.value, checked: !!el.checked});
+});
+return {url: location.href, local_storage: dump(localStorage), session_storage: dump(sessionStorage), fields: fields};
+"""
+
+# Restores web storage (arguments[0], arguments[1]) and form fields (arguments[2]) captured
+# by CAPTURE_STATE. Values go through the native setter and fire input/change events so
+# framework bound inputs (React, Vue) pick them up. Returns the number of fields restored.
+RESTORE_STATE = """
+const [local, session, fields] = arguments;
+if (local) { localStorage.clear(); for (const k in local) localStorage.setItem(k, local[k]); }
+if (session) { sessionStorage.clear(); for (const k in session) sessionStorage.setItem(k, session[k]); }
+let restored = 0;
+for (const field of (fields || [])) {
+  const el = document.querySelector(field.selector);
+  if (!el) continue;
+  if (el.type === 'checkbox' || el.type === 'radio') {
+    el.checked = field.checked;
+  } else {
+    const proto = Object.getPrototypeOf(el);
+    const setter = Object.getOwnPropertyDescriptor(proto, 'value');
+    if (setter && setter.set) setter.set.call(el, field.value); else el.value = field.value;
+  }
+  el.dispatchEvent(new Event('input', {bubbles: true}));
+  el.dispatchEvent(new Event('change', {bubbles: true}));
+  restored++;
+}
+return restored;
+"""
+
+# Resolves, for each [locator_type, locator, visible] spec, the first matching element (null when
+# none, or when visible is true and the element is not displayed) and, when arguments[1] is true,
+# the PAGE_SETTLE_STATE of the page, so an ActionBatch waits for its elements and for the page to
+# settle with one round trip per poll. arguments: [specs, with_settle]
+RESOLVE_ELEMENTS = """
+const specs = arguments[0], withSettle = arguments[1];
+""" + _RESOLVE + """
+function displayed(el) {
+  const style = window.getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.display !== 'none' && el.getClientRects().length > 0;
+}
+const settleState = function () {""" + PAGE_SETTLE_STATE + """};
+return {
+  elements: specs.map(spec => {
+    const el = resolve(spec[0], spec[1])[0] || null;
+    return el && spec[2] && !displayed(el) ? null : el;
+  }),
+  settle: withSettle ? settleState() : null
+};
+"""
@@ -1,20 +1,33 @@
 import logging
+import time
 
-from selenium.common.exceptions import (
-    NoSuchElementException,
-    ElementNotVisibleException,
-    ElementNotSelectableException
-)
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as ec
-from selenium.webdriver.support.ui import WebDriverWait
+
+from common.base import scripts
+from common.base.action_batch import ActionBatch
+from common.base.wait_engine import (
+    WaitEngine, PRESENT, ALL_PRESENT, CLICKABLE, ABSENT, TEXT_MATCHES
+)
+from utils.locator_profiler import locator_profile
 
 
 class SeleniumBase:
-    def __init__(self, driver, timeout=20):
+    # Name of the locator (in self.loc) that must be interactable before the page can be used.
+    # Page objects set it, or override wait_until_ready for a custom readiness predicate.
+    ready_locator = None
+
+    def __init__(self, driver, timeout=20, find_timeout=3):
+        """
+        :param driver: WebDriver instance
+        :param timeout: Default timeout of the explicit waits (wait_for_*).
+        :param find_timeout: Timeout of element lookups done by the interaction methods.
+        """
         self.driver = driver
-        self.wait = WebDriverWait(self.driver, timeout)
+        self.wait = WaitEngine(self.driver, timeout=timeout)
+        self.find_timeout = find_timeout
+        self.last_settle_time = None
         self.log = logging.getLogger(__name__)
 
     @property
@@ -40,29 +53,52 @@ class SeleniumBase:
         except KeyError as exc:
             raise ValueError(f"Unsupported locator_type: {locator_type}") from exc
 
-    def get_element(self, locator, locator_type="id"):
+    def batch(self):
+        """
+        Start an ActionBatch: queued typing, clicks, hovers and waits run in a few round trips.
+        :return: ActionBatch, run it with perform().
+        """
+        return ActionBatch(self)
+
+    def get_element(self, locator, locator_type="id", timeout=None):
+        """
+        Wait until an element is present and return it.
+        :param timeout: Seconds to wait, defaults to find_timeout. 0 checks once.
+        """
+        start = time.perf_counter()
         try:
             by_type = self.get_by_type(locator_type)
-            element = self.driver.find_element(by_type, locator)
-            self.log.info(f"Element found with locator: {locator} and locator_type: {locator_type}")
-            return element
+            timeout = self.find_timeout if timeout is None else timeout
+            element = self.wait.until(PRESENT, by_type, locator, timeout=timeout)
+            self.log.info("Element found with locator: %s and locator_type: %s", locator, locator_type)
         except Exception as e:
-            self.log.error(f"Element not found with locator: {locator} and locator_type: {locator_type}. Exception: {e}")
-            return False
+            self.log.error("Element not found with locator: %s and locator_type: %s. Exception: %s", locator, locator_type, e)
+            element = False
+        if locator_profile.enabled:
+            locator_profile.record(self.driver, locator_type, locator, time.perf_counter() - start, bool(element))
+        return element
 
-    def get_element_list(self, locator, locator_type="id"):
+    def get_element_list(self, locator, locator_type="id", timeout=None):
         """
         NEW METHOD
-        Get list of elements
+        Get list of elements, waiting up to timeout (default find_timeout) for at least one.
+        Returns an empty list if none appeared.
         """
+        start = time.perf_counter()
         try:
             by_type = self.get_by_type(locator_type)
-            element = self.driver.find_elements(by_type, locator)
-            self.log.info(f"Element list found with locator: {locator} and locator_type: {locator_type}")
-            return element
+            timeout = self.find_timeout if timeout is None else timeout
+            element = self.wait.until(ALL_PRESENT, by_type, locator, timeout=timeout)
+            self.log.info("Element list found with locator: %s and locator_type: %s", locator, locator_type)
+        except TimeoutException:
+            self.log.info("No elements found with locator: %s and locator_type: %s", locator, locator_type)
+            element = []
         except Exception as e:
-            self.log.error(f"Element list not found with locator: {locator} and locator_type: {locator_type}. Exception: {e}")
+            self.log.error("Element list not found with locator: %s and locator_type: %s. Exception: %s", locator, locator_type, e)
             return False
+        if locator_profile.enabled:
+            locator_profile.record(self.driver, locator_type, locator, time.perf_counter() - start, bool(element))
+        return element
 
     def element_click(self, locator="", locator_type="id", element=None):
         """
@@ -73,10 +109,10 @@ class SeleniumBase:
             if locator:  # This means if locator is not empty
                 element = self.get_element(locator, locator_type)
             element.click()
-            self.log.info(f"Clicked on element with locator: {locator} locator_type: {locator_type}")
+            self.log.info("Clicked on element with locator: %s locator_type: %s", locator, locator_type)
             return True
         except Exception as e:
-            self.log.error(f"Cannot click on the element with locator: {locator} locator_type: {locator_type}. Exception: {e}")
+            self.log.error("Cannot click on the element with locator: %s locator_type: %s. Exception: %s", locator, locator_type, e)
             return False
 
     def send_keys(self, data, locator="", locator_type="id", element=None):
@@ -88,10 +124,10 @@ class SeleniumBase:
             if locator:  # This means if locator is not empty
                 element = self.get_element(locator, locator_type)
             element.send_keys(data)
-            self.log.info(f"Sent data on element with locator: {locator} locator_type: {locator_type}")
+            self.log.info("Sent data on element with locator: %s locator_type: %s", locator, locator_type)
             return True
         except Exception as e:
-            self.log.error(f"Cannot send data on the element with locator: {locator} locator_type: {locator_type}. Exception: {e}")
+            self.log.error("Cannot send data on the element with locator: %s locator_type: %s. Exception: %s", locator, locator_type, e)
             return False
 
     def clear_field(self, locator="", locator_type="id", element=None):
@@ -103,10 +139,10 @@ class SeleniumBase:
             if locator:
                 element = self.get_element(locator, locator_type)
             element.clear()
-            self.log.info(f"Cleared field with locator: {locator} locator_type: {locator_type}")
+            self.log.info("Cleared field with locator: %s locator_type: %s", locator, locator_type)
             return True
         except Exception as e:
-            self.log.error(f"Cannot clear field with locator: {locator} locator_type: {locator_type}. Exception: {e}")
+            self.log.error("Cannot clear field with locator: %s locator_type: %s. Exception: %s", locator, locator_type, e)
             return False
 
     def get_text(self, locator="", locator_type="id", element=None, info=""):
@@ -122,28 +158,62 @@ class SeleniumBase:
             if len(text) == 0:
                 text = element.get_attribute("innerText")
             if len(text) != 0:
-                self.log.info(f"Getting text on element :: {info}")
-                self.log.info(f"The text is :: '{text}'")
+                self.log.info("Getting text on element :: %s", info)
+                self.log.info("The text is :: '%s'", text)
                 text = text.strip()
             return text
         except Exception as e:
-            self.log.error(f"Failed to get text on element {info}. Exception: {e}")
+            self.log.error("Failed to get text on element %s. Exception: %s", info, e)
             return False
 
 
-    def is_element_present(self, locator="", locator_type="id", element=None):
+    def get_elements_snapshot(self, locators, attributes=(), timeout=0, poll_frequency=0.5):
+        """
+        Read one or many locators in a single execute_script round trip.
+        :param locators: Dict of name -> (locator_type, locator), as returned by Locators.page_locators.
+        :param attributes: Attribute names to read from every matched element.
+        :param timeout: Seconds to keep polling until every locator matches at least one element.
+        :return: Dict of name -> list of {'text', 'attributes', 'visible', 'rect'} dicts,
+                 or False if the script failed.
+        """
+        names = list(locators)
+        specs = [[locators[name][0].lower(), locators[name][1]] for name in names]
+        clock = self.wait.clock
+        deadline = clock.perf_counter() + timeout
+        try:
+            while True:
+                results = self.driver.execute_script(scripts.BULK_SNAPSHOT, specs, list(attributes))
+                if all(results) or clock.perf_counter() >= deadline:
+                    break
+                clock.sleep(poll_frequency)
+            self.log.info("Snapshot of %s locators: %s elements", len(names), [len(r) for r in results])
+            return dict(zip(names, results))
+        except Exception as e:
+            self.log.error("Failed to snapshot locators %s. Exception: %s", locators, e)
+            return False
+
+    def get_texts(self, locator, locator_type="id", timeout=0):
+        """
+        Return the text of every element matching the locator in one round trip.
+        """
+        snapshot = self.get_elements_snapshot({locator: (locator_type, locator)}, timeout=timeout)
+        return [el["text"] for el in snapshot[locator]] if snapshot else []
+
+    def is_element_present(self, locator="", locator_type="id", element=None, timeout=0):
         """
         Check if an element is present -> MODIFIED
         Either provide the element or a combination of locator and locator_type
+        Checks once by default so absence checks return immediately, pass a timeout to wait
+        for an element that is expected to appear.
         """
         try:
             if locator:  # This means if locator is not empty
-                element = self.get_element(locator, locator_type)
-            if element is not None:
-                self.log.info(f"Element present with locator: {locator} locator_type: {locator_type}")
+                element = self.get_element(locator, locator_type, timeout=timeout)
+            if element:
+                self.log.info("Element present with locator: %s locator_type: %s", locator, locator_type)
                 return True
             else:
-                self.log.error(f"Element not present with locator: {locator} locator_type: {locator_type}")
+                self.log.error("Element not present with locator: %s locator_type: %s", locator, locator_type)
                 return False
         except Exception as e:
             print(f"Element not found. Exception: {e}")
@@ -159,7 +229,7 @@ class SeleniumBase:
         try:
             if locator:  # This means if locator is not empty
                 element = self.get_element(locator, locator_type)
-            if element is not None:
+            if element:
                 is_displayed = element.is_displayed()
                 self.log.info("Element is displayed" )
             else:
@@ -169,33 +239,97 @@ class SeleniumBase:
             print(f"Element not found. Exception: {e}")
             return False
 
-    def element_presence_check(self, locator, by_type):
+    def element_presence_check(self, locator, by_type, timeout=0):
         """
         Check if the element is present
+        Checks once by default, pass a timeout to wait for the element to appear.
         """
         try:
-            element_list = self.driver.find_elements(by_type, locator)
-            if len(element_list) > 0:
-                self.log.info(f"Element present with locator: {locator} locator_type: {str(by_type)}")
+            if self.wait.check(PRESENT, by_type, locator, timeout=timeout):
+                self.log.info("Element present with locator: %s locator_type: %s", locator, str(by_type))
                 return True
             else:
-                self.log.error(f"Element not present with locator: {locator} locator_type: {str(by_type)}")
+                self.log.error("Element not present with locator: %s locator_type: %s", locator, str(by_type))
                 return False
         except Exception as e:
-            self.log.info(f"Element not found. Exception: {e}")
+            self.log.info("Element not found. Exception: %s", e)
             return False
 
-    def wait_for_element(self, locator, locator_type="id", timeout=60, poll_frequency=0.5):
+    def wait_for_element(self, locator, locator_type="id", timeout=60, poll_frequency=0.5, backoff=1.0):
+        """
+        Wait for an element to be clickable.
+        :param backoff: Poll delay multiplier, > 1.0 polls with exponential backoff.
+        """
         try:
             by_type = self.get_by_type(locator_type)
-            self.log.info(f"Waiting for maximum :: {timeout} :: seconds for element to be clickable")
-            wait = WebDriverWait(self.driver, timeout=timeout, poll_frequency=poll_frequency,
-                                 ignored_exceptions=[NoSuchElementException, ElementNotVisibleException, ElementNotSelectableException])
-            element = wait.until(ec.element_to_be_clickable((by_type, locator)))
+            self.log.info("Waiting for maximum :: %s :: seconds for element to be clickable", timeout)
+            element = self.wait.until(CLICKABLE, by_type, locator, timeout=timeout,
+                                      poll_frequency=poll_frequency, backoff=backoff)
             self.log.info("Element appeared on the web page")
             return element
         except Exception as e:
-            self.log.error(f"Element not appeared on the web page. Exception: {e}")
+            self.log.error("Element not appeared on the web page. Exception: %s", e)
+            return False
+
+    def wait_for_element_absent(self, locator, locator_type="id", timeout=0, poll_frequency=0.5):
+        """
+        Wait until no element matches the locator. Returns immediately when it is already absent.
+        :return: True if the element is absent, False otherwise.
+        """
+        try:
+            by_type = self.get_by_type(locator_type)
+            self.wait.until(ABSENT, by_type, locator, timeout=timeout, poll_frequency=poll_frequency)
+            self.log.info("Element absent with locator: %s locator_type: %s", locator, locator_type)
+            return True
+        except Exception as e:
+            self.log.error("Element still present with locator: %s locator_type: %s. Exception: %s", locator, locator_type, e)
+            return False
+
+    def wait_for_text(self, text, locator, locator_type="id", timeout=None, poll_frequency=0.5):
+        """
+        Wait for an element whose text contains text (str) or matches it (compiled regex).
+        :return: The matching element or False.
+        """
+        try:
+            by_type = self.get_by_type(locator_type)
+            element = self.wait.until(TEXT_MATCHES, by_type, locator, timeout=timeout,
+                                      poll_frequency=poll_frequency, text=text)
+            self.log.info("Text '%s' found with locator: %s locator_type: %s", text, locator, locator_type)
+            return element
+        except Exception as e:
+            self.log.error("Text '%s' not found with locator: %s locator_type: %s. Exception: %s", text, locator, locator_type, e)
+            return False
+
+    def wait_until_ready(self, timeout=None):
+        """
+        Wait for the page readiness predicate instead of the full page load event.
+        With the eager/none page load strategies driver.get returns early and this is
+        what makes the page usable.
+        :param timeout: Seconds to wait, defaults to the engine timeout.
+        :return: True when the page is ready (or declares no predicate), False otherwise.
+        """
+        if self.ready_locator is None:
+            return True
+        locator_type, locator = self.loc.page_locators(self.ready_locator)
+        timeout = self.wait.timeout if timeout is None else timeout
+        return bool(self.wait_for_element(locator, locator_type, timeout=timeout, poll_frequency=0.1))
+
+    def wait_for_page_settle(self, quiet_ms=500, timeout=None, poll_frequency=0.1):
+        """
+        Wait until the DOM has not changed and no fetch/XHR has been in flight for quiet_ms.
+        Use it instead of fixed sleeps after actions that re-render the page.
+        :param quiet_ms: Quiet window in milliseconds.
+        :param timeout: Upper bound in seconds, defaults to the engine timeout.
+        :return: Settle time in seconds (see WaitEngine.settle, 0.0 when the page was already quiet),
+                 False if the page did not settle. Compare with `is not False`.
+        """
+        try:
+            settle_time = self.wait.settle(quiet=quiet_ms / 1000, timeout=timeout, poll_frequency=poll_frequency)
+            self.last_settle_time = settle_time
+            self.log.info("Page settled after %.3fs", settle_time)
+            return settle_time
+        except Exception as e:
+            self.log.error("Page did not settle. Exception: %s", e)
             return False
 
     def web_scroll(self, direction="up"):
@@ -225,7 +359,7 @@ class SeleniumBase:
                 self.log.info("### VERIFICATION DOES NOT CONTAINS !!!")
                 return False
         except Exception as e:
-            self.log.error(f"Failed to get page title. Exception: {e}")
+            self.log.error("Failed to get page title. Exception: %s", e)
             return False
 
     def element_move_to(self, locator="", locator_type="id", element=None):
@@ -238,10 +372,10 @@ class SeleniumBase:
                 element = self.get_element(locator, locator_type)
             action = ActionChains(self.driver)
             action.move_to_element(element).perform()
-            self.log.info(f"Moved on element with locator: {locator} locator_type: {locator_type}")
+            self.log.info("Moved on element with locator: %s locator_type: %s", locator, locator_type)
             return True
         except Exception as e:
-            self.log.error(f"Cannot move on the element with locator: {locator} locator_type: {locator_type}. Exception: {e}")
+            self.log.error("Cannot move on the element with locator: %s locator_type: %s. Exception: %s", locator, locator_type, e)
             return False
 
     def element_move_to_click(self, locator="", locator_type="id", element=None):
@@ -254,8 +388,8 @@ class SeleniumBase:
                 element = self.get_element(locator, locator_type)
             action = ActionChains(self.driver)
             action.move_to_element(element).click().perform()
-            self.log.info(f"Moved on element and click with locator: {locator} locator_type: {locator_type}")
+            self.log.info("Moved on element and click with locator: %s locator_type: %s", locator, locator_type)
             return True
         except Exception as e:
-            self.log.error(f"Cannot move and click on the element with locator: {locator} locator_type: {locator_type}. Exception: {e}")
+            self.log.error("Cannot move and click on the element with locator: %s locator_type: %s. Exception: %s", locator, locator_type, e)
             return False
\ No newline at end of file
@@ -0,0 +1,204 @@
+import logging
+import threading
+import time
+from collections import namedtuple
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+
+from common.base import scripts
+from utils.command_tracer import command_trace
+
+# Conditions supported by WaitEngine.until
+PRESENT = "present"
+ALL_PRESENT = "all_present"
+VISIBLE = "visible"
+CLICKABLE = "clickable"
+ABSENT = "absent"
+TEXT_MATCHES = "text_matches"
+# Recorded by WaitEngine.settle, not a locator condition
+SETTLE = "settle"
+
+WaitMetric = namedtuple("WaitMetric", "condition locator by timeout elapsed polls success")
+
+
+def _present(elements, text):
+    return elements[0] if elements else None
+
+
+def _all_present(elements, text):
+    return elements or None
+
+
+def _visible(elements, text):
+    return next((el for el in elements if el.is_displayed()), None)
+
+
+def _clickable(elements, text):
+    return next((el for el in elements if el.is_displayed() and el.is_enabled()), None)
+
+
+def _absent(elements, text):
+    return True if not elements else None
+
+
+def _text_matches(elements, text):
+    """
+    text may be a plain string (substring match) or a compiled regular expression.
+    """
+    for el in elements:
+        value = el.text
+        matched = text.search(value) if hasattr(text, "search") else text in value
+        if matched:
+            return el
+    return None
+
+
+_CONDITIONS = {
+    PRESENT: _present,
+    ALL_PRESENT: _all_present,
+    VISIBLE: _visible,
+    CLICKABLE: _clickable,
+    ABSENT: _absent,
+    TEXT_MATCHES: _text_matches,
+}
+
+
+class WaitMetricsRecorder:
+    """
+    Thread safe sink of wait metrics, drained by the pytest hooks for reporting.
+    """
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def record(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+
+    def drain(self):
+        """
+        Return and clear every metric recorded since the previous drain.
+        """
+        with self._lock:
+            metrics, self._metrics = self._metrics, []
+        return metrics
+
+
+wait_metrics = WaitMetricsRecorder()
+
+
+class WaitEngine:
+    """
+    Explicit wait engine used by every SeleniumBase lookup. Drivers run with an
+    implicit wait of 0, so a timeout of 0 is a single immediate check.
+
+    Time is read from a clock with perf_counter() and sleep(), the time module unless the
+    driver brings its own `clock` (utils.fake_driver sleeps in virtual time).
+    """
+
+    def __init__(self, driver, timeout=10, poll_frequency=0.5, backoff=1.0, max_poll_interval=2.0):
+        """
+        :param driver: WebDriver instance
+        :param timeout: Default timeout in seconds.
+        :param poll_frequency: Default delay between two checks in seconds.
+        :param backoff: Multiplier applied to the delay after every check, 1.0 polls at a fixed rate.
+        :param max_poll_interval: Upper bound of the delay when backing off.
+        """
+        self.driver = driver
+        self.clock = getattr(driver, "clock", time)
+        self.timeout = timeout
+        self.poll_frequency = poll_frequency
+        self.backoff = backoff
+        self.max_poll_interval = max_poll_interval
+        self.log = logging.getLogger(__name__)
+
+    def until(self, condition, by, locator, timeout=None, poll_frequency=None, backoff=None, text=None):
+        """
+        Wait until the condition holds for the locator.
+        :param condition: One of PRESENT, ALL_PRESENT, VISIBLE, CLICKABLE, ABSENT, TEXT_MATCHES.
+        :param by: Selenium By type.
+        :param locator: Locator value.
+        :param timeout: Timeout in seconds, defaults to the engine timeout.
+        :param poll_frequency: Delay between checks, defaults to the engine poll frequency.
+        :param backoff: Delay multiplier, defaults to the engine backoff.
+        :param text: String or compiled pattern for TEXT_MATCHES.
+        :return: The matching element (list of elements for ALL_PRESENT, True for ABSENT).
+        :raises TimeoutException: if the condition does not hold within the timeout.
+        """
+        check = _CONDITIONS[condition]
+        timeout = self.timeout if timeout is None else timeout
+        delay = self.poll_frequency if poll_frequency is None else poll_frequency
+        backoff = self.backoff if backoff is None else backoff
+        start = self.clock.perf_counter()
+        deadline = start + timeout
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                result = check(self.driver.find_elements(by, locator), text)
+            except StaleElementReferenceException:
+                result = None
+            if result is not None:
+                self._record(condition, by, locator, timeout, start, polls, True)
+                return result
+            remaining = deadline - self.clock.perf_counter()
+            if remaining <= 0:
+                break
+            self.clock.sleep(min(delay, remaining))
+            delay = min(delay * backoff, self.max_poll_interval) if backoff != 1.0 else delay
+        self._record(condition, by, locator, timeout, start, polls, False)
+        raise TimeoutException(f"Condition '{condition}' not met for {by}={locator} within {timeout}s")
+
+    def settle(self, quiet=0.5, timeout=None, poll_frequency=0.1):
+        """
+        Wait until the page is quiet: no DOM mutation and no fetch/XHR in flight for `quiet`
+        seconds. The monitor is injected on the first check of every document, activity
+        started before that (e.g. during driver.get) is only seen through its DOM mutations.
+        :param quiet: Quiet window in seconds.
+        :param timeout: Upper bound in seconds, defaults to the engine timeout.
+        :param poll_frequency: Minimum delay between two checks.
+        :return: Settle time in seconds: from the call until the last DOM mutation or request,
+                 0.0 when the page was already quiet.
+        :raises TimeoutException: if the page did not settle within the timeout.
+        """
+        timeout = self.timeout if timeout is None else timeout
+        start = self.clock.perf_counter()
+        deadline = start + timeout
+        polls = 0
+        state = None
+        while True:
+            polls += 1
+            state = self.driver.execute_script(scripts.PAGE_SETTLE_STATE) or {}
+            quiet_for = state.get("quiet_ms", float("inf")) / 1000
+            if not state.get("inflight") and not state.get("loading") and quiet_for >= quiet:
+                self._record(SETTLE, None, None, timeout, start, polls, True)
+                # Last activity happened quiet_for seconds ago, that is when the page settled
+                return round(max(0.0, self.clock.perf_counter() - quiet_for - start), 3)
+            remaining = deadline - self.clock.perf_counter()
+            if remaining <= 0:
+                break
+            # Sleep until the quiet window could be complete, but poll at least every poll_frequency
+            self.clock.sleep(min(max(poll_frequency, quiet - quiet_for), remaining))
+        self._record(SETTLE, None, None, timeout, start, polls, False)
+        raise TimeoutException(f"Page did not settle within {timeout}s, last state: {state}")
+
+    def check(self, condition, by, locator, text=None, timeout=0):
+        """
+        Evaluate a condition, once unless a timeout is given.
+        :return: True if the condition holds, False otherwise.
+        """
+        try:
+            self.until(condition, by, locator, timeout=timeout, text=text)
+            return True
+        except (TimeoutException, WebDriverException):
+            return False
+
+    def _record(self, condition, by, locator, timeout, start, polls, success):
+        elapsed = self.clock.perf_counter() - start
+        metric = WaitMetric(condition, locator, by, timeout, elapsed, polls, success)
+        wait_metrics.record(metric)
+        command_trace.add_span(f"wait:{condition}", "wait", start, elapsed, locator)
+        if self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug("Wait %s for %s=%s took %.3fs over %d polls (success=%s)",
+                           condition, by, locator, elapsed, polls, success)
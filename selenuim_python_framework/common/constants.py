@@ -7,4 +7,22 @@ TEMP_SCREENSHOT_DIR = "temp/screenshots/"
 REPORT_FILENAME = "temp/report.html"
 REPORT_CONFIG = "reports/"
 TEMP_DIR = 'temp'
+LOCATOR_REPO_DIR = "locators_repo"
+FIXTURE_SITES_DIR = "fixture_sites"
+WORKER_DIR = "temp/workers/"
+WORKER_ID_ENV = "PYTEST_WORKER_ID"
+PARALLEL_REPORT_FILENAME = "temp/parallel_report.html"
+PARALLEL_JUNIT_FILENAME = "temp/parallel_report.xml"
+DAEMON_DIR = "temp/daemon/"
+DAEMON_HOST = "127.0.0.1"
+DAEMON_PORT = 9400
+HAR_DIR = "har"
+HAR_CERT_DIR = "temp/har/"
+TRACE_DIR = "temp/traces/"
+BENCHMARK_DIR = "temp/benchmarks/"
+CHECKPOINT_DIR = "temp/checkpoints/"
+LOCATOR_PROFILE_DIR = "temp/locator_profile/"
+BROWSER_EVENTS_DIR = "temp/browser_events/"
+# Persistent across runs, outside temp/
+TIMING_DB = "reports/timing_history.db"
 SCREENSHOT_DIRECTORY = os.path.join(PROJECT_ROOT, TEMP_SCREENSHOT_DIR)
\ No newline at end of file
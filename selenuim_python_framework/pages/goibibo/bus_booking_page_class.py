@@ -3,24 +3,31 @@ from utils.locator_utility import Locators
 
 
 class BusBooking(SeleniumBase):
-    def __init__(self, driver):
+    ready_locator = "from_city_input_field"
+
+    def __init__(self, driver, context):
         super().__init__(driver=driver)
-        self.loc = Locators(__class__)
+        self.context = context
+        self.loc = Locators(__class__, context.locator_folder)
 
     def select_from_city(self, src_city: str) -> bool:
         self.log.info(f"Selecting source city: {src_city}")
 
         try:
-            # Locate and enter source city
             input_type, input_locator = self.loc.page_locators("from_city_input_field", src_city=src_city)
-            if not self.send_keys(src_city, input_locator, locator_type=input_type):
-                self.log.error(f"Failed to send source city '{src_city}' to input field.")
-                return False
-
-            # Locate and click the matching city from dropdown
             city_type, city_locator = self.loc.page_locators("src_city", src_city=src_city)
-            if not self.element_click(city_locator, locator_type=city_type):
-                self.log.error(f"Failed to click city dropdown option for '{src_city}'.")
+            # Type the city, let the debounced autosuggest request finish, then pick the city from the
+            # dropdown: one W3C Actions request per side of the settle wait
+            typed, _, picked = self.batch() \
+                .type(input_locator, src_city, locator_type=input_type) \
+                .settle(quiet_ms=300, timeout=self.find_timeout) \
+                .click(city_locator, locator_type=city_type) \
+                .perform()
+            if not typed.ok:
+                self.log.error(f"Failed to send source city '{src_city}' to input field: {typed.error}")
+                return False
+            if not picked.ok:
+                self.log.error(f"Failed to click city dropdown option for '{src_city}': {picked.error}")
                 return False
 
             self.log.info(f"Successfully selected city: {src_city}")
@@ -34,13 +41,17 @@ class BusBooking(SeleniumBase):
         self.log.info(f"Selecting destination city: {dest_city}")
         try:
             input_type, input_locator = self.loc.page_locators("dest_city_input_field", dest_city=dest_city)
-            if not self.send_keys(dest_city, input_locator, locator_type=input_type):
-                self.log.error(f"Failed to type destination city: {dest_city}")
-                return False
-
             city_type, city_locator = self.loc.page_locators("dest_city", dest_city=dest_city)
-            if not self.element_click(city_locator, locator_type=city_type):
-                self.log.error(f"Failed to click dropdown option for destination city: {dest_city}")
+            typed, _, picked = self.batch() \
+                .type(input_locator, dest_city, locator_type=input_type) \
+                .settle(quiet_ms=300, timeout=self.find_timeout) \
+                .click(city_locator, locator_type=city_type) \
+                .perform()
+            if not typed.ok:
+                self.log.error(f"Failed to type destination city: {dest_city}. {typed.error}")
+                return False
+            if not picked.ok:
+                self.log.error(f"Failed to click dropdown option for destination city: {dest_city}. {picked.error}")
                 return False
 
             self.log.info(f"Successfully selected destination city: {dest_city}")
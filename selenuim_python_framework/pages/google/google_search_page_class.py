@@ -5,9 +5,12 @@ from utils.locator_utility import Locators
 
 
 class GoogleSearch(SeleniumBase):
-    def __init__(self, driver):
+    ready_locator = "search_box"
+
+    def __init__(self, driver, context):
         super().__init__(driver=driver)
-        self.loc = Locators(__class__)
+        self.context = context
+        self.loc = Locators(__class__, context.locator_folder)
 
     def get_page_title(self) -> str:
         """
@@ -26,17 +29,24 @@ class GoogleSearch(SeleniumBase):
         try:
             # Locate search bar input field
             input_type, input_locator = self.loc.page_locators("search_box")
+            # The class driver is shared by data-driven records, start from an empty box
+            if not self.clear_field(input_locator, locator_type=input_type):
+                self.log.error("Failed to clear the google search input field.")
+                return False
             if not self.send_keys(search_keyword, input_locator, locator_type=input_type):
                 self.log.error(f"Failed to send google keyword '{search_keyword}' to input field.")
                 return False
+            # Suggestions are fetched while typing, read them once the list stopped changing
+            self.wait_for_page_settle(quiet_ms=300, timeout=self.find_timeout)
 
             # Verify if the search options is populated with the keyword
             search_op_type, search_op_locator = self.loc.page_locators("search_option")
-            search_result_op_l = self.get_element_list(search_op_locator, locator_type=search_op_type)
+            search_result_op_l = self.get_texts(search_op_locator, locator_type=search_op_type,
+                                                timeout=self.find_timeout)
             for search_op in search_result_op_l:
-                self.log.info(f"Search option found: {search_op.text}")
-                if not search_keyword.lower() in search_op.text.lower():
-                    self.log.warning(f"Search option '{search_op.text}' does not match keyword '{search_keyword}'.")
+                self.log.info(f"Search option found: {search_op}")
+                if not search_keyword.lower() in search_op.lower():
+                    self.log.warning(f"Search option '{search_op}' does not match keyword '{search_keyword}'.")
                     self.log.error(f"No search options found for keyword '{search_keyword}'.")
                     return False
             return True
@@ -57,7 +67,8 @@ class GoogleSearch(SeleniumBase):
                 return False
 
             button_type, button_locator = self.loc.page_locators("selenium_download")
-            if not self.is_element_present(button_locator, locator_type=button_type):
+            if not self.is_element_present(button_locator, locator_type=button_type,
+                                           timeout=self.find_timeout):
                 self.log.error("Failed to find Selenium download after google search.")
                 return False
             return True
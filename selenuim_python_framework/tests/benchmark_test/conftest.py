@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from benchmarks.baseline import Baseline, measure, write_results
+from common.constants import *
+from tests.fixture_suite import configs, suite_context
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request, browser):
+    """
+    Results of every benchmark of the session. Written to temp/benchmarks/<browser>.json
+    and, with --update-benchmark-baseline, stored as the new baseline.
+    """
+    results = []
+    yield results
+    if not results:
+        return
+    write_results(os.path.join(PROJECT_ROOT, BENCHMARK_DIR, f"{browser}.json"), browser, results)
+    if request.config.getoption("--update-benchmark-baseline"):
+        Baseline(browser).save(results)
+
+
+@pytest.fixture
+def benchmark(request, browser, benchmark_results):
+    """
+    benchmark(name, func, setup=None) times func over --benchmark-iterations and
+    fails the test when p50 or p95 regressed beyond --benchmark-threshold.
+    """
+    baseline = Baseline(browser)
+    iterations = request.config.getoption("--benchmark-iterations")
+    threshold = request.config.getoption("--benchmark-threshold")
+    update = request.config.getoption("--update-benchmark-baseline")
+
+    def run(name, func, setup=None):
+        result = measure(name, func, iterations, setup=setup)
+        benchmark_results.append(result)
+        request.node.user_properties.append((f"{name}_p50_ms", result.p50))
+        request.node.user_properties.append((f"{name}_p95_ms", result.p95))
+        regressions = [] if update else baseline.compare(result, threshold, floor_ms=5.0)
+        if regressions:
+            pytest.fail("Benchmark regression: " + "; ".join(regressions))
+        return result
+
+    return run
@@ -0,0 +1,49 @@
+import pytest
+from pages.goibibo.bus_booking_page_class import BusBooking
+from pages.google.google_search_page_class import GoogleSearch
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("get_driver")
+class TestPageFlowBenchmark():
+    """
+    Cost of the page-object flows against local copies of the Goibibo and Google pages.
+    Each iteration starts from a freshly loaded page, the load itself is not timed.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, get_driver, suite_context, fixture_server):
+        self.driver = get_driver
+        self.context = suite_context
+        self.server = fixture_server
+
+    def _open(self, page_cls, path):
+        page = page_cls(self.driver, self.context)
+
+        def load():
+            self.driver.get(self.server.url(path))
+            assert page.wait_until_ready(timeout=10), f"{path} is not ready"
+        return page, load
+
+    def test_select_from_city(self, benchmark):
+        bus, load = self._open(BusBooking, "bus/index.html")
+        benchmark("bus_select_from_city", lambda: bus.select_from_city("Mumbai, Maharashtra"), setup=load)
+
+    def test_select_depart_date(self, benchmark):
+        bus, load = self._open(BusBooking, "bus/index.html")
+        benchmark("bus_select_depart_date", lambda: bus.select_depart_date(15), setup=load)
+
+    def test_bus_booking_flow(self, benchmark):
+        bus, load = self._open(BusBooking, "bus/index.html")
+
+        def flow():
+            return (bus.select_from_city("Mumbai, Maharashtra") and bus.select_dest_city("Pune, Maharashtra")
+                    and bus.select_depart_date(15) and bus.click_search_button())
+        benchmark("bus_booking_flow", flow, setup=load)
+
+    def test_google_search_flow(self, benchmark):
+        search, load = self._open(GoogleSearch, "search/index.html")
+
+        def flow():
+            return search.search_keyword("selenium python") and search.verify_selenium_download_search()
+        benchmark("google_search_flow", flow, setup=load)
@@ -0,0 +1,44 @@
+import pytest
+from common.base.selenium_base import SeleniumBase
+
+
+@pytest.mark.benchmark
+@pytest.mark.usefixtures("get_driver")
+class TestSeleniumBaseBenchmark():
+    """
+    Cost of the SeleniumBase primitives on a page already loaded.
+    """
+
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def bus_page(cls, get_driver, fixture_server):
+        get_driver.get(fixture_server.url("bus/index.html"))
+
+    @pytest.fixture(autouse=True)
+    def setup(self, get_driver):
+        self.driver = get_driver
+        self.base = SeleniumBase(self.driver)
+
+    def test_get_element(self, benchmark):
+        benchmark("get_element", lambda: self.base.get_element("autosuggestBusSRPDestHome", "id"))
+
+    def test_element_click(self, benchmark):
+        benchmark("element_click", lambda: self.base.element_click("toggle", "id"))
+
+    def test_send_keys(self, benchmark):
+        benchmark("send_keys", lambda: self.base.send_keys("Goa", "autosuggestBusSRPDestHome", "id"),
+                  setup=lambda: self.base.clear_field("autosuggestBusSRPDestHome", "id"))
+
+    def test_get_text(self, benchmark):
+        benchmark("get_text", lambda: self.base.get_text("search", "id"))
+
+    def test_wait_for_element(self, benchmark):
+        benchmark("wait_for_element", lambda: self.base.wait_for_element("//button[@data-testid='searchBusBtn']",
+                                                                          "xpath", timeout=5))
+
+    def test_element_move_to_click(self, benchmark):
+        benchmark("element_move_to_click", lambda: self.base.element_move_to_click("toggle", "id"))
+
+    def test_get_texts_long_list(self, benchmark):
+        self.base.element_click("search", "id")
+        benchmark("get_texts_500_rows", lambda: len(self.base.get_texts("div.bus-row h4", "css")) == 500)
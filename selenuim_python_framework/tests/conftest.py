@@ -1,12 +1,39 @@
 import os
-import shutil
-from datetime import datetime
+import time
+from collections import Counter
 
 import pytest
 
 from common.constants import *
+from common.base.wait_engine import SETTLE, wait_metrics
+from utils.browser_events import BrowserEventCapture, EventArtifacts, summarize as summarize_events
+from utils.checkpoint import CheckpointError, CheckpointStore, checkpoint_scope
+from utils.command_tracer import command_trace, summarize, summary_html
 from utils.helper import ConfigUtility
-from utils.driver_utility import WebDriver
+from utils.test_data_store import DataStore
+from utils.driver_pool import DriverPool
+from utils.fixture_server import FixtureServer
+from utils.grid_executor import GridExecutor
+from utils.har_proxy import HarProxy, MatchRules
+import utils.logger_utility as log_utils
+from utils.locator_profiler import format_report, locator_profile
+from utils.locator_utility import validate_locator_repo
+from utils.report_archiver import ReportArchiver
+from utils.resource_monitor import ResourceLimits
+from utils.screenshot_utility import ScreenshotPipeline
+from utils.timing_history import TimingHistory
+
+# pytester runs the framework_test log_cases in a session of their own
+pytest_plugins = ["pytester"]
+
+screenshot_pipeline_key = pytest.StashKey[ScreenshotPipeline]()
+trace_events_key = pytest.StashKey[list]()
+timing_history_key = pytest.StashKey[TimingHistory]()
+checkpoint_store_key = pytest.StashKey[CheckpointStore]()
+locator_report_key = pytest.StashKey[tuple]()
+event_artifacts_key = pytest.StashKey[EventArtifacts]()
+browser_events_key = pytest.StashKey[tuple]()
+report_archiver_key = pytest.StashKey[ReportArchiver]()
 
 
 # @pytest.fixture(scope="session")
@@ -36,6 +63,102 @@ def pytest_addoption(parser):
     parser.addoption(
         "--browser", action="store", default="chrome", help="Browser to use for tests"
     )
+    parser.addoption(
+        "--pool-size", action="store", type=int, default=2,
+        help="Maximum number of warm drivers kept between test classes, 0 disables reuse"
+    )
+    parser.addoption(
+        "--max-driver-reuses", action="store", type=int, default=50,
+        help="Number of test classes a pooled driver may serve before it is relaunched"
+    )
+    parser.addoption(
+        "--max-browser-memory-mb", action="store", type=float, default=2048,
+        help="Recycle a pooled driver once its driver and browser processes use more memory, 0 disables"
+    )
+    parser.addoption(
+        "--max-js-heap-mb", action="store", type=float, default=512,
+        help="Recycle a pooled driver once the used JavaScript heap is larger (Chromium only), 0 disables"
+    )
+    parser.addoption(
+        "--max-browser-cpu", action="store", type=float, default=0,
+        help="Recycle a pooled driver once its processes use more CPU (%% of one core) between "
+             "the last test and the end of the class, 0 disables"
+    )
+    parser.addoption(
+        "--screenshot-format", action="store", default="jpeg", choices=("jpeg", "webp", "png"),
+        help="Encoding of failure screenshots (jpeg/webp need Pillow)"
+    )
+    parser.addoption(
+        "--screenshot-quality", action="store", type=int, default=70, help="Failure screenshot encoder quality"
+    )
+    parser.addoption(
+        "--screenshot-scale", action="store", type=float, default=0.5, help="Failure screenshot downscale factor"
+    )
+    parser.addoption(
+        "--network-mode", action="store", default="live", choices=("live", "record", "replay"),
+        help="live: direct traffic, record: capture every exchange to data/har/<Class>.har, "
+             "replay: serve the recorded exchanges offline"
+    )
+    parser.addoption(
+        "--replay-latency", action="store", default="0",
+        help="Latency injected into every replayed response, in ms, or 'recorded' to replay the recorded timings"
+    )
+    parser.addoption(
+        "--run-benchmarks", action="store_true", default=False,
+        help="Run the tests marked benchmark, they are skipped otherwise"
+    )
+    parser.addoption(
+        "--benchmark-iterations", action="store", type=int, default=30, help="Timed iterations per benchmark"
+    )
+    parser.addoption(
+        "--benchmark-threshold", action="store", type=float, default=0.2,
+        help="Allowed p50/p95 regression against the stored baseline, 0.2 = 20%%"
+    )
+    parser.addoption(
+        "--update-benchmark-baseline", action="store_true", default=False,
+        help="Store the benchmark results of this run as the new baseline"
+    )
+    parser.addoption(
+        "--checkpoint-retries", action="store", type=int, default=0,
+        help="Retry a failed from_checkpoint test up to N times, restarting from its checkpoint"
+    )
+    parser.addoption(
+        "--checkpoints-from-disk", action="store_true", default=False,
+        help="Restore checkpoints saved by an earlier run when they were not captured in this session"
+    )
+    parser.addoption(
+        "--profile-locators", action="store_true", default=False,
+        help="Profile locator resolution time and match counts, report ranked locators with CSS rewrites"
+    )
+    parser.addoption(
+        "--slow-locator-ms", action="store", type=float, default=50.0,
+        help="Median lookup time above which a profiled locator is flagged slow"
+    )
+    parser.addoption(
+        "--log-on-failure", action="store_true", default=False,
+        help="Buffer the log records of each test in memory, write them to the log file and the report "
+             "only when the test fails, passing tests log one summary line"
+    )
+    parser.addoption(
+        "--log-buffer-size", action="store", type=int, default=2000,
+        help="Log records kept per test with --log-on-failure, the oldest are dropped first"
+    )
+    parser.addoption(
+        "--no-command-trace", action="store_true", default=False,
+        help="Disable WebDriver command tracing and the trace-event export"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """
+    Benchmarks are slow, they only run with --run-benchmarks.
+    """
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, use --run-benchmarks")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
 
 
 @pytest.fixture(scope="session")
@@ -46,25 +169,166 @@ def browser(request):
     return request.config.getoption("--browser")
 
 
+def pytest_generate_tests(metafunc):
+    """
+    Parametrize the data_record fixture from @pytest.mark.data_source("<file>.jsonl|.csv").
+    Only record numbers are parametrized, records are read lazily when a test runs.
+    """
+    marker = metafunc.definition.get_closest_marker("data_source")
+    if marker is None or "data_record" not in metafunc.fixturenames:
+        return
+    path = os.path.join(DataStore.data_dir(metafunc.module), marker.args[0])
+    index = DataStore.record_index(path)
+    metafunc.parametrize("data_record", [(path, i) for i in range(len(index))], indirect=True,
+                         ids=[f"{marker.args[0]}:{i}" for i in range(len(index))])
+
+
+@pytest.fixture
+def data_record(request):
+    """
+    The data record a data_source-parametrized test runs with.
+    """
+    path, index = request.param
+    return DataStore.record_index(path).read(index)
+
+
+@pytest.fixture(scope="session")
+def fixture_server():
+    """
+    Serve the local fixture sites for the whole test session.
+    """
+    with FixtureServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def har_proxy(request):
+    """
+    Session wide HAR record/replay proxy, None in live network mode.
+    """
+    mode = request.config.getoption("--network-mode")
+    if mode == "live":
+        yield None
+        return
+    latency = request.config.getoption("--replay-latency")
+    recorded = latency == "recorded"
+    proxy = HarProxy(mode, latency_ms=0.0 if recorded else float(latency), use_recorded_timing=recorded).start()
+    yield proxy
+    proxy.stop()
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request, har_proxy):
+    """
+    Session wide pool of warm drivers, quit at the end of the session.
+    """
+    pool = DriverPool(
+        max_size=request.config.getoption("--pool-size"),
+        max_reuses=request.config.getoption("--max-driver-reuses"),
+        proxy=har_proxy.address if har_proxy else None,
+        limits=ResourceLimits(
+            memory_mb=request.config.getoption("--max-browser-memory-mb"),
+            js_heap_mb=request.config.getoption("--max-js-heap-mb"),
+            cpu_percent=request.config.getoption("--max-browser-cpu"),
+        ),
+    )
+    yield pool
+    pool.close_all()
+
+
 @pytest.fixture(scope="class")
-def get_driver(request, browser, configs):
+def get_driver(request, browser, configs, suite_context, driver_pool, har_proxy):
     """
-    Instantiate WebDriver and assign it to test class.
+    Take a warm WebDriver from the pool, open the base URL and assign it to test class.
+    When the test class names its `landing_page` (a page object class), wait until that
+    page is ready. The driver is reset and returned to the pool after the class.
     """
-    wdf = WebDriver(browser, configs)
-    driver = wdf.get_web_driver_instance()
+    if har_proxy and request.cls:
+        har_path = os.path.join(DataStore.data_dir(request.cls), HAR_DIR, f"{request.cls.__name__}.har")
+        har_proxy.use_archive(har_path, MatchRules.from_config(configs))
+    started = time.perf_counter()
+    driver = driver_pool.acquire(browser, configs)
+    driver.get(configs.get('PROD', 'baseURL'))
+    history = request.config.stash.get(timing_history_key, None)
+    if history:
+        # request.node is the class (or module) node, its node id is the shard key
+        history.record_driver_launch(request.node.nodeid, time.perf_counter() - started)
+    capture = BrowserEventCapture.attach(driver)
+    if capture:
+        # Events of the previous class of a pooled driver
+        capture.drain()
+    elif browser != "fake":
+        BrowserEventCapture.log.warning(f"Browser events of {request.node.name} are not captured, "
+                                        f"the {browser} session has no BiDi connection")
     request.node.driver = driver
-    yield driver
-    driver.quit()
+    try:
+        landing_page = getattr(request.cls, "landing_page", None)
+        if landing_page is not None and not landing_page(driver, suite_context).wait_until_ready():
+            pytest.fail(f"{landing_page.__name__} is not ready after opening {configs.get('PROD', 'baseURL')}")
+        yield driver
+    finally:
+        driver_pool.release(driver)
+        if har_proxy:
+            har_proxy.save()
+            if har_proxy.misses:
+                har_proxy.log.warning(f"{len(har_proxy.misses)} requests of {request.node.name} were not "
+                                      f"recorded: {har_proxy.misses[:5]}")
+
+
+@pytest.fixture(autouse=True)
+def restore_checkpoint(request):
+    """
+    Restore the checkpoint of @pytest.mark.from_checkpoint(name) unless the class driver
+    is already in that state, e.g. because the previous step passed.
+    """
+    marker = request.node.get_closest_marker("from_checkpoint")
+    if marker is None or "get_driver" not in request.fixturenames:
+        return
+    driver = request.getfixturevalue("get_driver")
+    key = (checkpoint_scope(request.node), marker.args[0])
+    if getattr(driver, "checkpoint", None) == key:
+        return
+    store = request.config.stash[checkpoint_store_key]
+    try:
+        store.restore(driver, *key)
+        driver.checkpoint = key
+    except CheckpointError as e:
+        store.log.warning(f"{e}, {request.node.name} starts from the current browser state")
 
 
-def _capture_screenshot(name: str, driver):
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
     """
-    Saves a screenshot of the current browser state.
+    With --checkpoint-retries, rerun the body of a failed from_checkpoint test from its checkpoint
+    instead of replaying the earlier steps. Fixtures (the class driver) are set up once for every attempt.
     """
-    path = os.path.join(SCREENSHOT_DIRECTORY, name)
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    driver.get_screenshot_as_file(path)
+    retries = item.config.getoption("--checkpoint-retries")
+    marker = item.get_closest_marker("from_checkpoint")
+    if not retries or marker is None or "get_driver" not in item.fixturenames:
+        return (yield)
+    try:
+        return (yield)
+    except (Exception, pytest.fail.Exception) as e:
+        failure = e
+    driver = item.funcargs["get_driver"]
+    store = item.config.stash[checkpoint_store_key]
+    key = (checkpoint_scope(item), marker.args[0])
+    for attempt in range(1, retries + 1):
+        store.log.warning(f"{item.name} failed, attempt {attempt} of {retries} restarts from checkpoint {key[1]}")
+        try:
+            store.restore(driver, *key)
+        except CheckpointError as e:
+            store.log.warning(f"{e}, {item.name} is not retried")
+            break
+        driver.checkpoint = key
+        try:
+            item.runtest()
+        except (Exception, pytest.fail.Exception) as e:
+            failure = e
+            continue
+        item.user_properties.append(("checkpoint_retries", attempt))
+        return None
+    raise failure
 
 
 @pytest.hookimpl(tryfirst=True)
@@ -73,8 +337,103 @@ def pytest_configure(config):
     Set a default HTML report path if not explicitly passed via CLI.
     """
     report_path = os.path.join(PROJECT_ROOT, REPORT_FILENAME)
-    if not config.option.htmlpath:
+    if config.pluginmanager.hasplugin("html") and not config.option.htmlpath:
         config.option.htmlpath = report_path
+    archiver = None
+    if not os.environ.get(WORKER_ID_ENV):
+        # Worker processes of utils.parallel_runner are archived by the runner
+        archiver = ReportArchiver(os.path.join(PROJECT_ROOT, REPORT_CONFIG))
+        config.stash[report_archiver_key] = archiver
+    config.stash[screenshot_pipeline_key] = ScreenshotPipeline(
+        SCREENSHOT_DIRECTORY,
+        image_format=config.getoption("--screenshot-format"),
+        quality=config.getoption("--screenshot-quality"),
+        scale=config.getoption("--screenshot-scale"),
+        on_written=archiver.add if archiver else None,
+    )
+    command_trace.enabled = not config.getoption("--no-command-trace")
+    locator_profile.enabled = config.getoption("--profile-locators")
+    config.stash[checkpoint_store_key] = CheckpointStore(os.path.join(PROJECT_ROOT, CHECKPOINT_DIR),
+                                                         from_disk=config.getoption("--checkpoints-from-disk"))
+    config.stash[event_artifacts_key] = EventArtifacts(os.path.join(PROJECT_ROOT, BROWSER_EVENTS_DIR))
+    if config.getoption("--log-on-failure"):
+        # Failures keep full detail: the root level is lowered for the buffer (pytest keeps the
+        # lower of the root and handler levels), only the live logging is quieted below
+        level = config.getoption("log_level") or config.getini("log_level") or "DEBUG"
+        log_utils.buffer_until_failure(config.getoption("--log-buffer-size"), level=level.upper())
+        if config.option.log_cli_level is None:
+            # Silence the live logging of pytest.ini, unless a level is passed on the command line
+            config.option.log_cli_level = "CRITICAL"
+    if os.environ.get(WORKER_ID_ENV) != "collect" and not config.option.collectonly:
+        config.stash[timing_history_key] = TimingHistory(os.path.join(PROJECT_ROOT, TIMING_DB))
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """
+    Attribute the WebDriver commands that follow to this test.
+    """
+    command_trace.test = nodeid
+    buffer = log_utils.failure_buffer()
+    if buffer:
+        # --log-on-failure, records of the test are kept in memory until it ends
+        buffer.start()
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    """
+    Write the buffered log records of a failed test, or a summary line for a passing one.
+    """
+    buffer = log_utils.failure_buffer()
+    if buffer:
+        buffer.finish(nodeid)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionfinish(session):
+    """
+    Wait for the background screenshot writers before the HTML report is generated, and close
+    the shared grid executors once the driver pool has quit its drivers.
+    """
+    GridExecutor.close_shared()
+    pipeline = session.config.stash.get(screenshot_pipeline_key, None)
+    if pipeline:
+        pipeline.shutdown()
+    artifacts = session.config.stash.get(event_artifacts_key, None)
+    if artifacts:
+        artifacts.shutdown()
+    history = session.config.stash.get(timing_history_key, None)
+    if history:
+        history.flush(worker=os.environ.get(WORKER_ID_ENV))
+    if command_trace.enabled:
+        worker = os.environ.get(WORKER_ID_ENV)
+        name = f"trace-{worker}.json" if worker else "trace.json"
+        command_trace.export(os.path.join(PROJECT_ROOT, TRACE_DIR, name))
+    if locator_profile.enabled:
+        worker = os.environ.get(WORKER_ID_ENV)
+        name = f"locators-{worker}.json" if worker else "locators.json"
+        path = os.path.join(PROJECT_ROOT, LOCATOR_PROFILE_DIR, name)
+        session.config.stash[locator_report_key] = (path, locator_profile.export(
+            path, slow_ms=session.config.getoption("--slow-locator-ms")))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """
+    Print the top of the ranked locator profile.
+    """
+    path, rows = config.stash.get(locator_report_key, (None, None))
+    if rows:
+        terminalreporter.write_sep("=", "locator profile")
+        terminalreporter.write_line(format_report(rows))
+        terminalreporter.write_line(f"Full report: {path}")
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session):
+    """
+    Validate every locator file before any browser is launched.
+    """
+    errors = validate_locator_repo()
+    if errors:
+        raise pytest.UsageError("\n".join(errors))
 
 # @pytest.hookimpl(tryfirst=True)
 # def pytest_sessionstart(session):
@@ -87,6 +446,13 @@ def pytest_configure(config):
 #     os.makedirs(SCREENSHOT_DIRECTORY, exist_ok=True)
 
 
+def report_dir(config):
+    """
+    Folder of the HTML report, links in the report are relative to it.
+    """
+    return os.path.dirname(os.path.abspath(getattr(config.option, "htmlpath", None) or REPORT_FILENAME))
+
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item):
     """
@@ -95,45 +461,131 @@ def pytest_runtest_makereport(item):
     pytest_html = item.config.pluginmanager.getplugin('html')
     outcome = yield
     report = outcome.get_result()
-    extra = getattr(report, 'extra', [])
+    extras = getattr(report, 'extras', [])
+
+    buffer = log_utils.failure_buffer()
+    if buffer:
+        if report.failed:
+            buffer.failed = True
+        elif report.passed:
+            # Captured logs of a failure stay in the report, including the sections of its earlier phases
+            report.sections = [section for section in report.sections if not section[0].startswith("Captured log")]
+
+    history = item.config.stash.get(timing_history_key, None)
+    if history:
+        history.record_phase(report.nodeid, report.when, report.duration, report.outcome)
+
+    checkpoint_driver = item.funcargs.get("get_driver", None) if item.funcargs else None
+    if checkpoint_driver is not None and (report.when == "call" or report.failed):
+        marker = item.get_closest_marker("checkpoint")
+        checkpoint_driver.checkpoint = None
+        if marker and report.when == "call" and report.passed:
+            key = (checkpoint_scope(item), marker.args[0])
+            item.config.stash[checkpoint_store_key].capture(checkpoint_driver, *key)
+            checkpoint_driver.checkpoint = key
+
+    waits = wait_metrics.drain()
+    if waits:
+        report.user_properties.append((f"{report.when}_wait_count", len(waits)))
+        report.user_properties.append((f"{report.when}_wait_seconds", round(sum(w.elapsed for w in waits), 3)))
+        settles = [w for w in waits if w.condition == SETTLE]
+        if settles:
+            report.user_properties.append((f"{report.when}_settle_seconds", round(sum(w.elapsed for w in settles), 3)))
+
+    # Setup commands (driver launch, base URL) are summarized together with the call
+    events = item.stash.setdefault(trace_events_key, [])
+    events.extend(command_trace.drain())
+    if events and (report.when == "call" or (report.when == "setup" and report.failed)):
+        summary = summarize(events)
+        report.user_properties.append(("round_trips", summary["round_trips"]))
+        report.user_properties.append(("command_seconds", summary["command_seconds"]))
+        if pytest_html:
+            extras.append(pytest_html.extras.html(summary_html(summary)))
+        events.clear()
+
+    capture = getattr(item.funcargs.get("get_driver", None), "event_capture", None) if item.funcargs else None
+    if capture:
+        events, counts = capture.drain()
+        pending_events, pending_counts = item.stash.get(browser_events_key, ([], Counter()))
+        pending_events.extend(events)
+        pending_counts.update(counts)
+        item.stash[browser_events_key] = pending_events, pending_counts
+        if report.when == "call" or (report.when == "setup" and report.failed):
+            for name, count in summarize_events(pending_events, pending_counts).items():
+                report.user_properties.append((name, count))
+            if pending_events:
+                path = item.config.stash[event_artifacts_key].write(item.nodeid, pending_events, dict(pending_counts))
+                if pytest_html:
+                    extras.append(pytest_html.extras.url(os.path.relpath(path, report_dir(item.config)),
+                                                        name="Browser events"))
+            item.stash[browser_events_key] = [], Counter()
+
+    monitor = getattr(item.funcargs.get("get_driver", None), "resource_monitor", None) if item.funcargs else None
+    if monitor:
+        # /proc only, the JavaScript heap costs a round trip and is sampled once per class by the pool
+        sample = monitor.sample(js_heap=False) if report.when == "call" else None
+        check = monitor.take_check() if report.when == "teardown" else None
+        if check:
+            sample, reason = check
+            if reason:
+                report.user_properties.append(("driver_recycled", reason))
+        if sample and sample.processes:
+            report.user_properties.append((f"{report.when}_browser_memory_mb", sample.memory_mb))
+            report.user_properties.append((f"{report.when}_browser_processes", sample.processes))
+            if sample.cpu_percent is not None:
+                report.user_properties.append((f"{report.when}_browser_cpu_percent", sample.cpu_percent))
+        if sample and sample.js_heap_mb is not None:
+            report.user_properties.append((f"{report.when}_js_heap_mb", sample.js_heap_mb))
+
+    blocker = getattr(item.funcargs.get("get_driver", None), "network_blocker", None) if item.funcargs else None
+    if blocker:
+        for name, count in sorted(blocker.drain().items()):
+            report.user_properties.append((f"{report.when}_{name}", count))
 
     if report.when in ("setup", "call"):
         xfail = hasattr(report, "wasxfail")
         if (report.skipped and xfail) or (report.failed and not xfail):
             driver = item.funcargs.get("get_driver", None)
             if driver:
-                file_name = report.nodeid.replace("::", "_") + ".png"
-                _capture_screenshot(file_name, driver)
+                # Captured in memory here, encoded and written by the pipeline threads
+                file_name = item.config.stash[screenshot_pipeline_key].capture(driver)
 
-                rel_path = os.path.join("screenshots", file_name)
-                html = (
-                    f'<div><img src="{rel_path}" alt="screenshot" '
-                    f'style="width:600px;height:228px;" '
-                    f'onclick="window.open(this.src)" align="right"/></div>'
-                )
-                extra.append(pytest_html.extras.html(html))
+                if pytest_html:
+                    rel_path = os.path.relpath(os.path.join(SCREENSHOT_DIRECTORY, file_name), report_dir(item.config))
+                    html = (
+                        f'<div><img src="{rel_path}" alt="screenshot" '
+                        f'style="width:600px;height:228px;" '
+                        f'onclick="window.open(this.src)" align="right"/></div>'
+                    )
+                    extras.append(pytest_html.extras.html(html))
 
-    report.extra = extra
+    # pytest-html 4 reads report.extras; the deprecated report.extra is merged into it before
+    # this wrapper resumes, so anything assigned to report.extra here would be dropped
+    report.extras = extras
 
 
 def pytest_unconfigure(config):
     """
     Post-processing once all tests and reports are finished.
     """
-    report_path = os.path.abspath(REPORT_FILENAME)
+    archiver = config.stash.get(report_archiver_key, None)
+    if archiver is None:
+        # Worker processes of utils.parallel_runner, the runner owns the merged report
+        return
+    report_path = os.path.abspath(getattr(config.option, "htmlpath", None) or REPORT_FILENAME)
     if os.path.exists(report_path):
         print(f"\n HTML report generated: {report_path}")
-        post_process_report(report_path)
+        post_process_report(archiver, report_path)
     else:
         print("Report not found.")
 
 
-def post_process_report(path: str):
+def post_process_report(archiver: ReportArchiver, path: str):
     """
-    Zip up the reports for archiving.
+    Archive the report and the other artifacts written during this session.
+    Screenshots were already streamed into the archive while the tests ran.
     """
-    print(f"Reports will be zipped from location {path}")
-    current_time = datetime.strftime(datetime.now(), '%d_%m_%Y-%H_%M_%S')
-    zip_location = os.path.join(PROJECT_ROOT, TEMP_DIR)
-    report_base = os.path.join(PROJECT_ROOT, REPORT_CONFIG) + current_time
-    shutil.make_archive(base_name=report_base, format='zip', root_dir=zip_location)
+    archiver.add(path)
+    archiver.add_modified_since(os.path.join(PROJECT_ROOT, TEMP_DIR))
+    manifest = archiver.finalize()
+    print(f"Session artifacts archived, manifest: {manifest}")
@@ -0,0 +1,27 @@
+"""
+Suite fixtures of the test folders that run against the local fixture server
+(framework_test, benchmark_test). Their conftest imports them:
+
+    from tests.fixture_suite import suite_context, configs
+"""
+import pytest
+from utils.helper import ConfigUtility
+from utils.suite_context import SuiteContext
+
+
+@pytest.fixture(scope="session")
+def suite_context(fixture_server):
+    """
+    Fixture suite context, with the base URL pointing at the local fixture server.
+    """
+    config = ConfigUtility('fixture').load_config_file()
+    config.set('PROD', 'baseURL', fixture_server.url())
+    return SuiteContext('fixture', config)
+
+
+@pytest.fixture(scope="session")
+def configs(suite_context):
+    """
+    Configuration of the fixture suite.
+    """
+    return suite_context.config
@@ -0,0 +1,42 @@
+"""
+Steps run by test_checkpoint.py in a separate pytest session with --checkpoint-retries,
+not collected by the suite (the file name does not start with test_).
+"""
+import pytest
+
+from common.base.selenium_base import SeleniumBase
+
+# Driver and field value seen by every attempt of the flaky step
+attempts = []
+
+
+@pytest.fixture(scope="module")
+def configs(suite_context, fixture_server):
+    """
+    Fixture suite configuration opening the bus page, the fake driver has no site index.
+    """
+    suite_context.config.set("PROD", "baseURL", fixture_server.url("bus/"))
+    return suite_context.config
+
+
+@pytest.mark.usefixtures("get_driver")
+class TestFlakySteps():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, get_driver):
+        self.driver = get_driver
+        self.base = SeleniumBase(get_driver, find_timeout=0)
+
+    @pytest.mark.checkpoint("from_city")
+    def test_type_from_city(self):
+        self.base.send_keys("Mumbai", "autosuggestBusSRPSrcHomeName", "name")
+
+    @pytest.mark.from_checkpoint("from_city")
+    def test_flaky_step(self):
+        field = self.base.get_element("autosuggestBusSRPSrcHomeName", "name")
+        attempts.append((id(self.driver), field.get_attribute("value")))
+        if len(attempts) == 1:
+            # Leave the page in a broken state, the retry starts from the checkpoint again
+            self.base.send_keys("Atlantis", "autosuggestBusSRPSrcHomeName", "name")
+            assert False, "flaky failure"
+        assert attempts[0] == attempts[1]
@@ -0,0 +1 @@
+from tests.fixture_suite import configs, suite_context
@@ -0,0 +1,15 @@
+"""
+Failing test run by test_failure_log_buffer.py in a separate pytest session with --log-on-failure,
+not collected by the suite (the file name does not start with test_).
+"""
+from common.base.selenium_base import SeleniumBase
+from utils.fake_driver import FakeWebDriver
+
+
+class TestFailingLookup():
+
+    def test_lookup_then_fail(self):
+        driver = FakeWebDriver()
+        driver.load_html('<html><body><input id="from_city"></body></html>')
+        assert SeleniumBase(driver, find_timeout=0).get_element("from_city")
+        assert False, "failing on purpose"
@@ -0,0 +1,54 @@
+from common.base.selenium_base import SeleniumBase
+from utils.fake_driver import FakeWebDriver
+
+FORM = """
+<html><body>
+  <input id="from"><input id="to">
+  <button id="swap">Swap</button>
+  <div id="menu">Menu</div>
+  <button id="hidden" style="display: none">Hidden</button>
+</body></html>
+"""
+
+
+class TestActionBatch():
+    """
+    ActionBatch round trips and results on the fake driver.
+    """
+
+    def setup_method(self):
+        self.driver = FakeWebDriver()
+        self.driver.load_html(FORM)
+        self.round_trips = []
+        execute, execute_script = self.driver.execute, self.driver.execute_script
+        self.driver.execute = lambda command, params=None: self.round_trips.append(command) or execute(command, params)
+        self.driver.execute_script = lambda script, *args: self.round_trips.append("script") or execute_script(script, *args)
+        self.base = SeleniumBase(self.driver, find_timeout=0)
+
+    def test_segment_runs_in_two_round_trips(self):
+        results = self.base.batch().type("from", "Mumbai").type("to", "Pune").hover("menu").click("swap").perform()
+        assert all(step.ok for step in results)
+        assert self.round_trips == ["script", "actions"]
+        assert self.base.get_element("from").get_attribute("value") == "Mumbai"
+        assert self.base.get_element("to").get_attribute("value") == "Pune"
+        assert [event for event in self.driver.events if event[0] != "hover"] == [
+            ("click", "input#from", ""), ("keys", "input#from", "Mumbai"),
+            ("click", "input#to", ""), ("keys", "input#to", "Pune"), ("click", "button#swap", "")]
+
+    def test_barriers_split_segments(self):
+        results = self.base.batch().type("from", "Mumbai").settle(300).wait_for("swap").click("swap").perform()
+        assert [step.action for step in results] == ["type", "settle", "wait", "click"]
+        assert all(step.ok for step in results)
+        assert self.round_trips == ["script", "actions", "script", "actions"]
+
+    def test_failed_segment_skips_the_rest(self):
+        results = self.base.batch().click("swap").wait_for("hidden").click("swap").perform()
+        assert [(step.ok, step.error) for step in results][0] == (True, None)
+        assert not results[1].ok and "hidden" in results[1].error
+        assert results[2] == (results[2].action, "swap", False, results[1].error)
+        assert [event[0] for event in self.driver.events].count("click") == 1
+
+    def test_later_segments_are_skipped(self):
+        results = self.base.batch().click("missing").wait_for("swap").click("swap").perform()
+        assert [step.error for step in results][1:] == ["skipped", "skipped"]
+        assert self.round_trips == ["script"]
@@ -0,0 +1,118 @@
+import http.client
+import os
+import subprocess
+import sys
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+from common.constants import PROJECT_ROOT
+from utils.browser_daemon import DRIVER_PATHS_FILE, BrowserDaemon, BrowserDaemonClient, _make_handler, pid_alive
+
+
+class StubBrowser:
+    """
+    Stands in for a WarmBrowser, no Chrome process is started.
+    """
+
+    def __init__(self, browser_id):
+        self.id = browser_id
+        self.debugger_address = f"127.0.0.1:{9500 + browser_id}"
+        self.lease_pid = None
+        self.leased_at = None
+        self.stopped = False
+
+    def stop(self):
+        self.stopped = True
+
+
+class StubDaemon(BrowserDaemon):
+
+    def __init__(self, size=2, **kwargs):
+        super().__init__(size, paths={"driver_path": "/opt/chromedriver", "browser_path": "/opt/chrome"}, **kwargs)
+        self.spawned = 0
+
+    def _spawn(self):
+        self.spawned += 1
+        self.ready.put(StubBrowser(self.spawned))
+
+    def start(self):
+        for _ in range(self.size):
+            self._spawn()
+
+
+@pytest.fixture
+def daemon_server():
+    """
+    Stub daemon behind the real HTTP handler on a free port.
+    """
+    daemon = StubDaemon()
+    daemon.start()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(daemon))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield daemon, server.server_address[1]
+    server.shutdown()
+    server.server_close()
+    daemon.stop()
+
+
+def post(port, path):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    try:
+        connection.request("POST", path, body=b"")
+        return connection.getresponse().status
+    finally:
+        connection.close()
+
+
+def exited_pid():
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+class TestBrowserDaemon():
+    """
+    Leases of utils.browser_daemon over HTTP, with stub browsers.
+    """
+
+    def test_state_lives_under_the_project_root(self):
+        assert DRIVER_PATHS_FILE.startswith(PROJECT_ROOT)
+
+    def test_lease_and_release(self, daemon_server):
+        daemon, port = daemon_server
+        client = BrowserDaemonClient(port=port)
+        lease = client.lease()
+        assert lease == {"id": 1, "debugger_address": "127.0.0.1:9501", "driver_path": "/opt/chromedriver"}
+        assert daemon.leased[1].lease_pid == os.getpid()
+        assert daemon.status() == {"ready": 1, "leased": 1, "size": 2}
+        client.release(lease["id"])
+        assert daemon.status() == {"ready": 2, "leased": 0, "size": 2}
+
+    def test_no_browser_ready(self, daemon_server):
+        daemon, port = daemon_server
+        client = BrowserDaemonClient(port=port)
+        assert client.lease() and client.lease()
+        assert client.lease() is None
+
+    def test_bad_requests(self, daemon_server):
+        daemon, port = daemon_server
+        assert post(port, "/release/abc") == 400
+        assert post(port, "/lease?pid=me") == 400
+        assert post(port, "/release/42") == 404
+        assert post(port, "/unknown") == 404
+        assert daemon.status()["ready"] == 2
+
+    @pytest.mark.skipif(os.name == "nt", reason="client processes are not probed on Windows")
+    def test_abandoned_leases_are_reclaimed(self):
+        daemon = StubDaemon(size=3, max_lease_seconds=60)
+        daemon.start()
+        alive = daemon.lease(pid=os.getpid())
+        dead = daemon.lease(pid=exited_pid())
+        expired = daemon.lease()
+        daemon.leased[expired["id"]].leased_at -= 61
+        assert not pid_alive(daemon.leased[dead["id"]].lease_pid)
+        assert sorted(daemon.reap()) == sorted([dead["id"], expired["id"]])
+        assert list(daemon.leased) == [alive["id"]]
+        assert daemon.status() == {"ready": 2, "leased": 1, "size": 3}
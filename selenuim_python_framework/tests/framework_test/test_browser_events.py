@@ -0,0 +1,60 @@
+import time
+
+import pytest
+from common.base.selenium_base import SeleniumBase
+from utils.browser_events import BrowserEventCapture, FETCH_ERROR, LOG_ENTRY, RESPONSE_COMPLETED, summarize
+
+
+class TestBrowserEventBuffer():
+    """
+    Bounded event buffer of utils.browser_events.
+    """
+
+    def test_buffer_keeps_latest_events_and_counts_drops(self):
+        capture = BrowserEventCapture(driver=None, max_events=3)
+        on_log = capture._handler(LOG_ENTRY)
+        for i in range(5):
+            on_log({"type": "console", "level": "info", "text": f"message {i}", "timestamp": i})
+        events, counts = capture.drain()
+        assert [event["text"] for event in events] == ["message 2", "message 3", "message 4"]
+        assert counts["dropped"] == 2
+        assert capture.drain() == ([], {})
+
+    def test_only_failed_responses_are_kept(self):
+        capture = BrowserEventCapture(driver=None)
+        on_response = capture._handler(RESPONSE_COMPLETED)
+        on_response({"request": {"url": "http://site/ok.js", "method": "GET"}, "response": {"status": 200}})
+        on_response({"request": {"url": "http://site/missing", "method": "GET"}, "response": {"status": 404}})
+        capture._handler(FETCH_ERROR)({"request": {"url": "http://ads/x.js"}, "errorText": "net::ERR_FAILED"})
+        events, counts = capture.drain()
+        assert [(event["kind"], event["url"]) for event in events] == [
+            ("http_error", "http://site/missing"), ("fetch_error", "http://ads/x.js")]
+        assert summarize(events, counts)["responses"] == 2
+        assert summarize(events, counts)["http_errors"] == 2
+
+
+@pytest.mark.usefixtures("get_driver")
+class TestBrowserEvents():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, get_driver, fixture_server):
+        self.driver = get_driver
+        self.server = fixture_server
+        self.base = SeleniumBase(self.driver)
+
+    def test_console_errors_and_failed_requests_are_captured(self, request):
+        self.base.log.info(f"TEST CASE: {request.node.name}")
+        capture = self.driver.event_capture
+        assert capture, "BiDi event capture is not active"
+        capture.drain()
+        self.driver.get(self.server.url("console/index.html"))
+        assert self.base.wait_for_text("loaded", "status", timeout=10), "Fixture page did not finish loading"
+        # Events are delivered asynchronously by the websocket threads
+        deadline = time.monotonic() + 5
+        while len(capture._events) < 4 and time.monotonic() < deadline:
+            time.sleep(0.1)
+        events, _ = capture.drain()
+        kinds = {(event["kind"], event.get("text") or event.get("url")) for event in events}
+        assert ("console", "console fixture loaded") in kinds, events
+        assert [event for event in events if event["kind"] == "js_error" and "fixture failure" in event["text"]], events
+        assert [event for event in events if event["kind"] == "http_error" and event["status"] == 404], events
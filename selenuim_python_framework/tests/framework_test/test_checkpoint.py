@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ElementTree
+
+import pytest
+
+from common.constants import PROJECT_ROOT
+from utils.checkpoint import CheckpointError, CheckpointStore, checkpoint_scope
+from utils.fake_driver import FakeWebDriver
+
+FORM = "<html><body><input id='city'><input type='checkbox' id='ac'></body></html>"
+
+
+@pytest.fixture
+def form_driver(tmp_path):
+    page = tmp_path / "form.html"
+    page.write_text(FORM)
+    driver = FakeWebDriver({"http://fixtures.local/form": str(page)})
+    driver.get("http://fixtures.local/form")
+    return driver
+
+
+class TestCheckpointStore():
+    """
+    Capture and restore of utils.checkpoint on the fake driver.
+    """
+
+    def test_restore_brings_back_fields_and_cookies(self, form_driver, tmp_path):
+        store = CheckpointStore(str(tmp_path / "checkpoints"))
+        form_driver.find_element("id", "city").send_keys("Mumbai")
+        form_driver.add_cookie({"name": "session", "value": "abc"})
+        store.capture(form_driver, "t.py::TestFlow", "city")
+        form_driver.get("about:blank")
+        form_driver.delete_all_cookies()
+        store.restore(form_driver, "t.py::TestFlow", "city")
+        assert form_driver.current_url == "http://fixtures.local/form"
+        assert form_driver.find_element("id", "city").get_attribute("value") == "Mumbai"
+        assert form_driver.get_cookies() == [{"name": "session", "value": "abc"}]
+
+    def test_checkpoints_of_earlier_runs_need_opt_in(self, form_driver, tmp_path):
+        directory = str(tmp_path / "checkpoints")
+        CheckpointStore(directory).capture(form_driver, "t.py::TestFlow", "city")
+        with pytest.raises(CheckpointError, match="captured in this session"):
+            CheckpointStore(directory).load("t.py::TestFlow", "city")
+        assert CheckpointStore(directory, from_disk=True).load("t.py::TestFlow", "city")["name"] == "city"
+
+    def test_scope_is_the_class_node_id(self, request):
+        assert checkpoint_scope(request.node) == "tests/framework_test/test_checkpoint.py::TestCheckpointStore"
+
+
+class TestCheckpointRetries():
+    """
+    --checkpoint-retries reruns a failed step from its checkpoint on the same class driver.
+    """
+
+    def test_failed_step_is_retried_from_checkpoint(self, tmp_path):
+        junit = tmp_path / "junit.xml"
+        result = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "-o", "log_cli=false",
+             "tests/framework_test/checkpoint_cases/flaky_steps.py", "--browser=fake", "--checkpoint-retries=1",
+             f"--junitxml={junit}", f"--html={tmp_path / 'report.html'}"],
+            cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=120,
+            env=dict(os.environ, PYTHONPATH=PROJECT_ROOT))
+        assert result.returncode == 0, result.stdout[-2000:]
+        cases = {case.get("name"): case for case in ElementTree.parse(junit).iter("testcase")}
+        assert set(cases) == {"test_type_from_city", "test_flaky_step"}
+        # The flaky step fails its first attempt and only passes when the retry saw the same driver
+        # and the restored field value
+        assert all(case.find("failure") is None and case.find("error") is None for case in cases.values())
+        retries = [prop.get("value") for prop in cases["test_flaky_step"].iter("property")
+                   if prop.get("name") == "checkpoint_retries"]
+        assert retries == ["1"]
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from utils.command_tracer import CommandTracer, summarize
+
+
+class RecordingDriver:
+
+    def __init__(self):
+        self.commands = []
+
+    def execute(self, driver_command, params=None):
+        self.commands.append(driver_command)
+        if driver_command == "fail":
+            raise RuntimeError("no such element")
+        return {"value": driver_command}
+
+
+class TestCommandTracer():
+    """
+    Tracing of driver.execute and the trace summary and export.
+    """
+
+    def test_instrument_records_command_locator_and_caller(self):
+        tracer = CommandTracer()
+        tracer.test = "t.py::T::test"
+        driver = tracer.instrument(RecordingDriver())
+        assert tracer.instrument(driver) is driver
+        assert driver.execute("findElement", {"using": "xpath", "value": "//a"}) == {"value": "findElement"}
+        event, = tracer.drain()
+        assert (event.name, event.category, event.locator, event.test) == ("findElement", "command", "//a",
+                                                                          "t.py::T::test")
+        assert event.caller.endswith("test_instrument_records_command_locator_and_caller")
+        assert tracer.drain() == []
+
+    def test_command_exception_is_kept(self):
+        tracer = CommandTracer()
+        driver = tracer.instrument(RecordingDriver())
+        with pytest.raises(RuntimeError, match="no such element"):
+            driver.execute("fail")
+        assert [event.name for event in tracer.drain()] == ["fail"]
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = CommandTracer()
+        driver = tracer.instrument(RecordingDriver())
+        tracer.enabled = False
+        driver.execute("getTitle")
+        tracer.add_span("driver_startup:fake", "driver", 0.0)
+        assert tracer.drain() == []
+        assert driver.commands == ["getTitle"]
+
+    def test_events_are_capped(self):
+        tracer = CommandTracer(max_events=8)
+        driver = tracer.instrument(RecordingDriver())
+        for _ in range(5):
+            driver.execute("getTitle")
+        assert len(tracer.drain()) == 5
+        for _ in range(5):
+            driver.execute("getUrl")
+        assert tracer.dropped == 2
+        assert [event.name for event in tracer.drain()] == ["getUrl"] * 5
+
+    def test_summarize(self):
+        tracer = CommandTracer()
+        driver = tracer.instrument(RecordingDriver())
+        driver.execute("getTitle")
+        driver.execute("findElement", {"using": "id", "value": "q"})
+        tracer.add_span("wait:visible", "wait", 0.0, duration=1.5)
+        tracer.add_span("driver_startup:fake", "driver", 0.0, duration=2.0)
+        summary = summarize(tracer.drain(), top=1)
+        assert summary["round_trips"] == 2
+        assert summary["wait_seconds"] == 1.5
+        assert summary["startup_seconds"] == 2.0
+        assert len(summary["slowest"]) == 1
+
+    def test_export_writes_trace_event_json(self, tmp_path):
+        tracer = CommandTracer()
+        driver = tracer.instrument(RecordingDriver())
+        driver.execute("getTitle")
+        path = tracer.export(str(tmp_path / "trace" / "trace.json"))
+        with open(path, encoding="utf-8") as fh:
+            trace = json.load(fh)
+        event, = trace["traceEvents"]
+        assert (event["name"], event["cat"], event["ph"]) == ("getTitle", "command", "X")
+        assert event["dur"] >= 0
+        assert trace["otherData"]["dropped_events"] == 0
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from utils.helper import get_test_data
+from utils.test_data_store import DataStore, DataValidationError, RecordIndex, validate_schema
+
+SCHEMA = {
+    "type": "object",
+    "required": ["keyword", "results"],
+    "properties": {
+        "keyword": {"type": "string"},
+        "results": {"type": "integer"},
+        "engine": {"enum": ["google", "bing"]},
+    },
+}
+
+
+class TestSearchData():
+    pass
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """
+    Empty data folder for TestSearchData, with a fresh class data cache.
+    """
+    monkeypatch.setattr(DataStore, "_class_data", {})
+    monkeypatch.setattr(DataStore, "data_dir", staticmethod(lambda test_obj: str(tmp_path)))
+    return tmp_path
+
+
+def write_class_data(data_dir, data, schema=None):
+    (data_dir / "TestSearchData").write_text(json.dumps(data), encoding="utf-8")
+    if schema is not None:
+        (data_dir / "TestSearchData.schema.json").write_text(json.dumps(schema), encoding="utf-8")
+
+
+class TestDataStore():
+    """
+    Schema validation, class data cache and JSONL/CSV record indexes of utils.test_data_store.
+    """
+
+    def test_validate_schema(self):
+        assert validate_schema({"keyword": "selenium", "results": 10, "engine": "google"}, SCHEMA) == []
+        assert validate_schema({"keyword": 1, "results": True, "engine": "duck"}, SCHEMA) == [
+            "$.keyword: expected string, got int",
+            "$.results: expected integer, got bool",
+            "$.engine: 'duck' is not one of ['google', 'bing']",
+        ]
+        assert validate_schema({}, SCHEMA) == ["$: missing required key 'keyword'", "$: missing required key 'results'"]
+        assert validate_schema([{"a": 1}, "b"], {"type": "array", "items": {"type": "object"}}) == [
+            "$[1]: expected object, got str"]
+
+    def test_class_data_is_parsed_once(self, data_dir):
+        write_class_data(data_dir, {"keyword": "selenium", "results": 10}, SCHEMA)
+        data = DataStore.load(TestSearchData)
+        assert data == {"keyword": "selenium", "results": 10}
+        write_class_data(data_dir, {"keyword": "changed", "results": 1})
+        assert DataStore.load(TestSearchData) is data
+
+    def test_invalid_data_raises(self, data_dir):
+        write_class_data(data_dir, {"keyword": "selenium"}, SCHEMA)
+        with pytest.raises(DataValidationError, match="missing required key 'results'"):
+            get_test_data(TestSearchData)
+
+    def test_missing_data_file_returns_none(self, data_dir):
+        assert get_test_data(TestSearchData) is None
+
+    def test_jsonl_index(self, tmp_path):
+        path = tmp_path / "keywords.jsonl"
+        path.write_text('{"keyword": "selenium"}\n\n{"keyword": "pytest"}\n{"keyword": "python"}\n', encoding="utf-8")
+        index = RecordIndex(str(path))
+        assert len(index) == 3
+        assert index.read(2) == {"keyword": "python"}
+        assert index.read(0) == {"keyword": "selenium"}
+        assert [record["keyword"] for record in index] == ["selenium", "pytest", "python"]
+
+    def test_csv_index(self, tmp_path):
+        path = tmp_path / "routes.csv"
+        path.write_bytes("\ufefffrom,to\nMumbai,Pune\n\"Navi Mumbai, MH\",Goa\n".encode("utf-8"))
+        index = RecordIndex(str(path))
+        assert index.header == ["from", "to"]
+        assert len(index) == 2
+        assert index.read(1) == {"from": "Navi Mumbai, MH", "to": "Goa"}
+        assert list(index) == [{"from": "Mumbai", "to": "Pune"}, {"from": "Navi Mumbai, MH", "to": "Goa"}]
+
+    def test_record_index_is_cached(self, tmp_path):
+        path = tmp_path / "keywords.jsonl"
+        path.write_text('{"keyword": "selenium"}\n', encoding="utf-8")
+        assert DataStore.record_index(str(path)) is DataStore.record_index(str(path))
@@ -0,0 +1,121 @@
+import configparser
+
+import pytest
+
+from utils.driver_pool import DriverPool
+from utils.fake_driver import FakeWebDriver
+
+
+class CdpFakeDriver(FakeWebDriver):
+    """
+    Fake driver answering the CDP commands of DriverPool.reset like a Chromium driver.
+    """
+
+    def __init__(self, history):
+        super().__init__()
+        self.history = history
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self.cdp_commands.append((cmd, cmd_args))
+        if cmd == "Page.getNavigationHistory":
+            return {"currentIndex": len(self.history) - 1, "entries": [{"url": url} for url in self.history]}
+        return {}
+
+
+class BidiStorage:
+
+    def __init__(self):
+        self.deleted = 0
+
+    def delete_cookies(self):
+        self.deleted += 1
+
+
+class BidiFakeDriver(FakeWebDriver):
+    """
+    Fake driver with a BiDi session and no CDP, like Firefox.
+    """
+    clears_every_origin = False
+
+    def __init__(self, websocket_url="ws://127.0.0.1:4444/session/1"):
+        super().__init__()
+        self.caps = {"webSocketUrl": websocket_url}
+        self.storage = BidiStorage()
+
+
+@pytest.fixture
+def fake_config():
+    config = configparser.ConfigParser()
+    config.read_dict({"PROD": {"baseURL": "http://fixtures.local/"}})
+    return config
+
+
+class TestDriverPool():
+    """
+    Acquire, release and reset of utils.driver_pool.DriverPool with the fake driver.
+    """
+
+    def test_released_driver_is_reset_and_reused(self, fake_config):
+        pool = DriverPool(max_size=1)
+        driver = pool.acquire("fake", fake_config)
+        driver.load_html("<html><body><p>booked</p></body></html>", url="http://fixtures.local/bus/")
+        driver.add_cookie({"name": "session", "value": "1"})
+        pool.release(driver)
+        assert driver.get_cookies() == []
+        assert driver.current_url == "about:blank"
+        assert pool.acquire("fake", fake_config) is driver
+
+    def test_driver_is_quit_after_max_reuses(self, fake_config):
+        pool = DriverPool(max_size=1, max_reuses=2)
+        driver = pool.acquire("fake", fake_config)
+        pool.release(driver)
+        assert pool.acquire("fake", fake_config) is driver
+        pool.release(driver)
+        assert pool.acquire("fake", fake_config) is not driver
+
+    def test_full_pool_quits_the_driver(self, fake_config):
+        pool = DriverPool(max_size=1)
+        first = pool.acquire("fake", fake_config)
+        second = pool.acquire("fake", fake_config)
+        pool.release(first)
+        pool.release(second)
+        assert pool.acquire("fake", fake_config) is first
+        assert pool.acquire("fake", fake_config) not in (first, second)
+
+    def test_failed_reset_quits_the_driver(self, fake_config, monkeypatch):
+        pool = DriverPool(max_size=1)
+        driver = pool.acquire("fake", fake_config)
+
+        def broken():
+            raise RuntimeError("session deleted")
+        monkeypatch.setattr(driver, "delete_all_cookies", broken)
+        pool.release(driver)
+        assert pool.acquire("fake", fake_config) is not driver
+
+    def test_reset_clears_every_visited_origin(self):
+        driver = CdpFakeDriver(["about:blank", "https://www.goibibo.com/bus/", "https://www.goibibo.com/",
+                                "https://accounts.goibibo.com:8443/login", "data:text/html,<p>"])
+        assert DriverPool().reset(driver)
+        assert driver.cdp_commands[1:] == [
+            ("Network.clearBrowserCookies", {}),
+            ("Storage.clearDataForOrigin", {"origin": "https://accounts.goibibo.com:8443", "storageTypes": "all"}),
+            ("Storage.clearDataForOrigin", {"origin": "https://www.goibibo.com", "storageTypes": "all"}),
+        ]
+
+    def test_cookies_of_other_origins_are_cleared_through_bidi(self):
+        driver = BidiFakeDriver()
+        assert DriverPool().reset(driver)
+        assert driver.storage.deleted == 1
+
+    def test_driver_that_cannot_clear_other_origins_is_not_reused(self):
+        driver = BidiFakeDriver(websocket_url=None)
+        assert not DriverPool().reset(driver)
+
+    def test_close_all_empties_the_pool(self, fake_config):
+        pool = DriverPool(max_size=2)
+        driver = pool.acquire("fake", fake_config)
+        pool.release(driver)
+        pool.close_all()
+        assert pool._idle_count() == 0
+        assert pool.acquire("fake", fake_config) is not driver
@@ -0,0 +1,118 @@
+import glob
+import logging
+import os
+import queue
+import time
+
+import pytest
+
+from common.constants import PROJECT_ROOT
+from utils.logger_utility import DeferredQueueHandler, FailureLogBuffer, custom_logger
+
+
+@pytest.fixture
+def buffered_logger():
+    """
+    Logger writing to a FailureLogBuffer over its own queue, the file listener is not involved.
+    """
+    log_queue = queue.SimpleQueue()
+    buffer = FailureLogBuffer(log_queue, capacity=3)
+    logger = logging.getLogger("failure_log_buffer_test")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(buffer)
+    yield logger, buffer, log_queue
+    logger.removeHandler(buffer)
+
+
+def queued_messages(log_queue):
+    messages = []
+    while not log_queue.empty():
+        messages.append(log_queue.get_nowait().getMessage())
+    return messages
+
+
+class TestFailureLogBuffer():
+    """
+    Records of utils.logger_utility.FailureLogBuffer are only queued for failing tests.
+    """
+
+    def test_passing_test_writes_summary_line_only(self, buffered_logger):
+        logger, buffer, log_queue = buffered_logger
+        buffer.start()
+        logger.debug("typed %s", "Mumbai")
+        logger.info("clicked search")
+        assert buffer.finish("test_a") == 2
+        messages = queued_messages(log_queue)
+        assert len(messages) == 1
+        assert messages[0].startswith("PASSED test_a in ")
+        assert messages[0].endswith("2 log records discarded")
+
+    def test_failing_test_writes_buffered_records(self, buffered_logger):
+        logger, buffer, log_queue = buffered_logger
+        buffer.start()
+        for step in range(5):
+            logger.info("step %d", step)
+        buffer.failed = True
+        assert buffer.finish("test_b") == 3
+        messages = queued_messages(log_queue)
+        assert messages[0].startswith("FAILED test_b in ")
+        assert messages[1] == "2 earlier log records of test_b were dropped from the buffer"
+        assert messages[2:] == ["step 2", "step 3", "step 4"]
+
+    def test_records_outside_a_test_are_written_directly(self, buffered_logger):
+        logger, buffer, log_queue = buffered_logger
+        logger.info("session setup")
+        assert queued_messages(log_queue) == ["session setup"]
+        assert buffer.finish("test_c") == 0
+        assert queued_messages(log_queue) == []
+
+
+class TestDeferredFormatting():
+    """
+    Records are formatted by the listener thread unless their arguments can still change.
+    """
+
+    def test_mutable_arguments_are_formatted_when_logged(self):
+        handler = DeferredQueueHandler(queue.SimpleQueue())
+        snapshot = [{"text": "Mumbai"}]
+        record = handler.prepare(logging.makeLogRecord({"msg": "Snapshot %s of %s", "args": (snapshot, "xpath")}))
+        snapshot[0]["text"] = "Pune"
+        assert (record.getMessage(), record.args) == ("Snapshot [{'text': 'Mumbai'}] of xpath", None)
+        record = handler.prepare(logging.makeLogRecord({"msg": "Typed %s", "args": ("Mumbai",)}))
+        assert (record.msg, record.args) == ("Typed %s", ("Mumbai",))
+
+    def test_buffered_records_keep_the_logged_values(self, buffered_logger):
+        logger, buffer, log_queue = buffered_logger
+        buffer.start()
+        cities = ["Mumbai"]
+        logger.info("cities %s", cities)
+        cities.append("Pune")
+        buffer.failed = True
+        buffer.finish("test_d")
+        assert queued_messages(log_queue)[1:] == ["cities ['Mumbai']"]
+
+    def test_custom_logger_is_named_after_the_module(self):
+        assert custom_logger(logging.INFO) is custom_logger(logging.INFO)
+        assert custom_logger(logging.INFO).name == __name__
+
+
+class TestLogOnFailure():
+    """
+    --log-on-failure end to end, in a separate pytest session.
+    """
+
+    def test_failing_test_flushes_framework_records(self, pytester):
+        started = time.time()
+        case = os.path.join(PROJECT_ROOT, "tests", "framework_test", "log_cases", "failing_lookup.py")
+        result = pytester.runpytest_subprocess(case, "--log-on-failure", "-p", "no:cacheprovider",
+                                               f"--html={pytester.path / 'report.html'}")
+        result.assert_outcomes(failed=1)
+        written = ""
+        for log_file in glob.glob(os.path.join(PROJECT_ROOT, "logs", "*", "*.log")):
+            if os.path.getmtime(log_file) >= started - 1:
+                with open(log_file, encoding="utf-8") as fh:
+                    written += fh.read()
+        nodeid = "failing_lookup.py::TestFailingLookup::test_lookup_then_fail"
+        assert f"FAILED tests/framework_test/log_cases/{nodeid}" in written
+        assert "INFO - Element found with locator: from_city and locator_type: id" in written
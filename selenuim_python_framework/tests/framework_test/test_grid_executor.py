@@ -0,0 +1,81 @@
+import configparser
+import json
+import threading
+import time
+
+import pytest
+
+from utils.fake_driver import FakeWebDriver
+from utils.grid_executor import GridCapacityError, GridEndpoint, GridExecutor, parse_status, release_session
+
+
+def fake_node(browser, options):
+    return FakeWebDriver()
+
+
+class TestGridExecutor():
+    """
+    Session placement, queueing and ejection of utils.grid_executor with fake grid nodes.
+    """
+
+    def _executor(self, capacities, **kwargs):
+        endpoints = [GridEndpoint(f"local:fake#{i}", sessions) for i, sessions in enumerate(capacities)]
+        return GridExecutor(endpoints, **kwargs)
+
+    def test_least_loaded_placement(self):
+        executor = self._executor([2, 4])
+        drivers = [executor.create_session(None, fake_node) for _ in range(3)]
+        assert [driver.grid_endpoint.url for driver in drivers] == ["local:fake#0", "local:fake#1", "local:fake#1"]
+        assert [endpoint.active for endpoint in executor.endpoints] == [1, 2]
+
+    def test_round_robin_placement(self):
+        executor = self._executor([2, 2, 2], strategy="round_robin")
+        drivers = [executor.create_session(None, fake_node) for _ in range(4)]
+        assert [driver.grid_endpoint.url[-1] for driver in drivers] == ["0", "1", "2", "0"]
+
+    def test_session_request_queues_until_a_slot_is_released(self):
+        executor = self._executor([1], queue_timeout=5)
+        first = executor.create_session(None, fake_node)
+        threading.Timer(0.2, release_session, args=(first,)).start()
+        started = time.monotonic()
+        second = executor.create_session(None, fake_node)
+        assert time.monotonic() - started >= 0.15
+        assert second.grid_endpoint is executor.endpoints[0]
+
+    def test_queue_timeout(self):
+        executor = self._executor([1], queue_timeout=0.2)
+        executor.create_session(None, fake_node)
+        with pytest.raises(GridCapacityError):
+            executor.create_session(None, fake_node)
+
+    def test_failing_endpoint_is_ejected(self):
+        calls = []
+
+        def flaky_node(browser, options):
+            calls.append(len(calls))
+            if len(calls) <= 2:
+                raise RuntimeError("session not created")
+            return FakeWebDriver()
+
+        executor = self._executor([1, 1], eject_after_failures=2)
+        driver = executor.create_session(None, flaky_node)
+        assert [endpoint.healthy for endpoint in executor.endpoints] == [False, True]
+        assert driver.grid_endpoint is executor.endpoints[1]
+
+    def test_shared_executors_are_closed(self):
+        config = configparser.ConfigParser()
+        config.read_dict({"GRID": {"endpoints": "local:fake|2", "health_check_interval": "0"}})
+        shared = GridExecutor.for_config(config)
+        assert GridExecutor.for_config(config) is shared
+        GridExecutor.close_shared()
+        assert shared._stopped.is_set()
+        assert GridExecutor.for_config(config) is not shared
+        GridExecutor.close_shared()
+
+    def test_parse_status(self):
+        hub = {"value": {"ready": True, "nodes": [
+            {"availability": "UP", "slots": [{"session": None}, {"session": {"sessionId": "a"}}]},
+            {"availability": "DOWN", "slots": [{"session": None}]},
+        ]}}
+        assert parse_status(json.dumps(hub)) == (True, 1)
+        assert parse_status(json.dumps({"value": {"ready": False, "message": "busy"}})) == (False, None)
@@ -0,0 +1,129 @@
+import http.client
+import time
+from urllib.parse import urlsplit
+
+import pytest
+
+from utils.fixture_server import FixtureServer
+from utils.har_proxy import HarArchive, HarProxy, MatchRules, ReplayIndex
+
+
+def fetch(proxy, method, url, body=None):
+    """
+    Send one request through the proxy like a browser does, with the absolute URL as path.
+    :return: Tuple (status, body bytes, header dict).
+    """
+    host, port = proxy.address.split(":")
+    connection = http.client.HTTPConnection(host, int(port), timeout=10)
+    try:
+        connection.request(method, url, body=body)
+        response = connection.getresponse()
+        return response.status, response.read(), dict(response.getheaders())
+    finally:
+        connection.close()
+
+
+@pytest.fixture(scope="class")
+def recording(tmp_path_factory):
+    """
+    HAR archive recorded from a fixture server that is stopped before the tests replay it.
+    """
+    path = str(tmp_path_factory.mktemp("har") / "TestRecorded.har")
+    with FixtureServer() as origin:
+        urls = {"page": origin.url("search/index.html?_=1"), "asset": origin.url("bytes/64.js")}
+        proxy = HarProxy("record").start()
+        proxy.use_archive(path)
+        try:
+            recorded = {name: fetch(proxy, "GET", url) for name, url in urls.items()}
+        finally:
+            proxy.stop()
+    return path, urls, recorded
+
+
+def replay_proxy(path, rules=None, **kwargs):
+    proxy = HarProxy("replay", **kwargs).start()
+    proxy.use_archive(path, rules)
+    return proxy
+
+
+class TestHarProxy():
+    """
+    Record and replay of utils.har_proxy against the local fixture server.
+    """
+
+    def test_record_writes_the_exchanges(self, recording):
+        path, urls, recorded = recording
+        entries = HarArchive(path).entries
+        assert [entry["request"]["url"] for entry in entries] == [urls["page"], urls["asset"]]
+        assert recorded["asset"][:2] == (200, b"\0" * 64)
+        assert entries[1]["response"]["content"]["size"] == 64
+
+    def test_replay_serves_recorded_response_offline(self, recording):
+        path, urls, recorded = recording
+        proxy = replay_proxy(path)
+        try:
+            status, body, _ = fetch(proxy, "GET", urls["page"])
+        finally:
+            proxy.stop()
+        assert (status, body) == recorded["page"][:2]
+        assert b"<html" in body.lower()
+        assert proxy.misses == []
+
+    def test_unmatched_request_is_a_404_miss(self, recording):
+        path, urls, _ = recording
+        proxy = replay_proxy(path)
+        try:
+            status, _, headers = fetch(proxy, "GET", urls["asset"].replace("64", "65"))
+        finally:
+            proxy.stop()
+        assert status == 404
+        assert headers["X-Har-Replay"] == "miss"
+        assert proxy.misses == [f"GET {urls['asset'].replace('64', '65')}"]
+
+    def test_ignored_query_params_still_match(self, recording):
+        path, urls, recorded = recording
+        page = urls["page"].replace("_=1", "_=2")
+        proxy = replay_proxy(path, MatchRules(ignore_query_params=["_"]))
+        try:
+            assert fetch(proxy, "GET", page)[:2] == recorded["page"][:2]
+        finally:
+            proxy.stop()
+        strict = replay_proxy(path)
+        try:
+            assert fetch(strict, "GET", page)[0] == 404
+        finally:
+            strict.stop()
+
+    def test_ignored_url_patterns_get_an_empty_response(self, recording):
+        path, urls, _ = recording
+        proxy = replay_proxy(path, MatchRules(ignore_url_patterns=[r".*/collect\?.*"]))
+        try:
+            status, body, _ = fetch(proxy, "GET", f"http://{urlsplit(urls['page']).netloc}/collect?v=1")
+        finally:
+            proxy.stop()
+        assert (status, body) == (204, b"")
+        assert proxy.misses == []
+
+    def test_replay_latency(self, recording):
+        path, urls, _ = recording
+        proxy = replay_proxy(path, latency_ms=300)
+        try:
+            started = time.perf_counter()
+            fetch(proxy, "GET", urls["asset"])
+            elapsed = time.perf_counter() - started
+        finally:
+            proxy.stop()
+        assert elapsed >= 0.3
+
+    def test_match_body(self, tmp_path):
+        archive = HarArchive(str(tmp_path / "post.har"), load=False)
+        for body, status in ((b'{"page":1}', 200), (b'{"page":2}', 201)):
+            archive.add("POST", "http://api.local/search", [], body, status, "OK", [], b"", 1.0)
+        by_body = ReplayIndex(archive, MatchRules(match_body=True))
+        rules = MatchRules(match_body=True)
+        assert by_body.lookup(rules.key("POST", "http://api.local/search", b'{"page":2}'))["response"]["status"] == 201
+        assert by_body.lookup(rules.key("POST", "http://api.local/search", b'{"page":3}')) is None
+        # Without match_body the recorded responses are served in order
+        in_order = ReplayIndex(archive, MatchRules())
+        key = MatchRules().key("POST", "http://api.local/search", b'{"page":3}')
+        assert [in_order.lookup(key)["response"]["status"] for _ in range(3)] == [200, 201, 201]
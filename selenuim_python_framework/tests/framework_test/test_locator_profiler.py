@@ -0,0 +1,61 @@
+import pytest
+
+from common.base.selenium_base import SeleniumBase
+from utils.fake_driver import FakeWebDriver
+from utils.locator_profiler import LocatorProfiler, xpath_to_css
+
+PAGE = """
+<html><body>
+  <ul role="listbox">
+    <li><div class="item first" aria-label="one">one</div></li>
+    <li><div class="item" aria-label="two">two</div></li>
+  </ul>
+  <button data-testid="searchBusBtn">Search</button>
+</body></html>
+"""
+
+
+class TestLocatorProfiler():
+    """
+    XPath to CSS rewrites and the locator profile of utils.locator_profiler.
+    """
+
+    @pytest.mark.parametrize("xpath, css", [
+        ("//button[@data-testid='searchBusBtn']", "button[data-testid='searchBusBtn']"),
+        ("//ul[@role='listbox']//li/descendant::div[@aria-label='two']", "ul[role='listbox'] li div[aria-label='two']"),
+        ("//ul/li[2]", "ul > li:nth-of-type(2)"),
+        ("//div[contains(@class,'item') and @aria-label]", "div[class*='item'][aria-label]"),
+        ("//div[contains(concat(' ', normalize-space(@class), ' '), ' first ')]", "div.first"),
+        ("//span[text()='Mumbai']//parent::li", None),
+        ("//li[@x][1]", None),
+        ("(//li)[1]", None),
+    ])
+    def test_xpath_to_css(self, xpath, css):
+        assert xpath_to_css(xpath) == css
+
+    @pytest.fixture
+    def profiler(self, monkeypatch):
+        profiler = LocatorProfiler()
+        profiler.enabled = True
+        monkeypatch.setattr("common.base.selenium_base.locator_profile", profiler)
+        return profiler
+
+    def test_profile_flags_and_verifies_rewrites(self, profiler):
+        driver = FakeWebDriver()
+        driver.load_html(PAGE)
+        base = SeleniumBase(driver, find_timeout=0)
+        profiler.register("Page", "items", "xpath", "//ul[@role='listbox']//li/div", "//ul[@role='listbox']//li/div")
+        profiler.register("Page", "search", "xpath", "//button[@data-testid='searchBusBtn']",
+                          "//button[@data-testid='searchBusBtn']")
+        assert base.get_element("//ul[@role='listbox']//li/div", "xpath")
+        assert base.get_element("//button[@data-testid='searchBusBtn']", "xpath")
+        assert not base.get_element("missing", "id")
+
+        rows = {row["name"]: row for row in profiler.report()}
+        assert rows["items"]["max_matches"] == 2
+        assert "ambiguous" in rows["items"]["flags"]
+        assert rows["items"]["css_suggestion"] == "ul[role='listbox'] li > div"
+        assert rows["items"]["css_verified"] is True
+        assert rows["search"]["flags"] == ["xpath"]
+        assert rows["missing"]["flags"] == ["missing"]
+        assert rows["search"]["rank"] == 3
@@ -0,0 +1,59 @@
+import json
+import os
+
+from utils.locator_utility import LocatorRegistry, validate_locator_entries, validate_locator_repo
+
+
+def write_locators(path, entries):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(entries), encoding="utf-8")
+
+
+class TestLocatorRepo():
+    """
+    Validation of locator files by utils.locator_utility.
+    """
+
+    def test_shipped_locator_repo_is_valid(self):
+        assert validate_locator_repo() == []
+
+    def test_entry_errors(self):
+        errors = validate_locator_entries("Page.json", [
+            {"name": "search_box", "locate": "name", "locator": "q"},
+            {"name": "search_box", "locate": "id", "locator": "q"},
+            {"name": "typed", "locate": 1, "locator": "q"},
+            {"name": "tag", "locate": "tag", "locator": "input"},
+            {"name": "broken_xpath", "locate": "xpath", "locator": "//div[@id='a'"},
+            {"name": "broken_css", "locate": "css", "locator": "div[id="},
+            {"name": "option", "locate": "XPATH", "locator": "//li[{index}]", "is_dynamic": True},
+            {"name": "no_locator", "locate": "id"},
+            "search_button",
+        ])
+        assert errors[:4] == [
+            "duplicate locator name 'search_box'",
+            "entry #2: locate must be a string",
+            "'tag': unsupported locate type 'tag'",
+            "'broken_xpath': invalid XPath: Invalid predicate -> //div[@id='a'",
+        ]
+        assert errors[4].startswith("'broken_css': invalid CSS selector:")
+        assert errors[5:] == ["entry #7 is missing locator", "entry #8 is not an object"]
+        assert validate_locator_entries("Page.json", {"name": "q"}) == ["top level JSON value must be a list of locators"]
+
+    def test_repo_reports_every_invalid_file(self, tmp_path):
+        write_locators(tmp_path / "site" / "Valid.json", [{"name": "q", "locate": "name", "locator": "q"}])
+        write_locators(tmp_path / "site" / "Invalid.json", [{"name": "q", "locate": ["id"], "locator": "q"}])
+        (tmp_path / "site" / "Broken.json").write_text("[{", encoding="utf-8")
+        (tmp_path / "site" / "notes.txt").write_text("not a locator file", encoding="utf-8")
+        errors = validate_locator_repo(str(tmp_path))
+        assert len(errors) == 2
+        assert errors[0].startswith(f"Invalid locator file {os.path.join(tmp_path, 'site', 'Broken.json')}: ")
+        assert errors[1].endswith("Invalid.json:\n  entry #0: locate must be a string")
+
+    def test_registry_reloads_a_changed_file(self, tmp_path):
+        path = tmp_path / "Page.json"
+        write_locators(path, [{"name": "q", "locate": "name", "locator": "q"}])
+        first = LocatorRegistry.get(str(path))
+        assert LocatorRegistry.get(str(path)) is first
+        write_locators(path, [{"name": "option", "locate": "xpath", "locator": "//li[{index}]", "is_dynamic": True}])
+        os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 1))
+        assert LocatorRegistry.get(str(path))["option"].resolve(index=2) == ("xpath", "//li[2]")
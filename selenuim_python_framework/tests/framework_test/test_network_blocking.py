@@ -0,0 +1,154 @@
+import configparser
+
+import pytest
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+
+from common.base.selenium_base import SeleniumBase
+from utils.browser_daemon import BrowserDaemonClient
+from utils.driver_utility import WebDriver
+from utils.fake_driver import FakeWebDriver
+from utils.network_filter import NetworkBlocker, NetworkPolicy, resource_type
+
+
+class InterceptedRequest:
+
+    def __init__(self, url, resource_type=None):
+        self.url = url
+        self.resource_type = resource_type
+        self.outcome = None
+
+    def fail_request(self):
+        self.outcome = "failed"
+
+    def continue_request(self):
+        self.outcome = "continued"
+
+
+class NoBidiDriver:
+
+    @property
+    def network(self):
+        raise WebDriverException("Unable to find url to connect to from capabilities")
+
+
+class RecordingNetwork:
+
+    def __init__(self):
+        self.handlers = []
+
+    def add_request_handler(self, event, callback):
+        self.handlers.append(event)
+        return len(self.handlers)
+
+
+class AttachedChrome(FakeWebDriver):
+    """
+    Fake driver created in place of webdriver.Chrome, with a BiDi network module.
+    """
+
+    def __init__(self, options=None, service=None):
+        super().__init__()
+        self.options = options
+        self.network = RecordingNetwork()
+
+
+class TestNetworkBlocker():
+    """
+    Blocking decisions and counters of utils.network_filter against intercepted request stubs.
+    """
+
+    def test_reported_resource_type_wins_over_extension(self):
+        assert resource_type("http://cdn.local/font.woff2") == "font"
+        assert resource_type("http://cdn.local/font?family=Roboto", "Font") == "font"
+        assert resource_type("http://api.local/search.js", "XHR") == "xhr"
+        assert resource_type("http://api.local/search") == "other"
+
+    def test_block_reason(self):
+        policy = NetworkPolicy(block_patterns=["*/ads/*"], allow_patterns=["*/ads/allowed*"],
+                               block_resource_types=["xhr"], images=False)
+        assert policy.block_reason("http://site.local/ads/banner.js") == "pattern"
+        assert policy.block_reason("http://site.local/ads/allowed.png") is None
+        assert policy.block_reason("http://site.local/logo.png") == "image"
+        assert policy.block_reason("http://site.local/avatar", "Image") == "image"
+        assert policy.block_reason("http://site.local/api/search", "XHR") == "xhr"
+        assert policy.block_reason("http://site.local/app.js", "Script") is None
+
+    def test_driver_without_bidi_disables_blocking(self):
+        assert NetworkBlocker(NoBidiDriver(), NetworkPolicy()).start() is False
+
+    def test_policy_is_enforced_on_warm_chrome(self, monkeypatch):
+        lease = {"id": 1, "debugger_address": "127.0.0.1:9501", "driver_path": "/opt/chromedriver"}
+        monkeypatch.setattr(BrowserDaemonClient, "lease", lambda client: lease)
+        monkeypatch.setattr(webdriver, "Chrome", AttachedChrome)
+        config = configparser.ConfigParser()
+        config.read_dict({"PROD": {"baseURL": "http://fixtures.local/"}, "NETWORK": {"images": "false"}})
+        driver = WebDriver("warm-chrome", config).create_driver()
+        assert driver.options.debugger_address == "127.0.0.1:9501"
+        assert driver.options.enable_bidi
+        assert "prefs" not in driver.options.experimental_options
+        assert driver.network.handlers == ["before_request"]
+        assert driver.network_blocker.policy.block_reason("http://site.local/logo.png") == "image"
+
+    def test_warm_chrome_has_bidi_without_policy(self, monkeypatch):
+        lease = {"id": 1, "debugger_address": "127.0.0.1:9501", "driver_path": "/opt/chromedriver"}
+        monkeypatch.setattr(BrowserDaemonClient, "lease", lambda client: lease)
+        monkeypatch.setattr(webdriver, "Chrome", AttachedChrome)
+        config = configparser.ConfigParser()
+        config.read_dict({"PROD": {"baseURL": "http://fixtures.local/"}})
+        driver = WebDriver("warm-chrome", config).create_driver()
+        # utils.browser_events needs the webSocketUrl capability even when nothing is blocked
+        assert driver.options.enable_bidi
+        assert driver.network_blocker is None
+
+    def test_counters_and_blocked_bytes(self, fixture_server):
+        blocker = NetworkBlocker(None, NetworkPolicy(block_patterns=["*/ads/*"], measure_blocked_bytes=True))
+        try:
+            ad = InterceptedRequest(fixture_server.url("ads/bytes/300.js"))
+            page = InterceptedRequest(fixture_server.url("network/index.html"), "Document")
+            blocker._on_request(ad)
+            blocker._on_request(page)
+            assert (ad.outcome, page.outcome) == ("failed", "continued")
+            assert blocker.drain() == {"blocked_requests": 1, "blocked_pattern": 1, "allowed_requests": 1,
+                                       "blocked_bytes": 300}
+            blocker._on_request(InterceptedRequest(fixture_server.url("ads/bytes/300.js")))
+            blocker._on_request(InterceptedRequest(fixture_server.url("ads/bytes/0.gif")))
+            assert blocker.drain()["blocked_bytes"] == 300
+            assert blocker.drain() == {"blocked_bytes": 0}
+        finally:
+            blocker.stop()
+
+
+@pytest.mark.usefixtures("get_driver")
+class TestNetworkBlocking():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, get_driver, fixture_server):
+        self.driver = get_driver
+        self.server = fixture_server
+        self.base = SeleniumBase(self.driver)
+
+    def _load_page(self):
+        self.driver.network_blocker.drain()
+        self.server.requests.clear()
+        self.driver.get(self.server.url("network/index.html"))
+        assert self.base.wait_for_text("loaded", "status", timeout=10), "Fixture page did not finish loading"
+        return list(self.server.requests)
+
+    def test_blocked_resources_are_not_requested(self, request):
+        self.base.log.info(f"TEST CASE: {request.node.name}")
+        assert self.driver.network_blocker, "Request interception is not active"
+        requested = self._load_page()
+        assert not [path for path in requested if path.startswith(("/ads/", "/analytics/"))], requested
+        assert not [path for path in requested if ".png" in path or ".woff2" in path], requested
+        assert "/bytes/2048.css" in requested and "/bytes/1024.js" in requested, requested
+
+    def test_blocked_request_counters(self, request):
+        self.base.log.info(f"TEST CASE: {request.node.name}")
+        self._load_page()
+        counts = self.driver.network_blocker.drain()
+        assert counts.get("blocked_pattern", 0) >= 3, counts
+        assert counts.get("blocked_requests", 0) >= counts.get("blocked_pattern", 0), counts
+        assert counts.get("allowed_requests", 0) >= 3, counts
+        # /ads/bytes/16384.js and /analytics/bytes/16384.js, measured with HEAD requests
+        assert counts.get("blocked_bytes", 0) >= 2 * 16384, counts
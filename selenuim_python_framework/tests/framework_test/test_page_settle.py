@@ -0,0 +1,30 @@
+import pytest
+from common.base.selenium_base import SeleniumBase
+
+
+@pytest.mark.usefixtures("get_driver")
+class TestPageSettle():
+
+    @pytest.fixture(autouse=True)
+    def setup(self, get_driver, fixture_server):
+        self.driver = get_driver
+        self.base = SeleniumBase(self.driver)
+        self.driver.get(fixture_server.url("settle/index.html"))
+
+    def test_settle_waits_for_mutations_and_requests(self, request):
+        self.base.log.info(f"TEST CASE: {request.node.name}")
+        assert self.base.element_click("start", "id")
+        settle_time = self.base.wait_for_page_settle(quiet_ms=250, timeout=10)
+        assert settle_time is not False, "Page did not settle"
+        assert self.base.get_text("status", "id") == "done"
+        assert 0.7 <= settle_time < 5, settle_time
+
+    def test_quiet_page_settles_immediately(self, request):
+        self.base.log.info(f"TEST CASE: {request.node.name}")
+        assert self.base.wait_for_page_settle(quiet_ms=100, timeout=5) is not False
+        assert self.base.wait_for_page_settle(quiet_ms=100, timeout=5) == 0.0
+
+    def test_settle_timeout(self, request):
+        self.base.log.info(f"TEST CASE: {request.node.name}")
+        assert self.base.element_click("start", "id")
+        assert self.base.wait_for_page_settle(quiet_ms=250, timeout=0.3) is False
@@ -0,0 +1,86 @@
+import subprocess
+import xml.etree.ElementTree as ET
+
+import pytest
+
+import utils.parallel_runner as parallel_runner
+from utils.parallel_runner import collect_shards, merge_junit
+
+COLLECT_OUTPUT = """\
+tests/google_test/test_google.py::TestGoogleSearch::test_search_keyword
+tests/google_test/test_google.py::TestGoogleSearch::test_search_results[selenium]
+tests/goibibo_test/test_bus.py::TestBusSearch::test_search_buses
+tests/google_test/test_google.py::TestGoogleSearch::test_search_results[pytest::node]
+tests/framework_test/test_plain.py::test_module_level
+
+5 tests collected in 0.21s
+- Generated html report: file:///framework/temp/workers/collect.html -
+"""
+
+WORKER_0 = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="0" failures="1" skipped="0" tests="2" time="3.5">
+<testcase classname="tests.google_test.test_google.TestGoogleSearch" name="test_search_keyword" time="1.25"/>
+<testcase classname="tests.google_test.test_google.TestGoogleSearch" name="test_search_results" time="2.25">
+<failure message="assert 0 == 10">AssertionError</failure></testcase>
+</testsuite></testsuites>
+"""
+
+WORKER_1 = """<?xml version="1.0" encoding="utf-8"?>
+<testsuite name="pytest" errors="0" failures="0" skipped="1" tests="2" time="1.0">
+<testcase classname="tests.goibibo_test.test_bus.TestBusSearch" name="test_search_buses" time="1.0"/>
+<testcase classname="tests.goibibo_test.test_bus.TestBusSearch" name="test_offers" time="0">
+<skipped message="no offers"/></testcase>
+</testsuite>
+"""
+
+
+def completed(returncode, stdout=""):
+    return lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, returncode, stdout, "")
+
+
+class TestParallelRunner():
+    """
+    Collection parsing and JUnit merging of utils.parallel_runner.
+    """
+
+    def test_collected_tests_are_grouped_by_class(self, monkeypatch):
+        monkeypatch.setattr(parallel_runner.subprocess, "run", completed(0, COLLECT_OUTPUT))
+        shards = collect_shards(["tests"], [])
+        assert shards == {
+            "tests/google_test/test_google.py::TestGoogleSearch": [
+                "tests/google_test/test_google.py::TestGoogleSearch::test_search_keyword",
+                "tests/google_test/test_google.py::TestGoogleSearch::test_search_results[selenium]",
+                "tests/google_test/test_google.py::TestGoogleSearch::test_search_results[pytest::node]",
+            ],
+            "tests/goibibo_test/test_bus.py::TestBusSearch": [
+                "tests/goibibo_test/test_bus.py::TestBusSearch::test_search_buses",
+            ],
+            "tests/framework_test/test_plain.py": ["tests/framework_test/test_plain.py::test_module_level"],
+        }
+
+    def test_collection_errors_stop_the_run(self, monkeypatch):
+        monkeypatch.setattr(parallel_runner.subprocess, "run", completed(5, "no tests ran in 0.01s\n"))
+        assert collect_shards(["tests"], []) == {}
+        monkeypatch.setattr(parallel_runner.subprocess, "run", completed(2, "1 error in 0.10s\n"))
+        with pytest.raises(SystemExit) as exit_info:
+            collect_shards(["tests"], [])
+        assert exit_info.value.code == 2
+
+    def test_worker_results_are_merged(self, tmp_path):
+        (tmp_path / "gw0.xml").write_text(WORKER_0, encoding="utf-8")
+        (tmp_path / "gw1.xml").write_text(WORKER_1, encoding="utf-8")
+        output = tmp_path / "junit.xml"
+        rows = merge_junit([("gw0", str(tmp_path / "gw0.xml")), ("gw1", str(tmp_path / "gw1.xml")),
+                            ("gw2", str(tmp_path / "gw2.xml"))], str(output))
+        assert rows == [
+            ("gw0", "tests.google_test.test_google.TestGoogleSearch", "test_search_keyword", "passed", 1.25),
+            ("gw0", "tests.google_test.test_google.TestGoogleSearch", "test_search_results", "failure", 2.25),
+            ("gw1", "tests.goibibo_test.test_bus.TestBusSearch", "test_search_buses", "passed", 1.0),
+            ("gw1", "tests.goibibo_test.test_bus.TestBusSearch", "test_offers", "skipped", 0.0),
+            ("gw2", "", "worker produced no results", "error", 0.0),
+        ]
+        merged = ET.parse(output).getroot()
+        assert merged.tag == "testsuites"
+        assert [suite.get("name") for suite in merged] == ["pytest[gw0]", "pytest[gw1]"]
+        assert {attr: merged.get(attr) for attr in ("tests", "failures", "errors", "skipped", "time")} == {
+            "tests": "4", "failures": "1", "errors": "0", "skipped": "1", "time": "4.500"}
@@ -0,0 +1,79 @@
+import gzip
+import hashlib
+import json
+import os
+
+from common.constants import PROJECT_ROOT
+from utils.report_archiver import ReportArchiver, extract_run
+
+
+def write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return str(path)
+
+
+def objects(archive_dir):
+    return sorted(name for _, _, files in os.walk(archive_dir / "objects") for name in files)
+
+
+class TestReportArchiver():
+    """
+    Content-addressed store, run manifests and extraction of utils.report_archiver.
+    """
+
+    def test_manifest_lists_every_added_file(self, tmp_path):
+        archiver = ReportArchiver(str(tmp_path / "reports"), workers=2)
+        archiver.add(write(tmp_path / "run" / "report.html", b"<html>report</html>"), "temp/report.html")
+        archiver.add(write(tmp_path / "run" / "old.log", b"first"), "logs/test.log")
+        archiver.add(write(tmp_path / "run" / "test.log", b"second"), "logs/test.log")
+        manifest_path = archiver.finalize("run_1")
+        assert manifest_path == str(tmp_path / "reports" / "run_1.json")
+        with open(manifest_path, encoding="utf-8") as fh:
+            manifest = json.load(fh)
+        assert manifest["run"] == "run_1"
+        assert manifest["files"] == {
+            "logs/test.log": {"sha256": hashlib.sha256(b"second").hexdigest(), "size": 6},
+            "temp/report.html": {"sha256": hashlib.sha256(b"<html>report</html>").hexdigest(), "size": 19},
+        }
+        digest = manifest["files"]["logs/test.log"]["sha256"]
+        with gzip.open(tmp_path / "reports" / "objects" / digest[:2] / f"{digest}.gz") as fh:
+            assert fh.read() == b"second"
+
+    def test_identical_content_is_stored_once_across_runs(self, tmp_path):
+        archive_dir = tmp_path / "reports"
+        first = ReportArchiver(str(archive_dir))
+        first.add(write(tmp_path / "a" / "shot.png", b"same bytes"), "screenshots/a.png")
+        first.add(write(tmp_path / "a" / "copy.png", b"same bytes"), "screenshots/b.png")
+        first.finalize("run_1")
+        assert len(objects(archive_dir)) == 1
+        second = ReportArchiver(str(archive_dir))
+        second.add(write(tmp_path / "b" / "shot.png", b"same bytes"), "screenshots/a.png")
+        second.add(write(tmp_path / "b" / "new.log", b"new run"), "logs/new.log")
+        second.finalize("run_2")
+        assert len(objects(archive_dir)) == 2
+
+    def test_only_files_modified_during_the_session_are_added(self, tmp_path):
+        old = write(tmp_path / "logs" / "old.log", b"previous session")
+        os.utime(old, (0, 0))
+        new = write(tmp_path / "logs" / "nested" / "new.log", b"this session")
+        added = write(tmp_path / "logs" / "added.log", b"explicit")
+        archiver = ReportArchiver(str(tmp_path / "reports"))
+        archiver.add(added)
+        future = archiver._entries[os.path.relpath(added, PROJECT_ROOT)]
+        archiver.add_modified_since(str(tmp_path / "logs"), since=1)
+        # Files already queued are not compressed twice
+        assert archiver._entries[os.path.relpath(added, PROJECT_ROOT)] is future
+        with open(archiver.finalize("run_1"), encoding="utf-8") as fh:
+            files = json.load(fh)["files"]
+        assert sorted(files) == sorted(os.path.relpath(path, PROJECT_ROOT) for path in (added, new))
+
+    def test_extracted_run_matches_the_archived_files(self, tmp_path):
+        archiver = ReportArchiver(str(tmp_path / "reports"))
+        archiver.add(write(tmp_path / "run" / "report.html", b"<html>report</html>"), "temp/report.html")
+        archiver.add(write(tmp_path / "run" / "trace.json", os.urandom(4096)), "temp/trace.json")
+        manifest_path = archiver.finalize("run_1")
+        extract_run(manifest_path, str(tmp_path / "restored"))
+        assert (tmp_path / "restored" / "temp" / "report.html").read_bytes() == b"<html>report</html>"
+        assert (tmp_path / "restored" / "temp" / "trace.json").read_bytes() == \
+            (tmp_path / "run" / "trace.json").read_bytes()
@@ -0,0 +1,95 @@
+import configparser
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+from utils.driver_pool import DriverPool
+from utils.resource_monitor import ResourceLimits, ResourceMonitor, process_tree
+
+pytestmark = pytest.mark.skipif(not os.path.isdir("/proc/self"), reason="needs /proc")
+
+
+@pytest.fixture
+def process_group():
+    """
+    A shell with a child process, standing in for a driver service and its browser.
+    """
+    process = subprocess.Popen(["sh", "-c", f"{sys.executable} -c 'import time; time.sleep(30)' & wait"])
+    yield process
+    for pid in process_tree(process.pid)[1:]:
+        os.kill(pid, 9)
+    process.kill()
+    process.wait()
+
+
+@pytest.fixture
+def fake_config():
+    config = configparser.ConfigParser()
+    config.read_dict({"PROD": {"baseURL": "http://fixtures.local/"}})
+    return config
+
+
+def wait_for_tree(pid, size):
+    for _ in range(50):
+        tree = process_tree(pid)
+        if len(tree) >= size:
+            return tree
+        time.sleep(0.02)
+    return process_tree(pid)
+
+
+class TestResourceMonitor():
+    """
+    /proc sampling of utils.resource_monitor and driver recycling of the pool.
+    """
+
+    def test_samples_the_whole_process_tree(self, process_group):
+        wait_for_tree(process_group.pid, 2)
+        monitor = ResourceMonitor(None)
+        monitor.pid = process_group.pid
+        first = monitor.sample(js_heap=False)
+        second = monitor.sample(js_heap=False)
+        assert first.processes == 2
+        assert first.memory_mb > 0
+        assert first.cpu_percent is None
+        assert second.cpu_percent is not None
+        assert first.js_heap_mb is None
+        assert list(monitor.samples) == [first, second]
+
+    def test_driver_without_local_process_only_reports_heap(self, fake_config):
+        driver = DriverPool(max_size=0).acquire("fake", fake_config)
+        sample = driver.resource_monitor.sample()
+        assert driver.resource_monitor.pid is None
+        assert (sample.processes, sample.memory_mb, sample.js_heap_mb) == (0, None, None)
+
+    def test_over_limits(self, process_group):
+        wait_for_tree(process_group.pid, 2)
+        monitor = ResourceMonitor(None)
+        monitor.pid = process_group.pid
+        sample = monitor.sample(js_heap=False)
+        assert monitor.over_limits(ResourceLimits(0.001, 0, 0), sample).startswith("memory_mb")
+        assert monitor.over_limits(ResourceLimits(10 ** 6, 0, None), sample) is None
+        assert monitor.over_limits(ResourceLimits(0, 0, 0), sample) is None
+
+    def test_pool_recycles_driver_over_limits(self, process_group, fake_config):
+        wait_for_tree(process_group.pid, 2)
+        pool = DriverPool(max_size=1, limits=ResourceLimits(memory_mb=0.001, js_heap_mb=0, cpu_percent=0))
+        driver = pool.acquire("fake", fake_config)
+        driver.resource_monitor.pid = process_group.pid
+        pool.release(driver)
+        sample, reason = driver.resource_monitor.take_check()
+        assert reason.startswith("memory_mb")
+        assert driver.resource_monitor.take_check() is None
+        assert pool.acquire("fake", fake_config) is not driver
+
+    def test_pool_keeps_driver_under_limits(self, process_group, fake_config):
+        wait_for_tree(process_group.pid, 2)
+        pool = DriverPool(max_size=1, limits=ResourceLimits(memory_mb=10 ** 6, js_heap_mb=512, cpu_percent=0))
+        driver = pool.acquire("fake", fake_config)
+        driver.resource_monitor.pid = process_group.pid
+        pool.release(driver)
+        assert driver.resource_monitor.take_check()[1] is None
+        assert pool.acquire("fake", fake_config) is driver
@@ -0,0 +1,52 @@
+from utils.parallel_runner import assign_shards, estimate_durations
+from utils.timing_history import TimingHistory, shard_key
+
+
+class TestScheduling():
+    """
+    Timing history and longest-first shard assignment of utils.parallel_runner.
+    """
+
+    def _history(self, tmp_path, runs, launches=None):
+        history = TimingHistory(str(tmp_path / "timing.db"))
+        for phases in runs:
+            for nodeid, seconds in phases.items():
+                history.record_phase(nodeid, "call", seconds, "passed")
+                history.record_phase(nodeid, "setup", 0.5, "passed")
+            for shard, seconds in (launches or {}).items():
+                history.record_driver_launch(shard, seconds)
+            history.flush()
+        return history
+
+    def test_shard_key_keeps_classes_together(self):
+        assert shard_key("tests/a.py::TestA::test_one") == "tests/a.py::TestA"
+        assert shard_key("tests/a.py::test_plain") == "tests/a.py"
+
+    def test_shard_durations_median_of_recent_runs(self, tmp_path):
+        history = self._history(tmp_path, [
+            {"t.py::Slow::a": 10, "t.py::Slow::b": 10, "t.py::Fast::a": 1},
+            {"t.py::Slow::a": 30, "t.py::Slow::b": 10, "t.py::Fast::a": 1},
+            {"t.py::Slow::a": 12, "t.py::Slow::b": 10, "t.py::Fast::a": 3},
+        ], launches={"t.py::Slow": 4})
+        durations = history.shard_durations()
+        # Launches happen inside the setup phases and are not added on top
+        assert durations["t.py::Slow"] == 23
+        assert durations["t.py::Fast"] == 1.5
+        assert history.driver_launch_durations() == {"t.py::Slow": 4}
+
+    def test_longest_first_assignment_uses_history(self, tmp_path):
+        history = self._history(tmp_path, [{"t.py::Slow::a": 60, "t.py::Mid::a": 20, "t.py::Mid2::a": 20}])
+        shards = {
+            "t.py::Mid": ["t.py::Mid::a", "t.py::Mid::b", "t.py::Mid::c"],
+            "t.py::Mid2": ["t.py::Mid2::a"],
+            "t.py::Slow": ["t.py::Slow::a"],
+            "t.py::New": ["t.py::New::a", "t.py::New::b"],
+        }
+        durations = estimate_durations(shards, history)
+        assert durations["t.py::New"] == 2 * 20.5
+        buckets = assign_shards(shards, 2, durations)
+        assert buckets == [["t.py::Slow", "t.py::Mid2"], ["t.py::New", "t.py::Mid"]]
+
+    def test_assignment_without_history_uses_test_count(self):
+        shards = {"a": ["1"], "b": ["1", "2", "3"], "c": ["1", "2"]}
+        assert assign_shards(shards, 2) == [["b"], ["c", "a"]]
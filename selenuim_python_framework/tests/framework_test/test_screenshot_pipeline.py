@@ -0,0 +1,87 @@
+import io
+import os
+
+import pytest
+
+import utils.screenshot_utility as screenshot_utility
+from utils.fake_driver import FakeWebDriver
+from utils.screenshot_utility import ScreenshotPipeline
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def png(width=200, height=100, color=(200, 30, 30)):
+    out = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(out, format="PNG")
+    return out.getvalue()
+
+
+class ScreenshotDriver:
+
+    def __init__(self, image):
+        self.image = image
+        self.captures = 0
+
+    def get_screenshot_as_png(self):
+        self.captures += 1
+        return self.image
+
+
+class TestScreenshotPipeline():
+    """
+    Capture, deduplication and encoding of utils.screenshot_utility.
+    """
+
+    def _written(self, pipeline, file_name):
+        pipeline.flush()
+        with open(os.path.join(pipeline.directory, file_name), "rb") as fh:
+            return Image.open(io.BytesIO(fh.read()))
+
+    def test_capture_encodes_downscaled_jpeg(self, tmp_path):
+        written = []
+        pipeline = ScreenshotPipeline(str(tmp_path), image_format="jpeg", scale=0.5, on_written=written.append)
+        file_name = pipeline.capture(ScreenshotDriver(png()))
+        image = self._written(pipeline, file_name)
+        assert file_name.endswith(".jpg")
+        assert (image.format, image.size) == ("JPEG", (100, 50))
+        assert written == [os.path.join(str(tmp_path), file_name)]
+        pipeline.shutdown()
+
+    def test_identical_screenshots_share_one_file(self, tmp_path):
+        written = []
+        pipeline = ScreenshotPipeline(str(tmp_path), image_format="webp", on_written=written.append)
+        driver = ScreenshotDriver(png())
+        first, second = pipeline.capture(driver), pipeline.capture(driver)
+        other = pipeline.capture(ScreenshotDriver(png(color=(0, 0, 255))))
+        pipeline.shutdown()
+        assert first == second != other
+        assert driver.captures == 2
+        assert len(written) == 2
+
+    def test_clip_crops_before_scaling(self, tmp_path):
+        pipeline = ScreenshotPipeline(str(tmp_path), image_format="png", scale=1.0)
+        file_name = pipeline.capture(ScreenshotDriver(png()), clip=(10, 20, 40, 30))
+        assert self._written(pipeline, file_name).size == (40, 30)
+        # The clip is part of the content key
+        assert pipeline.capture(ScreenshotDriver(png())) != file_name
+        pipeline.shutdown()
+
+    def test_without_pillow_png_is_kept_with_a_warning(self, tmp_path, monkeypatch, caplog):
+        monkeypatch.setattr(screenshot_utility, "Image", None)
+        caplog.set_level("WARNING")
+        pipeline = ScreenshotPipeline(str(tmp_path), image_format="jpeg", scale=0.5)
+        assert "Pillow is not installed" in caplog.text
+        image = png()
+        file_name = pipeline.capture(ScreenshotDriver(image))
+        pipeline.shutdown()
+        assert file_name.endswith(".png")
+        with open(os.path.join(str(tmp_path), file_name), "rb") as fh:
+            assert fh.read() == image
+
+    def test_element_capture(self, tmp_path):
+        driver = FakeWebDriver()
+        driver.load_html("<html><body><button id='search'>Search</button></body></html>")
+        pipeline = ScreenshotPipeline(str(tmp_path), image_format="png", scale=1.0)
+        file_name = pipeline.capture(driver, element=driver.find_element("id", "search"), clip=(0, 0, 1, 1))
+        assert self._written(pipeline, file_name).size == (1, 1)
+        pipeline.shutdown()
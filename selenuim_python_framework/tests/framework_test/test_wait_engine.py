@@ -0,0 +1,105 @@
+import re
+import time
+
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from common.base.selenium_base import SeleniumBase
+from common.base.wait_engine import (
+    WaitEngine, wait_metrics, ABSENT, ALL_PRESENT, CLICKABLE, PRESENT, TEXT_MATCHES, VISIBLE
+)
+from utils.fake_driver import FakeWebDriver
+
+PAGE = """
+<html><body>
+  <div class="result">Mumbai to Pune</div>
+  <div class="result">Mumbai to Goa</div>
+  <button id="hidden" style="display: none">Hidden</button>
+  <button id="disabled" disabled>Disabled</button>
+</body></html>
+"""
+
+
+class AppearingDriver(FakeWebDriver):
+    """
+    Fake driver whose #late element shows up on the given find_elements call.
+    """
+
+    def __init__(self, appears_on_poll):
+        super().__init__()
+        self.appears_on_poll = appears_on_poll
+        self.polls = 0
+        self.load_html(PAGE)
+
+    def find_elements(self, by=By.ID, value=None):
+        self.polls += 1
+        if self.polls == self.appears_on_poll:
+            self.load_html(PAGE.replace("</body>", '<span id="late">Loaded</span></body>'))
+        return super().find_elements(by, value)
+
+
+@pytest.fixture
+def driver():
+    driver = FakeWebDriver()
+    driver.load_html(PAGE)
+    return driver
+
+
+class TestWaitEngine():
+    """
+    Conditions, polling and metrics of common.base.wait_engine on the fake driver's virtual clock.
+    """
+
+    def setup_method(self):
+        wait_metrics.drain()
+
+    def test_conditions(self, driver):
+        engine = WaitEngine(driver, timeout=0)
+        assert engine.until(PRESENT, By.CLASS_NAME, "result").text == "Mumbai to Pune"
+        assert len(engine.until(ALL_PRESENT, By.CLASS_NAME, "result")) == 2
+        assert engine.until(TEXT_MATCHES, By.CLASS_NAME, "result", text=re.compile("Goa$")).text == "Mumbai to Goa"
+        assert engine.until(ABSENT, By.ID, "missing") is True
+        assert engine.check(PRESENT, By.ID, "hidden")
+        assert not engine.check(VISIBLE, By.ID, "hidden")
+        assert not engine.check(CLICKABLE, By.ID, "disabled")
+        assert not engine.check(TEXT_MATCHES, By.CLASS_NAME, "result", text="Delhi")
+
+    def test_timeout_runs_in_virtual_time(self, driver):
+        engine = WaitEngine(driver, timeout=30, poll_frequency=0.5)
+        started = time.perf_counter()
+        with pytest.raises(TimeoutException, match="Condition 'present' not met for id=missing within 30s"):
+            engine.until(PRESENT, By.ID, "missing")
+        assert time.perf_counter() - started < 5
+        metric, = wait_metrics.drain()
+        assert (metric.condition, metric.locator, metric.success) == (PRESENT, "missing", False)
+        assert metric.polls == 61
+        assert metric.elapsed == pytest.approx(30, abs=1)
+
+    def test_polls_until_the_element_appears(self):
+        driver = AppearingDriver(appears_on_poll=4)
+        engine = WaitEngine(driver, timeout=10, poll_frequency=0.5)
+        assert engine.until(PRESENT, By.ID, "late").text == "Loaded"
+        metric, = wait_metrics.drain()
+        assert (metric.polls, metric.success) == (4, True)
+        assert metric.elapsed == pytest.approx(1.5, abs=0.5)
+
+    def test_backoff_is_capped(self, driver):
+        engine = WaitEngine(driver, timeout=10, poll_frequency=0.5, backoff=2.0, max_poll_interval=2.0)
+        assert not engine.check(PRESENT, By.ID, "missing", timeout=10)
+        # Delays 0.5, 1, 2, 2, 2, 2 then the remaining 0.5s
+        assert wait_metrics.drain()[0].polls == 8
+
+    def test_settled_page(self, driver):
+        assert WaitEngine(driver).settle(quiet=0.3) == 0.0
+
+    def test_presence_checks_return_immediately(self):
+        driver = AppearingDriver(appears_on_poll=3)
+        base = SeleniumBase(driver)
+        started = driver.clock.perf_counter()
+        assert not base.is_element_present("late")
+        assert not base.element_presence_check("late", By.ID)
+        assert driver.clock.perf_counter() - started < 0.1
+        assert base.is_element_present("late", timeout=3)
+        base = SeleniumBase(AppearingDriver(appears_on_poll=10))
+        assert not base.element_presence_check("late", By.ID, timeout=3)
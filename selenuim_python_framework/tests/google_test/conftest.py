@@ -1,25 +1,18 @@
-import os
 import pytest
-from common.constants import *
-from utils.helper import ConfigUtility
-from utils.driver_utility import WebDriver
+from utils.suite_context import SuiteContext
 
 
 @pytest.fixture(scope="session")
-def configs():
+def suite_context():
     """
-    Load the configuration file once per test session.
+    Load the google suite context (config, locator folder, base URL) once per test session.
     """
-    config = ConfigUtility('google')
-    return config.load_config_file()
+    return SuiteContext.load('google')
 
 
-@pytest.fixture(scope="session", autouse=True)
-def set_env_variables(configs):
+@pytest.fixture(scope="session")
+def configs(suite_context):
     """
-    Sets environment variables for the test session.
-    Cleans up after the session ends.
+    Configuration of the google suite.
     """
-    os.environ["TEST_FOLDER"] = configs.get('PROD', 'folder')
-    yield
-    os.environ.pop("TEST_FOLDER", None)
\ No newline at end of file
+    return suite_context.config
@@ -0,0 +1,22 @@
+import os
+
+import pytest
+
+from common.constants import *
+from utils.fake_driver import FakeWebDriver
+from utils.suite_context import SuiteContext
+
+
+@pytest.fixture
+def fake_driver_for():
+    """
+    fake_driver_for(suite) returns a FakeWebDriver on the base URL of the suite,
+    served from its [PROD] fake_snapshot.
+    """
+    def create(suite):
+        context = SuiteContext.load(suite)
+        snapshot = os.path.join(PROJECT_ROOT, FIXTURE_SITES_DIR, context.config.get('PROD', 'fake_snapshot'))
+        driver = FakeWebDriver({context.base_url: snapshot})
+        driver.get(context.base_url)
+        return driver, context
+    return create
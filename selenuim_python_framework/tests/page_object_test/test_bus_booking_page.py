@@ -0,0 +1,54 @@
+import pytest
+from pages.goibibo.bus_booking_page_class import BusBooking
+
+
+class TestBusBookingPage():
+    """
+    BusBooking logic against a static DOM snapshot of the Goibibo bus search (utils.fake_driver).
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_driver_for):
+        self.driver, context = fake_driver_for('goibibo')
+        self.bus = BusBooking(self.driver, context)
+
+    def test_page_is_ready(self):
+        assert self.bus.wait_until_ready()
+        assert self.bus.title == "Bus Booking - Online Bus Ticket Booking of all Bus types at best prices"
+
+    def test_select_from_city_types_and_picks_suggestion(self):
+        assert self.bus.select_from_city("Mumbai, Maharashtra")
+        assert ("keys", "input[name=autosuggestBusSRPSrcHomeName]", "Mumbai, Maharashtra") in self.driver.events
+        assert self.driver.events[-1] == ("click", "li", "")
+        assert self.bus.get_element("autosuggestBusSRPSrcHomeName", "name").get_attribute("value") == "Mumbai, Maharashtra"
+
+    def test_select_from_city_without_suggestion_fails(self):
+        assert not self.bus.select_from_city("Atlantis")
+        assert [event for event in self.driver.events if event[0] == "click"] == [
+            ("click", "input[name=autosuggestBusSRPSrcHomeName]", "")]
+
+    def test_select_dest_city(self):
+        assert self.bus.select_dest_city("Pune, Maharashtra")
+        assert ("keys", "input#autosuggestBusSRPDestHome", "Pune, Maharashtra") in self.driver.events
+
+    def test_select_dest_city_without_input_field_fails(self):
+        self.driver.load_html("<html><body><ul><li><span>Pune, Maharashtra</span></li></ul></body></html>")
+        assert not self.bus.select_dest_city("Pune, Maharashtra")
+        assert not self.driver.events[1:]
+
+    @pytest.mark.parametrize("day", [1, 15, "31"])
+    def test_select_depart_date_formats_day_locator(self, day):
+        assert self.bus.select_depart_date(day)
+        clicks = [event for event in self.driver.events if event[0] == "click"]
+        assert clicks == [("click", "input", ""), ("click", "li", "")]
+
+    def test_select_depart_date_out_of_range_fails(self):
+        assert not self.bus.select_depart_date(32)
+
+    def test_click_search_button(self):
+        assert self.bus.click_search_button()
+        assert self.driver.events[-1] == ("click", "button#search", "")
+
+    def test_click_search_button_disabled_fails(self):
+        self.driver.load_html('<html><body><button data-testid="searchBusBtn" disabled>Search</button></body></html>')
+        assert not self.bus.click_search_button()
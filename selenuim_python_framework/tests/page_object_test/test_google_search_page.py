@@ -0,0 +1,42 @@
+import pytest
+from pages.google.google_search_page_class import GoogleSearch
+
+
+class TestGoogleSearchPage():
+    """
+    GoogleSearch logic against a static DOM snapshot of the Google search page (utils.fake_driver).
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, fake_driver_for):
+        self.driver, context = fake_driver_for('google')
+        self.search = GoogleSearch(self.driver, context)
+
+    def test_get_page_title(self):
+        assert self.search.get_page_title() == "Google"
+
+    def test_search_keyword_matching_suggestions(self):
+        assert self.search.search_keyword("selenium python")
+        assert self.search.get_element("q", "name").get_attribute("value") == "selenium python"
+
+    def test_search_keyword_replaces_the_previous_keyword(self):
+        assert self.search.search_keyword("selenium python")
+        assert self.search.search_keyword("selenium")
+        assert self.search.get_element("q", "name").get_attribute("value") == "selenium"
+
+    def test_search_keyword_unrelated_suggestion_fails(self):
+        assert not self.search.search_keyword("playwright")
+
+    def test_search_keyword_without_search_box_fails(self):
+        self.driver.load_html("<html><body><p>captcha</p></body></html>")
+        assert not self.search.search_keyword("selenium python")
+
+    def test_verify_selenium_download_search(self):
+        assert self.search.verify_selenium_download_search()
+        assert ("click", "div", "") in self.driver.events
+
+    def test_verify_selenium_download_search_without_result_fails(self):
+        self.driver.load_html('<html><body><ul role="listbox"><li><div role="option" '
+                              'aria-label="selenium python download">selenium python download</div></li></ul>'
+                              '<div id="search"><h3>Other</h3></div></body></html>')
+        assert not self.search.verify_selenium_download_search()
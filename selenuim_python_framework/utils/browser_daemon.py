@@ -0,0 +1,349 @@
+"""
+Local daemon keeping headless Chrome browsers warm across pytest invocations.
+
+Usage (from the framework root):
+    python -m utils.browser_daemon --size 3
+    pytest tests/ --browser=warm-chrome
+"""
+import argparse
+import itertools
+import json
+import logging
+import os
+import queue
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import utils.logger_utility as log_utils
+from common.constants import *
+
+log = log_utils.custom_logger(logging.INFO)
+
+DRIVER_PATHS_FILE = os.path.join(PROJECT_ROOT, DAEMON_DIR, "driver_paths.json")
+PROFILE_TEMPLATE_DIR = os.path.join(PROJECT_ROOT, DAEMON_DIR, "profile_template")
+
+CHROME_ARGS = [
+    "--headless=new",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-extensions",
+    "--window-size=1920,1080",
+]
+
+
+def resolve_binary_paths(browser="chrome", refresh=False):
+    """
+    Return the cached {'driver_path', 'browser_path'} of a browser.
+    Selenium Manager is only run when the cache is missing, stale or refresh is True.
+    """
+    cache = {}
+    if os.path.exists(DRIVER_PATHS_FILE):
+        with open(DRIVER_PATHS_FILE, encoding="utf-8") as fh:
+            cache = json.load(fh)
+    paths = cache.get(browser)
+    if refresh or not paths or not all(os.path.exists(p) for p in paths.values()):
+        from selenium.webdriver.common.selenium_manager import SeleniumManager
+        result = SeleniumManager().binary_paths(["--browser", browser])
+        paths = {"driver_path": result["driver_path"], "browser_path": result["browser_path"]}
+        cache[browser] = paths
+        os.makedirs(os.path.dirname(DRIVER_PATHS_FILE), exist_ok=True)
+        with open(DRIVER_PATHS_FILE, "w", encoding="utf-8") as fh:
+            json.dump(cache, fh, indent=2)
+        log.info(f"Pinned {browser} binaries: {paths}")
+    return paths
+
+
+def ensure_profile_template():
+    """
+    Create the Chrome profile template once; browsers get a copy of it instead of a new profile.
+    """
+    default_dir = os.path.join(PROFILE_TEMPLATE_DIR, "Default")
+    if not os.path.exists(default_dir):
+        os.makedirs(default_dir)
+        open(os.path.join(PROFILE_TEMPLATE_DIR, "First Run"), "w").close()
+        with open(os.path.join(default_dir, "Preferences"), "w", encoding="utf-8") as fh:
+            json.dump({"browser": {"has_seen_welcome_page": True},
+                       "profile": {"exit_type": "Normal", "exited_cleanly": True}}, fh)
+    return PROFILE_TEMPLATE_DIR
+
+
+def pid_alive(pid):
+    """
+    Check if a local process is still running. Always True on Windows, where signal 0
+    would terminate the process instead of probing it.
+    """
+    if os.name == "nt":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class WarmBrowser:
+    """
+    One headless Chrome process listening on a remote debugging port.
+    """
+    _ids = itertools.count(1)
+
+    def __init__(self, browser_path):
+        self.id = next(self._ids)
+        self.lease_pid = None
+        self.leased_at = None
+        self.port = _free_port()
+        self.profile_dir = os.path.join(tempfile.mkdtemp(prefix="warm_chrome_"), "profile")
+        shutil.copytree(ensure_profile_template(), self.profile_dir)
+        self.process = subprocess.Popen(
+            [browser_path, *CHROME_ARGS, f"--remote-debugging-port={self.port}",
+             f"--user-data-dir={self.profile_dir}", "about:blank"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    @property
+    def debugger_address(self):
+        return f"127.0.0.1:{self.port}"
+
+    def wait_ready(self, timeout=20):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                urllib.request.urlopen(f"http://{self.debugger_address}/json/version", timeout=1).close()
+                return True
+            except OSError:
+                time.sleep(0.1)
+        return False
+
+    def stop(self):
+        self.process.terminate()
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+        shutil.rmtree(os.path.dirname(self.profile_dir), ignore_errors=True)
+
+
+class BrowserDaemon:
+    """
+    Keeps `size` warm browsers ready. A leased browser is replaced by a fresh one
+    when it is released, so every lease starts from a clean profile copy.
+    Leases of clients that exited without releasing, or older than max_lease_seconds,
+    are reclaimed every reap_interval seconds.
+    """
+
+    def __init__(self, size=2, max_lease_seconds=3600, reap_interval=10, paths=None):
+        """
+        :param size: Number of warm browsers.
+        :param max_lease_seconds: Age after which a lease is reclaimed even if its client is alive.
+        :param reap_interval: Seconds between two checks for abandoned leases.
+        :param paths: {'driver_path', 'browser_path'}, resolved with Selenium Manager when None.
+        """
+        self.size = size
+        self.max_lease_seconds = max_lease_seconds
+        self.reap_interval = reap_interval
+        self.paths = paths or resolve_binary_paths("chrome")
+        self.ready = queue.Queue()
+        self.leased = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+
+    def _spawn(self):
+        browser = WarmBrowser(self.paths["browser_path"])
+        if browser.wait_ready():
+            self.ready.put(browser)
+        else:
+            log.error(f"Warm browser {browser.id} did not start")
+            browser.stop()
+
+    def start(self):
+        for _ in range(self.size):
+            threading.Thread(target=self._spawn, daemon=True).start()
+        threading.Thread(target=self._reap_loop, daemon=True).start()
+
+    def lease(self, pid=None):
+        """
+        :param pid: Process id of the client, its lease is reclaimed when the process exits.
+        :return: Lease dict or None when no warm browser is ready.
+        """
+        try:
+            browser = self.ready.get_nowait()
+        except queue.Empty:
+            return None
+        browser.lease_pid = pid
+        browser.leased_at = time.time()
+        with self._lock:
+            self.leased[browser.id] = browser
+        return {"id": browser.id, "debugger_address": browser.debugger_address,
+                "driver_path": self.paths["driver_path"]}
+
+    def release(self, lease_id):
+        """
+        :return: True if the lease existed, False otherwise.
+        """
+        with self._lock:
+            browser = self.leased.pop(lease_id, None)
+        if browser is None:
+            return False
+        browser.stop()
+        threading.Thread(target=self._spawn, daemon=True).start()
+        return True
+
+    def reap(self):
+        """
+        Release the leases whose client process is gone or that are older than max_lease_seconds.
+        :return: List of reclaimed lease ids.
+        """
+        now = time.time()
+        with self._lock:
+            abandoned = [lease_id for lease_id, browser in self.leased.items()
+                         if (browser.lease_pid is not None and not pid_alive(browser.lease_pid))
+                         or now - browser.leased_at > self.max_lease_seconds]
+        for lease_id in abandoned:
+            log.warning(f"Reclaiming abandoned lease {lease_id}")
+            self.release(lease_id)
+        return abandoned
+
+    def _reap_loop(self):
+        while not self._stopped.wait(self.reap_interval):
+            self.reap()
+
+    def status(self):
+        return {"ready": self.ready.qsize(), "leased": len(self.leased), "size": self.size}
+
+    def stop(self):
+        self._stopped.set()
+        with self._lock:
+            browsers = list(self.leased.values())
+            self.leased.clear()
+        while not self.ready.empty():
+            browsers.append(self.ready.get_nowait())
+        for browser in browsers:
+            browser.stop()
+
+
+def _make_handler(daemon):
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/status":
+                self._reply(200, daemon.status())
+            else:
+                self._reply(404, {"error": "not found"})
+
+        def do_POST(self):
+            url = urlsplit(self.path)
+            try:
+                if url.path == "/lease":
+                    pid = parse_qs(url.query).get("pid")
+                    lease = daemon.lease(int(pid[0]) if pid else None)
+                    self._reply(200 if lease else 503, lease or {"error": "no warm browser ready"})
+                elif url.path.startswith("/release/"):
+                    lease_id = int(url.path.rsplit("/", 1)[1])
+                    if daemon.release(lease_id):
+                        self._reply(200, {})
+                    else:
+                        self._reply(404, {"error": f"unknown lease {lease_id}"})
+                else:
+                    self._reply(404, {"error": "not found"})
+            except ValueError as e:
+                self._reply(400, {"error": f"bad request: {e}"})
+
+        def log_message(self, fmt, *args):
+            log.debug(fmt, *args)
+
+    return Handler
+
+
+class BrowserDaemonClient:
+    """
+    Client used by the driver factory. Every call fails fast so a missing
+    daemon only costs a refused local connection.
+    """
+
+    def __init__(self, host=DAEMON_HOST, port=DAEMON_PORT, timeout=0.5):
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    def _post(self, path):
+        request = urllib.request.Request(self.base_url + path, data=b"", method="POST")
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            return json.load(response)
+
+    def lease(self):
+        """
+        :return: Lease dict or None when the daemon is down or has no browser ready.
+        """
+        try:
+            return self._post(f"/lease?pid={os.getpid()}")
+        except OSError as e:
+            log.info(f"Browser daemon lease failed: {e}")
+            return None
+
+    def release(self, lease_id):
+        try:
+            self._post(f"/release/{lease_id}")
+        except OSError as e:
+            log.warning(f"Browser daemon release of {lease_id} failed: {e}")
+
+
+def release_lease(driver):
+    """
+    Return the warm browser of a driver to the daemon, no-op for cold drivers.
+    """
+    lease_id = getattr(driver, "daemon_lease_id", None)
+    if lease_id is not None:
+        BrowserDaemonClient().release(lease_id)
+        driver.daemon_lease_id = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Keep headless Chrome browsers warm for --browser=warm-chrome.")
+    parser.add_argument("--size", type=int, default=2, help="Number of warm browsers")
+    parser.add_argument("--host", default=DAEMON_HOST)
+    parser.add_argument("--port", type=int, default=DAEMON_PORT)
+    parser.add_argument("--refresh-drivers", action="store_true", help="Re-resolve the pinned driver binary")
+    parser.add_argument("--max-lease-seconds", type=int, default=3600,
+                        help="Reclaim leases older than this even if their client is still running")
+    args = parser.parse_args()
+    if args.refresh_drivers:
+        resolve_binary_paths("chrome", refresh=True)
+    daemon = BrowserDaemon(size=args.size, max_lease_seconds=args.max_lease_seconds)
+    daemon.start()
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(daemon))
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    log.info(f"Browser daemon listening on {args.host}:{args.port}")
+    print(f"Browser daemon listening on {args.host}:{args.port} with {args.size} warm browsers")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        daemon.stop()
+
+
+if __name__ == "__main__":
+    main()
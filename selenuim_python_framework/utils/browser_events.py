@@ -0,0 +1,192 @@
+import json
+import logging
+import os
+import re
+import threading
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.webdriver.common.bidi.session import Session
+
+import utils.logger_utility as log_utils
+
+LOG_ENTRY = "log.entryAdded"
+RESPONSE_COMPLETED = "network.responseCompleted"
+FETCH_ERROR = "network.fetchError"
+
+
+class _RawEvent:
+    """
+    BiDi event class for WebSocketConnection.add_callback that keeps the raw params,
+    the typed Selenium wrappers are not needed for a compact record.
+    """
+
+    def __init__(self, event_class):
+        self.event_class = event_class
+
+    def from_json(self, params):
+        return params
+
+
+def _compact(method, params):
+    """
+    Reduce a BiDi event to the fields worth keeping in a test artifact.
+    :return: Dict or None for events that are not kept (successful responses are only counted).
+    """
+    if method == LOG_ENTRY:
+        entry = {"t": params.get("timestamp"), "level": params.get("level"), "text": params.get("text")}
+        if params.get("type") == "javascript":
+            entry["kind"] = "js_error"
+            frames = (params.get("stackTrace") or {}).get("callFrames") or []
+            entry["stack"] = [f"{frame.get('functionName') or '<anonymous>'} {frame.get('url')}:"
+                              f"{frame.get('lineNumber')}:{frame.get('columnNumber')}" for frame in frames[:5]]
+        else:
+            entry["kind"] = "console"
+        return entry
+    request = params.get("request") or {}
+    entry = {"t": params.get("timestamp"), "method": request.get("method"), "url": request.get("url")}
+    if method == FETCH_ERROR:
+        entry["kind"] = "fetch_error"
+        entry["error"] = params.get("errorText")
+        return entry
+    status = (params.get("response") or {}).get("status")
+    if status is None or status < 400:
+        return None
+    entry["kind"] = "http_error"
+    entry["status"] = status
+    return entry
+
+
+class BrowserEventCapture:
+    """
+    Subscribes to browser console messages, JavaScript errors and network events through
+    WebDriver BiDi (Chrome and Firefox, needs options.enable_bidi).
+
+    Events arrive on Selenium's websocket threads and are appended to a bounded deque,
+    nothing is sent to the browser while tests run, so WebDriver commands are not slowed
+    down. Once the buffer is full the oldest events are dropped and counted.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, driver, max_events=500):
+        self.driver = driver
+        self._events = deque(maxlen=max_events)
+        self._counts = Counter()
+        self._lock = threading.Lock()
+        self._callbacks = []
+        self.active = False
+
+    @classmethod
+    def attach(cls, driver, max_events=500):
+        """
+        Start capturing on a driver once, pooled drivers keep their capture between classes.
+        :return: The BrowserEventCapture of the driver, None if the driver has no BiDi connection.
+        """
+        capture = getattr(driver, "event_capture", None)
+        if capture is None:
+            capture = cls(driver, max_events)
+            driver.event_capture = capture if capture.start() else False
+        return driver.event_capture or None
+
+    def start(self):
+        """
+        Subscribe to the log and network events.
+        :return: True if the capture is active.
+        """
+        if not getattr(self.driver, "caps", {}).get("webSocketUrl"):
+            self.log.debug("Driver session has no BiDi websocket, browser events are not captured")
+            return False
+        try:
+            if not self.driver._websocket_connection:
+                self.driver._start_bidi()
+            connection = self.driver._websocket_connection
+            for method in (LOG_ENTRY, RESPONSE_COMPLETED, FETCH_ERROR):
+                event = _RawEvent(method)
+                self._callbacks.append((event, connection.add_callback(event, self._handler(method))))
+            connection.execute(Session(connection).subscribe(LOG_ENTRY, RESPONSE_COMPLETED, FETCH_ERROR))
+            self.active = True
+        except Exception as e:
+            self.log.warning(f"Failed to subscribe to BiDi browser events. Exception: {e}")
+            self.stop()
+        return self.active
+
+    def _handler(self, method):
+        def on_event(params):
+            entry = _compact(method, params)
+            with self._lock:
+                self._counts[method] += 1
+                if entry is None:
+                    return
+                if len(self._events) == self._events.maxlen:
+                    self._counts["dropped"] += 1
+                self._events.append(entry)
+        return on_event
+
+    def drain(self):
+        """
+        Return and reset the events and counters collected since the previous drain.
+        :return: Tuple (list of event dicts, dict of counters).
+        """
+        with self._lock:
+            events = list(self._events)
+            self._events.clear()
+            counts, self._counts = dict(self._counts), Counter()
+        return events, counts
+
+    def stop(self):
+        connection = getattr(self.driver, "_websocket_connection", None)
+        if connection is None:
+            return
+        for event, callback_id in self._callbacks:
+            connection.remove_callback(event, callback_id)
+        self._callbacks = []
+        if self.active:
+            try:
+                connection.execute(Session(connection).unsubscribe(LOG_ENTRY, RESPONSE_COMPLETED, FETCH_ERROR))
+            except Exception as e:
+                self.log.debug(f"Failed to unsubscribe from browser events: {e}")
+            self.active = False
+
+
+class EventArtifacts:
+    """
+    Writes the browser events of every test as a compact JSON file on a background thread.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="browser-events")
+
+    def write(self, nodeid, events, counts):
+        """
+        :return: The artifact path, known before the file is written.
+        """
+        name = re.sub(r"[^\w.-]+", "_", nodeid).strip("_")[-150:] + ".json"
+        path = os.path.join(self.directory, name)
+        self._executor.submit(self._dump, path, {"test": nodeid, "counts": counts, "events": events})
+        return path
+
+    def _dump(self, path, content):
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(content, fh, separators=(",", ":"))
+
+    def shutdown(self):
+        """
+        Wait for the pending writes.
+        """
+        self._executor.shutdown(wait=True)
+
+
+def summarize(events, counts):
+    """
+    :return: Dict of counters for the test report.
+    """
+    kinds = Counter(event["kind"] for event in events)
+    return {
+        "console_messages": kinds["console"],
+        "js_errors": kinds["js_error"],
+        "http_errors": kinds["http_error"] + kinds["fetch_error"],
+        "responses": counts.get(RESPONSE_COMPLETED, 0),
+        "dropped_events": counts.get("dropped", 0),
+    }
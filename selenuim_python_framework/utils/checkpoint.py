@@ -0,0 +1,126 @@
+import json
+import logging
+import os
+import re
+import threading
+import time
+
+import pytest
+
+import utils.logger_utility as log_utils
+from common.base import scripts
+
+# Cookie fields accepted by driver.add_cookie
+_COOKIE_FIELDS = ("name", "value", "path", "domain", "secure", "httpOnly", "expiry", "sameSite")
+
+
+def checkpoint_scope(item):
+    """
+    Checkpoints are named per test class (or module) node id, classes of the same name
+    in different modules do not share them.
+    """
+    node = item.getparent(pytest.Class) or item.getparent(pytest.Module)
+    return node.nodeid
+
+
+class CheckpointError(RuntimeError):
+    """
+    Raised when a checkpoint does not exist or cannot be restored.
+    """
+
+
+class CheckpointStore:
+    """
+    Named browser state checkpoints: URL, cookies, localStorage/sessionStorage and
+    form field values. Checkpoints are kept in memory and persisted as JSON under
+    <directory>/<scope>/<name>.json. Only checkpoints captured in this session are
+    restored, unless from_disk opts in to the ones saved by an earlier run (isolated reruns).
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, directory, from_disk=False):
+        """
+        :param directory: Folder the checkpoints are persisted to.
+        :param from_disk: Load checkpoints not captured in this session from the folder.
+        """
+        self.directory = directory
+        self.from_disk = from_disk
+        self._checkpoints = {}
+        self._lock = threading.Lock()
+
+    def _path(self, scope, name):
+        safe = lambda value: re.sub(r"[^\w.-]+", "_", value)
+        return os.path.join(self.directory, safe(scope), f"{safe(name)}.json")
+
+    def capture(self, driver, scope, name):
+        """
+        Capture the current browser state as checkpoint `name` of `scope` (e.g. the test class).
+        :return: The checkpoint dict.
+        """
+        state = driver.execute_script(scripts.CAPTURE_STATE) or {}
+        checkpoint = {
+            "name": name,
+            "created": time.time(),
+            "url": state.get("url") or driver.current_url,
+            "cookies": [{k: c[k] for k in _COOKIE_FIELDS if k in c} for c in driver.get_cookies()],
+            "local_storage": state.get("local_storage", {}),
+            "session_storage": state.get("session_storage", {}),
+            "fields": state.get("fields", []),
+        }
+        path = self._path(scope, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(checkpoint, fh, indent=1)
+        with self._lock:
+            self._checkpoints[(scope, name)] = checkpoint
+        self.log.info(f"Checkpoint '{name}' of {scope} captured at {checkpoint['url']}")
+        return checkpoint
+
+    def load(self, scope, name):
+        """
+        :return: The checkpoint dict, from memory or, with from_disk, from an earlier run.
+        :raises CheckpointError: if the checkpoint was not captured.
+        """
+        with self._lock:
+            checkpoint = self._checkpoints.get((scope, name))
+        if checkpoint is not None:
+            return checkpoint
+        if not self.from_disk:
+            raise CheckpointError(f"No checkpoint '{name}' for {scope} captured in this session, "
+                                  f"use --checkpoints-from-disk to restore the one of an earlier run")
+        path = self._path(scope, name)
+        if not os.path.exists(path):
+            raise CheckpointError(f"No checkpoint '{name}' for {scope}, run the step that captures it first")
+        with open(path, encoding="utf-8") as fh:
+            checkpoint = json.load(fh)
+        with self._lock:
+            self._checkpoints[(scope, name)] = checkpoint
+        return checkpoint
+
+    def restore(self, driver, scope, name):
+        """
+        Bring the driver to checkpoint `name` in one shot: open its origin, replace cookies
+        and web storage, load its URL and refill the form fields.
+        :return: Seconds spent restoring.
+        :raises CheckpointError: if the checkpoint does not exist or cannot be applied.
+        """
+        checkpoint = self.load(scope, name)
+        start = time.perf_counter()
+        try:
+            # Cookies and storage can only be set for the origin of the current document
+            driver.get(checkpoint["url"])
+            driver.delete_all_cookies()
+            for cookie in checkpoint["cookies"]:
+                try:
+                    driver.add_cookie(cookie)
+                except Exception as e:
+                    self.log.warning(f"Cookie {cookie.get('name')} of checkpoint '{name}' not restored: {e}")
+            driver.execute_script(scripts.RESTORE_STATE, checkpoint["local_storage"],
+                                  checkpoint["session_storage"], [])
+            driver.get(checkpoint["url"])
+            restored = driver.execute_script(scripts.RESTORE_STATE, None, None, checkpoint["fields"])
+        except Exception as e:
+            raise CheckpointError(f"Failed to restore checkpoint '{name}' of {scope}: {e}") from e
+        elapsed = time.perf_counter() - start
+        self.log.info(f"Restored checkpoint '{name}' of {scope} ({restored} fields) in {elapsed:.3f}s")
+        return elapsed
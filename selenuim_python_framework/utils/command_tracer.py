@@ -0,0 +1,176 @@
+import html
+import json
+import os
+import sys
+import sysconfig
+import threading
+import time
+from collections import namedtuple
+
+TraceEvent = namedtuple("TraceEvent", "name category start duration caller locator test thread")
+
+# Frames from these directories (stdlib, installed packages, framework base and utils) are internals,
+# the caller is the first frame outside them: a page-object method or the test itself
+_INTERNAL_DIRS = tuple(
+    os.path.normcase(os.path.abspath(path)) + os.sep for path in (
+        sysconfig.get_paths()["stdlib"],
+        sysconfig.get_paths()["purelib"],
+        sysconfig.get_paths()["platlib"],
+        os.path.join(os.path.dirname(os.path.dirname(__file__)), "common", "base"),
+        os.path.dirname(__file__),
+    )
+)
+
+
+class CommandTracer:
+    """
+    Records every WebDriver command round trip (plus driver startup and explicit waits)
+    with its duration, the calling page-object method or test and the locator.
+    Events are kept in memory and exported once as Chrome trace-event JSON
+    (chrome://tracing, https://ui.perfetto.dev).
+
+    Overhead per command is one perf_counter pair, a bounded frame walk with a
+    per-code-object cache and a list append. Once max_events are kept, the oldest
+    quarter is dropped (and counted) so long sessions stay at bounded memory.
+    """
+
+    def __init__(self, max_depth=30, max_events=200000):
+        self.enabled = True
+        self.max_depth = max_depth
+        self.max_events = max_events
+        self.test = None
+        self.dropped = 0
+        self._events = []
+        self._drained = 0
+        self._internal = {}
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def instrument(self, driver):
+        """
+        Wrap driver.execute, the single entry point of every WebDriver command.
+        """
+        if getattr(driver, "_traced", False):
+            return driver
+        execute = driver.execute
+        tracer = self
+
+        def traced_execute(driver_command, params=None):
+            if not tracer.enabled:
+                return execute(driver_command, params)
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                locator = params.get("value") if params and "using" in params else None
+                tracer._add(driver_command, "command", start, time.perf_counter() - start, locator)
+
+        driver.execute = traced_execute
+        driver._traced = True
+        return driver
+
+    def add_span(self, name, category, start, duration=None, locator=None):
+        """
+        Record a span that is not a single command, e.g. a driver launch or an explicit wait.
+        :param start: time.perf_counter() at the start of the span.
+        :param duration: Duration in seconds, defaults to now - start.
+        """
+        if self.enabled:
+            duration = time.perf_counter() - start if duration is None else duration
+            self._add(name, category, start, duration, locator)
+
+    def _add(self, name, category, start, duration, locator):
+        event = TraceEvent(name, category, start, duration, self._caller(), locator, self.test,
+                           threading.get_ident())
+        with self._lock:
+            if len(self._events) >= self.max_events:
+                count = max(1, self.max_events // 4)
+                del self._events[:count]
+                self._drained = max(0, self._drained - count)
+                self.dropped += count
+            self._events.append(event)
+
+    def _caller(self):
+        frame = sys._getframe(3)
+        for _ in range(self.max_depth):
+            if frame is None:
+                break
+            code = frame.f_code
+            internal = self._internal.get(code)
+            if internal is None:
+                filename = os.path.normcase(os.path.abspath(code.co_filename))
+                internal = self._internal[code] = filename.startswith(_INTERNAL_DIRS)
+            if not internal:
+                # co_qualname is new in Python 3.11
+                return getattr(code, "co_qualname", code.co_name)
+            frame = frame.f_back
+        return ""
+
+    def drain(self):
+        """
+        Return the events recorded since the previous drain. Events stay in the trace.
+        """
+        with self._lock:
+            events = self._events[self._drained:]
+            self._drained += len(events)
+        return events
+
+    def export(self, path):
+        """
+        Write every recorded event as Chrome trace-event JSON.
+        :return: The trace file path.
+        """
+        pid = os.getpid()
+        with self._lock:
+            events = list(self._events)
+        trace = [
+            {
+                "name": event.name,
+                "cat": event.category,
+                "ph": "X",
+                "ts": round((event.start - self._origin) * 1e6, 1),
+                "dur": round(event.duration * 1e6, 1),
+                "pid": pid,
+                "tid": event.thread,
+                "args": {"caller": event.caller, "locator": event.locator, "test": event.test},
+            }
+            for event in events
+        ]
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms", "otherData": {"dropped_events": self.dropped}},
+                      fh)
+        return path
+
+
+def summarize(events, top=5):
+    """
+    Per-test summary of trace events.
+    :return: Dict with round_trips, command_seconds, wait_seconds, startup_seconds and the top slow commands.
+    """
+    commands = [event for event in events if event.category == "command"]
+    return {
+        "round_trips": len(commands),
+        "command_seconds": round(sum(event.duration for event in commands), 3),
+        "wait_seconds": round(sum(event.duration for event in events if event.category == "wait"), 3),
+        "startup_seconds": round(sum(event.duration for event in events if event.category == "driver"), 3),
+        "slowest": sorted(commands, key=lambda event: event.duration, reverse=True)[:top],
+    }
+
+
+def summary_html(summary):
+    """
+    HTML table of a summary for the pytest-html report.
+    """
+    rows = "".join(
+        f"<tr><td>{html.escape(event.name)}</td><td>{html.escape(event.caller)}</td>"
+        f"<td>{html.escape(str(event.locator or ''))}</td><td>{event.duration * 1000:.1f}</td></tr>"
+        for event in summary["slowest"])
+    return (
+        f"<div><p>WebDriver round trips: {summary['round_trips']}, command time: {summary['command_seconds']}s, "
+        f"wait time: {summary['wait_seconds']}s, driver startup: {summary['startup_seconds']}s</p>"
+        f"<table><tr><th>Command</th><th>Caller</th><th>Locator</th><th>ms</th></tr>{rows}</table></div>"
+    )
+
+
+command_trace = CommandTracer()
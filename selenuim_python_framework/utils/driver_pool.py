@@ -0,0 +1,181 @@
+import logging
+import threading
+from collections import defaultdict
+from urllib.parse import urlsplit
+
+import utils.logger_utility as log_utils
+from utils.browser_daemon import release_lease
+from utils.driver_utility import WebDriver, page_load_strategy
+from utils.grid_executor import release_session
+from utils.network_filter import NetworkPolicy
+
+
+class DriverPool:
+    """
+    Session wide pool of warm WebDriver instances.
+    Drivers are keyed by (browser, headless mode, page load strategy, network policy, proxy)
+    and reset between test classes instead of being quit and relaunched.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, max_size=2, max_reuses=50, proxy=None, limits=None):
+        """
+        :param max_size: Maximum number of idle drivers kept warm, 0 disables pooling.
+        :param max_reuses: Number of test classes a driver may serve before it is quit.
+        :param proxy: host:port of the HAR proxy every driver of the pool is routed through.
+        :param limits: utils.resource_monitor.ResourceLimits, a driver crossing one is quit instead of reused.
+        """
+        self.max_size = max_size
+        self.max_reuses = max_reuses
+        self.proxy = proxy
+        self.limits = limits
+        self._idle = defaultdict(list)
+        self._in_use = {}
+        self._uses = {}
+        self._lock = threading.Lock()
+
+    def pool_key(self, browser, config):
+        policy = NetworkPolicy.from_config(config)
+        return (browser, config.get("PROD", "headless_mode", fallback="false"), page_load_strategy(config),
+                policy.key if policy else None, self.proxy)
+
+    def _idle_count(self):
+        return sum(len(drivers) for drivers in self._idle.values())
+
+    def acquire(self, browser, config):
+        """
+        Return a warm driver for the browser/options combination, launching one if none is idle.
+        :param browser: Browser name from the --browser option.
+        :param config: Suite ConfigParser instance.
+        :return: WebDriver instance
+        """
+        key = self.pool_key(browser, config)
+        with self._lock:
+            driver = self._idle[key].pop() if self._idle[key] else None
+        if driver is None:
+            self.log.info(f"Launching new driver for {key}")
+            driver = WebDriver(browser, config, self.proxy).create_driver()
+        else:
+            self.log.info(f"Reusing warm driver for {key}")
+        with self._lock:
+            self._uses.setdefault(id(driver), 0)
+            self._in_use[id(driver)] = key
+        return driver
+
+    def release(self, driver):
+        """
+        Hand a driver back to the pool. It is reset and kept warm, or quit when
+        it has reached max_reuses, crossed a resource limit, the pool is full or the reset fails.
+        :param driver: Driver previously returned by acquire.
+        """
+        with self._lock:
+            key = self._in_use.pop(id(driver), None)
+            uses = self._uses.get(id(driver), 0) + 1
+            self._uses[id(driver)] = uses
+            keep = key is not None and uses < self.max_reuses and self._idle_count() < self.max_size
+        monitor = getattr(driver, "resource_monitor", None)
+        if monitor is not None:
+            # Sampled before the reset, while the page of the class is still loaded
+            reason = monitor.check(self.limits)
+            if keep and reason:
+                self.log.info(f"Recycling driver for {key} after {uses} classes: {reason}")
+                keep = False
+        if keep and self.reset(driver):
+            with self._lock:
+                if self._idle_count() < self.max_size:
+                    self._idle[key].append(driver)
+                    return
+        self._quit(driver)
+
+    def reset(self, driver):
+        """
+        Bring a driver back to a clean state: single window on about:blank,
+        no cookies and no web storage.
+        :return: True if the driver was reset successfully, False otherwise, including
+                 drivers whose cookies of other origins cannot be cleared.
+        """
+        try:
+            origins = set()
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                origins |= self._visited_origins(driver)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            origins |= self._visited_origins(driver)
+            # Storage access throws a SecurityError on opaque origins (about:blank, data:)
+            driver.execute_script("try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}")
+            driver.delete_all_cookies()
+            if not self._clear_browser_data(driver, origins):
+                self.log.info("Cookies of other origins cannot be cleared on this driver, it will be quit")
+                return False
+            driver.get("about:blank")
+            return True
+        except Exception as e:
+            self.log.warning(f"Failed to reset driver, it will be quit. Exception: {e}")
+            return False
+
+    @staticmethod
+    def _visited_origins(driver):
+        """
+        Origins in the navigation history of the current window (Chromium only), link clicks
+        and redirects included.
+        :return: Set of scheme://host[:port] strings.
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return set()
+        try:
+            entries = driver.execute_cdp_cmd("Page.getNavigationHistory", {})["entries"]
+        except Exception:
+            return set()
+        origins = set()
+        for entry in entries:
+            parts = urlsplit(entry.get("url", ""))
+            if parts.scheme in ("http", "https") and parts.netloc:
+                origins.add(f"{parts.scheme}://{parts.netloc}")
+        return origins
+
+    def _clear_browser_data(self, driver, origins):
+        """
+        delete_all_cookies and the storage script only cover the current page. Chromium drivers
+        clear every cookie and the storage of every visited origin through CDP, other drivers
+        clear every cookie through BiDi storage.deleteCookies.
+        :return: True if no cookie of any origin is left, False if the driver cannot tell.
+        """
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+                for origin in sorted(origins):
+                    driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+                return True
+            if getattr(driver, "caps", {}).get("webSocketUrl"):
+                driver.storage.delete_cookies()
+                return True
+        except Exception as e:
+            self.log.warning(f"Failed to clear the browser data of other origins. Exception: {e}")
+            return False
+        return getattr(driver, "clears_every_origin", False)
+
+    def _quit(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+        if getattr(driver, "network_blocker", None):
+            driver.network_blocker.stop()
+        if getattr(driver, "event_capture", None):
+            driver.event_capture.stop()
+        try:
+            driver.quit()
+        except Exception as e:
+            self.log.warning(f"Failed to quit driver. Exception: {e}")
+        release_lease(driver)
+        release_session(driver)
+
+    def close_all(self):
+        """
+        Quit every idle driver, called at the end of the session.
+        """
+        with self._lock:
+            drivers = [driver for idle in self._idle.values() for driver in idle]
+            self._idle.clear()
+        for driver in drivers:
+            self._quit(driver)
@@ -1,21 +1,59 @@
 import logging
+import os
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.common.proxy import Proxy, ProxyType
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 import utils.logger_utility as log_utils
+from common.constants import *
+from utils.command_tracer import command_trace
+from utils.browser_daemon import BrowserDaemonClient
+from utils.fake_driver import FakeWebDriver
+from utils.grid_executor import GridExecutor
+from utils.network_filter import NetworkBlocker, NetworkPolicy
+from utils.resource_monitor import ResourceMonitor
 import tempfile
+import time
+
+
+def page_load_strategy(config):
+    """
+    Page load strategy of a suite: normal (default), eager or none.
+    """
+    strategy = config.get("PROD", "page_load_strategy", fallback="normal").strip().lower()
+    if strategy not in ("normal", "eager", "none"):
+        raise ValueError(f"Unsupported page_load_strategy: {strategy}")
+    return strategy
+
 
 class WebDriver:
 
     log = log_utils.custom_logger(logging.INFO)
-    def __init__(self, browser,config):
+    def __init__(self, browser,config, proxy=None):
+        """
+        :param proxy: host:port of the utils.har_proxy the browser is routed through, None for direct traffic.
+        """
         self.browser = browser
         self.config = config
+        self.proxy = proxy
+        self.network_policy = NetworkPolicy.from_config(config)
+        self.page_load_strategy = page_load_strategy(config)
 
-    def get_web_driver_instance(self):
+    def create_driver(self):
+        """
+        Launch a new browser session without navigating anywhere.
+        :return: WebDriver instance
+        """
+        started = time.perf_counter()
         driver = None
         if self.browser == "firefox":
             firefox_options = FirefoxOptions()
+            firefox_options.page_load_strategy = self.page_load_strategy
+            # BiDi websocket for utils.browser_events (console, JavaScript errors, network)
+            firefox_options.enable_bidi = True
+            self._apply_network_policy(firefox_options)
+            self._apply_proxy(firefox_options)
             if self.config.get("PROD","headless_mode") == "true":
                 firefox_options.add_argument("--headless")
                 driver = webdriver.Firefox(options=firefox_options)
@@ -23,6 +61,10 @@ class WebDriver:
                 driver = webdriver.Firefox(options=firefox_options)
         elif self.browser == "chrome":
             chrome_options = ChromeOptions()
+            chrome_options.page_load_strategy = self.page_load_strategy
+            chrome_options.enable_bidi = True
+            self._apply_network_policy(chrome_options)
+            self._apply_proxy(chrome_options)
             if self.config.get("PROD","headless_mode") == "true":
                 chrome_options.add_argument("--headless=new")
                 # Optional but safe if user-data-dir is needed
@@ -34,19 +76,121 @@ class WebDriver:
                     "user-agent=Mozilla/5.0 (Windows NT 6.1; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/84.0.4147.125 Safari/537.36")
                 driver = webdriver.Chrome(options=chrome_options)
             else:
-                driver = webdriver.Chrome()
+                driver = webdriver.Chrome(options=chrome_options)
+        elif self.browser == "warm-chrome":
+            # Warm browsers are already running and cannot be routed through the proxy
+            driver = None if self.proxy else self._attach_warm_chrome()
+            if driver is None:
+                self.log.warning("Browser daemon not available, falling back to a cold Chrome launch")
+                return WebDriver("chrome", self.config, self.proxy).create_driver()
+        elif self.browser == "fake":
+            driver = self._create_fake_driver()
+        elif self.browser in ("dockerfirefox", "dockerchrome") and self.proxy:
+            raise ValueError(f"{self.browser} cannot reach the local HAR proxy, use --network-mode=live")
         elif self.browser == "dockerfirefox":
-            driver = webdriver.Remote(
-                command_executor='http://localhost:4444/wd/hub',
-                options=FirefoxOptions()
-            )
+            firefox_options = FirefoxOptions()
+            firefox_options.page_load_strategy = self.page_load_strategy
+            firefox_options.enable_bidi = True
+            self._apply_network_policy(firefox_options)
+            driver = GridExecutor.for_config(self.config).create_session(firefox_options, self._create_local_node_driver)
         elif self.browser == "dockerchrome":
-            driver = webdriver.Remote(
-                command_executor='http://localhost:4444/wd/hub',
-                options=ChromeOptions()
-            )
-        driver.implicitly_wait(3)
+            chrome_options = ChromeOptions()
+            chrome_options.page_load_strategy = self.page_load_strategy
+            chrome_options.enable_bidi = True
+            self._apply_network_policy(chrome_options)
+            driver = GridExecutor.for_config(self.config).create_session(chrome_options, self._create_local_node_driver)
+        command_trace.add_span(f"driver_startup:{self.browser}", "driver", started)
+        command_trace.instrument(driver)
+        # Waits are explicit through common.base.wait_engine.WaitEngine
+        driver.implicitly_wait(0)
         driver.maximize_window()
+        driver.network_blocker = None
+        if self.network_policy and self.browser != "fake":
+            blocker = NetworkBlocker(driver, self.network_policy)
+            if blocker.start():
+                driver.network_blocker = blocker
+            else:
+                self.log.warning(f"[NETWORK] policy is not enforced on {self.browser}, no request is blocked")
+        driver.resource_monitor = ResourceMonitor(driver)
+        return driver
+
+    def _create_fake_driver(self):
+        """
+        In-process driver over HTML snapshots (utils.fake_driver). The suite base URL is
+        served from [PROD] fake_snapshot, a path relative to the fixture sites folder.
+        """
+        url_map = {}
+        snapshot = self.config.get("PROD", "fake_snapshot", fallback="")
+        if snapshot:
+            url_map[self.config.get("PROD", "baseURL")] = os.path.join(PROJECT_ROOT, FIXTURE_SITES_DIR, snapshot)
+        return FakeWebDriver(url_map)
+
+    def _create_local_node_driver(self, browser, options):
+        """
+        Local driver standing in for a grid node ([GRID] endpoint 'local' or 'local:fake').
+        """
+        if browser == "fake":
+            return self._create_fake_driver()
+        if isinstance(options, ChromeOptions):
+            return webdriver.Chrome(options=options)
+        return webdriver.Firefox(options=options)
+
+    def _apply_network_policy(self, options):
+        """
+        Enable BiDi for request interception and switch images off at the browser level
+        when the suite [NETWORK] policy asks for it.
+        """
+        if not self.network_policy:
+            return
+        options.enable_bidi = True
+        # A warm browser keeps the profile it was started with, its images are blocked by interception
+        if not self.network_policy.images and not getattr(options, "debugger_address", None):
+            if isinstance(options, ChromeOptions):
+                options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            else:
+                options.set_preference("permissions.default.image", 2)
+
+    def _apply_proxy(self, options):
+        """
+        Route all browser traffic, including localhost, through the HAR proxy.
+        The proxy terminates TLS with a self-signed certificate.
+        """
+        if not self.proxy:
+            return
+        options.accept_insecure_certs = True
+        if isinstance(options, ChromeOptions):
+            options.add_argument(f"--proxy-server=http://{self.proxy}")
+            options.add_argument("--proxy-bypass-list=<-loopback>")
+        else:
+            options.proxy = Proxy({"proxyType": ProxyType.MANUAL, "httpProxy": self.proxy, "sslProxy": self.proxy})
+            options.set_preference("network.proxy.allow_hijacking_localhost", True)
+
+    def _attach_warm_chrome(self):
+        """
+        Attach to a pre-warmed headless Chrome of utils.browser_daemon.
+        The pinned chromedriver path skips Selenium Manager resolution.
+        :return: WebDriver instance or None when the daemon is down or busy.
+        """
+        lease = BrowserDaemonClient().lease()
+        if not lease:
+            return None
+        chrome_options = ChromeOptions()
+        chrome_options.page_load_strategy = self.page_load_strategy
+        chrome_options.debugger_address = lease["debugger_address"]
+        chrome_options.enable_bidi = True
+        self._apply_network_policy(chrome_options)
+        try:
+            driver = webdriver.Chrome(service=ChromeService(executable_path=lease["driver_path"]),
+                                      options=chrome_options)
+        except Exception as e:
+            self.log.error(f"Failed to attach to warm browser {lease['debugger_address']}. Exception: {e}")
+            BrowserDaemonClient().release(lease["id"])
+            return None
+        driver.daemon_lease_id = lease["id"]
+        return driver
+
+    def get_web_driver_instance(self):
+        driver = self.create_driver()
         base_url = self.config.get('PROD', 'baseURL')
         driver.get(base_url)
         return driver
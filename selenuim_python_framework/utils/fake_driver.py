@@ -0,0 +1,509 @@
+import base64
+import logging
+import os
+import re
+import time
+from urllib.parse import urljoin, urlsplit
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+import utils.logger_utility as log_utils
+from common.base import scripts
+from common.constants import *
+
+try:
+    from lxml import html as lxml_html
+except ImportError:  # lxml is only needed for --browser=fake
+    lxml_html = None
+
+_ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+# 1x1 transparent PNG returned for screenshots
+_BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII=")
+# Selenium Keys are private use code points (ENTER, TAB, ...), they never reach the field value
+_SPECIAL_KEYS = re.compile("[\ue000-\uf8ff]")
+_HIDDEN_STYLE = re.compile(r"(display\s*:\s*none|visibility\s*:\s*hidden)", re.I)
+_NON_RENDERED = {"head", "script", "style", "template", "title", "meta", "link", "noscript"}
+
+# SeleniumBase locator types -> By, for the BULK_SNAPSHOT script
+_LOCATOR_TYPES = {"id": By.ID, "name": By.NAME, "xpath": By.XPATH, "css": By.CSS_SELECTOR,
+                  "class": By.CLASS_NAME, "link": By.LINK_TEXT}
+
+
+class VirtualClock:
+    """
+    Clock of the fake driver used by common.base.wait_engine.WaitEngine: sleeping only moves
+    virtual time forward, so waits for elements that never appear on a static snapshot time
+    out without blocking the test.
+    """
+
+    def __init__(self):
+        self._offset = 0.0
+
+    def perf_counter(self):
+        return time.perf_counter() + self._offset
+
+    def sleep(self, seconds):
+        self._offset += max(0.0, seconds)
+
+
+def _find(node, by, value):
+    """
+    Resolve a Selenium locator against an lxml node.
+    :return: List of lxml elements in document order.
+    """
+    if by == By.ID:
+        return node.xpath(".//*[@id=$v]", v=value)
+    if by == By.NAME:
+        return node.xpath(".//*[@name=$v]", v=value)
+    if by == By.CLASS_NAME:
+        return node.xpath(".//*[contains(concat(' ', normalize-space(@class), ' '), $v)]", v=f" {value} ")
+    if by == By.TAG_NAME:
+        return node.xpath(f".//{value}") if re.fullmatch(r"[\w-]+", value) else []
+    if by in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        links = node.xpath(".//a")
+        if by == By.LINK_TEXT:
+            return [a for a in links if _visible_text(a) == value]
+        return [a for a in links if value in _visible_text(a)]
+    if by == By.CSS_SELECTOR:
+        try:
+            return node.cssselect(value)
+        except ImportError as e:
+            raise WebDriverException("CSS selectors need the cssselect package") from e
+        except Exception as e:
+            raise WebDriverException(f"invalid selector: {value}: {e}") from e
+    if by == By.XPATH:
+        try:
+            result = node.xpath(value)
+        except Exception as e:
+            raise WebDriverException(f"invalid selector: {value}: {e}") from e
+        return [item for item in result if hasattr(item, "tag") and isinstance(item.tag, str)]
+    raise WebDriverException(f"Unsupported locator strategy: {by}")
+
+
+def _is_displayed(node):
+    if node.tag == "input" and (node.get("type") or "").lower() == "hidden":
+        return False
+    while node is not None:
+        if node.tag in _NON_RENDERED or node.get("hidden") is not None \
+                or _HIDDEN_STYLE.search(node.get("style") or ""):
+            return False
+        node = node.getparent()
+    return True
+
+
+def _visible_text(node):
+    """
+    Whitespace normalized text of the rendered descendants, like WebElement.text.
+    """
+    if not _is_displayed(node):
+        return ""
+    parts = []
+
+    def walk(current):
+        if current.text and _is_displayed(current):
+            parts.append(current.text)
+        for child in current:
+            if isinstance(child.tag, str) and child.tag not in _NON_RENDERED and _is_displayed(child):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+    walk(node)
+    return " ".join(" ".join(parts).split())
+
+
+class FakeWebElement(WebElement):
+    """
+    WebElement over an lxml node. Interactions update the DOM state (value, checked)
+    and are recorded in the driver's events list; no JavaScript runs.
+    """
+
+    def __init__(self, driver, node, id_):
+        super().__init__(driver, id_)
+        self.node = node
+
+    @property
+    def tag_name(self):
+        return self.node.tag
+
+    @property
+    def text(self):
+        return _visible_text(self.node)
+
+    @property
+    def rect(self):
+        return {"x": 0, "y": 0, "width": 0, "height": 0}
+
+    @property
+    def location(self):
+        return {"x": 0, "y": 0}
+
+    @property
+    def size(self):
+        return {"width": 0, "height": 0}
+
+    def get_attribute(self, name):
+        if name == "value" and self.node.tag == "textarea" and "value" not in self.node.attrib:
+            return self.node.text_content()
+        if name in ("innerText", "textContent"):
+            return self.text if name == "innerText" else self.node.text_content()
+        return self.node.get(name)
+
+    def get_dom_attribute(self, name):
+        return self.node.get(name)
+
+    def get_property(self, name):
+        return self.get_attribute(name)
+
+    def value_of_css_property(self, property_name):
+        match = re.search(rf"{re.escape(property_name)}\s*:\s*([^;]+)", self.node.get("style") or "")
+        return match.group(1).strip() if match else ""
+
+    def is_displayed(self):
+        return _is_displayed(self.node)
+
+    def is_enabled(self):
+        return self.node.get("disabled") is None
+
+    def is_selected(self):
+        return self.node.get("checked") is not None or self.node.get("selected") is not None
+
+    def click(self):
+        self._parent._click(self)
+
+    def send_keys(self, *value):
+        self._parent._type(self, "".join(str(v) for v in value))
+
+    def clear(self):
+        self._parent._set_value(self, "")
+        self._parent.events.append(("clear", self.describe(), ""))
+
+    def submit(self):
+        self._parent.events.append(("submit", self.describe(), ""))
+
+    def find_element(self, by=By.ID, value=None):
+        return self._parent._first(self.node, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._parent._wrap_all(_find(self.node, by, value))
+
+    @property
+    def screenshot_as_png(self):
+        return _BLANK_PNG
+
+    def describe(self):
+        """
+        Short description of the element for the events list: tag#id[name].
+        """
+        node = self.node
+        desc = node.tag
+        if node.get("id"):
+            desc += f"#{node.get('id')}"
+        if node.get("name"):
+            desc += f"[name={node.get('name')}]"
+        return desc
+
+
+class _SwitchTo:
+
+    def __init__(self, driver):
+        self._driver = driver
+
+    def window(self, handle):
+        if handle not in self._driver.window_handles:
+            raise WebDriverException(f"no such window: {handle}")
+
+    def default_content(self):
+        pass
+
+
+class FakeWebDriver:
+    """
+    In-process stand-in for a WebDriver over static HTML snapshots, selected with
+    --browser=fake. Supports the WebDriver subset used by SeleniumBase, the page
+    objects and the driver pool.
+
+    URLs are resolved through url_map first (base URL -> snapshot file), then
+    relative to the fixture sites folder by URL path.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+    # A single cookie jar for every origin, delete_all_cookies leaves no cookie behind
+    clears_every_origin = True
+
+    def __init__(self, url_map=None, root=None):
+        """
+        :param url_map: Dict of URL -> snapshot file path.
+        :param root: Folder URL paths are resolved against, defaults to the fixture sites.
+        """
+        if lxml_html is None:
+            raise WebDriverException("--browser=fake needs the lxml package")
+        self.url_map = dict(url_map or {})
+        self.root = root or os.path.join(PROJECT_ROOT, FIXTURE_SITES_DIR)
+        self.events = []
+        # Nothing changes the DOM on its own, waits run in virtual time
+        self.clock = VirtualClock()
+        self._focused = None
+        self.current_url = "about:blank"
+        self.window_handles = ["fake-window"]
+        self.current_window_handle = "fake-window"
+        self.switch_to = _SwitchTo(self)
+        self.session_id = "fake"
+        self._ids = {}
+        self._tree = lxml_html.fromstring("<html><head><title></title></head><body></body></html>")
+        self._scripts = {
+            scripts.BULK_SNAPSHOT: self._bulk_snapshot,
+            # Static DOM: always settled
+            scripts.PAGE_SETTLE_STATE: lambda: {"quiet_ms": float("inf"), "inflight": 0, "loading": False},
+            scripts.CAPTURE_STATE: self._capture_state,
+            scripts.RESTORE_STATE: self._restore_state,
+            scripts.RESOLVE_ELEMENTS: self._resolve_elements,
+        }
+        self._cookies = {}
+
+    def _resolve(self, url):
+        if url in self.url_map:
+            return self.url_map[url]
+        path = urlsplit(url).path.lstrip("/")
+        if not path or path.endswith("/"):
+            path += "index.html"
+        return os.path.join(self.root, path)
+
+    def get(self, url):
+        self.events.append(("get", url, ""))
+        self.current_url = url
+        self._ids.clear()
+        self._focused = None
+        if url == "about:blank":
+            self._tree = lxml_html.fromstring("<html><head><title></title></head><body></body></html>")
+            return
+        path = self._resolve(url)
+        if not os.path.exists(path):
+            raise WebDriverException(f"No snapshot for {url} (looked for {path})")
+        with open(path, "rb") as fh:
+            self._tree = lxml_html.document_fromstring(fh.read())
+
+    def load_html(self, markup, url="about:fake"):
+        """
+        Load a snapshot from a string.
+        """
+        self.current_url = url
+        self._ids.clear()
+        self._focused = None
+        self._tree = lxml_html.document_fromstring(markup)
+
+    @property
+    def title(self):
+        titles = self._tree.xpath("//title")
+        return titles[0].text_content().strip() if titles else ""
+
+    @property
+    def page_source(self):
+        return lxml_html.tostring(self._tree, encoding="unicode")
+
+    def _wrap(self, node):
+        key = id(node)
+        entry = self._ids.get(key)
+        if entry is None or entry.node is not node:
+            entry = self._ids[key] = FakeWebElement(self, node, f"fake-{len(self._ids)}")
+        return entry
+
+    def _wrap_all(self, nodes):
+        return [self._wrap(node) for node in nodes]
+
+    def _first(self, node, by, value):
+        found = _find(node, by, value)
+        if not found:
+            raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+        return self._wrap(found[0])
+
+    def find_element(self, by=By.ID, value=None):
+        return self._first(self._tree, by, value)
+
+    def find_elements(self, by=By.ID, value=None):
+        return self._wrap_all(_find(self._tree, by, value))
+
+    def _set_value(self, element, value):
+        if element.node.tag == "textarea":
+            element.node.text = value
+        element.node.set("value", value)
+
+    def _type(self, element, keys):
+        if not element.is_enabled():
+            raise WebDriverException(f"element not interactable: {element.describe()}")
+        current = element.get_attribute("value") or ""
+        self._set_value(element, current + _SPECIAL_KEYS.sub("", keys))
+        self._focused = element
+        self.events.append(("keys", element.describe(), keys))
+
+    def _click(self, element):
+        if not element.is_displayed() or not element.is_enabled():
+            raise WebDriverException(f"element not interactable: {element.describe()}")
+        node = element.node
+        self._focused = element
+        self.events.append(("click", element.describe(), ""))
+        if node.tag == "input" and (node.get("type") or "").lower() in ("checkbox", "radio"):
+            if node.get("checked") is None:
+                node.set("checked", "checked")
+            else:
+                node.attrib.pop("checked")
+        href = node.get("href") if node.tag == "a" else None
+        if href and not href.startswith(("#", "javascript:")):
+            self.get(urljoin(self.current_url, href))
+
+    def execute_script(self, script, *args):
+        """
+        Known SeleniumBase scripts are emulated in Python, other scripts are recorded and return None.
+        """
+        handler = self._scripts.get(script)
+        if handler:
+            return handler(*args)
+        self.events.append(("script", script.strip()[:80], ""))
+        if script.strip() == "return document.readyState":
+            return "complete"
+        return None
+
+    def _bulk_snapshot(self, specs, attribute_names):
+        snapshot = []
+        for locator_type, value in specs:
+            snapshot.append([{
+                "text": element.text,
+                "attributes": {name: element.get_attribute(name) for name in attribute_names},
+                "visible": element.is_displayed(),
+                "rect": element.rect,
+            } for element in self.find_elements(_LOCATOR_TYPES[locator_type], value)])
+        return snapshot
+
+    def _resolve_elements(self, specs, with_settle):
+        elements = []
+        for locator_type, value, visible in specs:
+            found = self.find_elements(_LOCATOR_TYPES[locator_type], value)
+            element = found[0] if found else None
+            elements.append(None if element is not None and visible and not element.is_displayed() else element)
+        settle = self._scripts[scripts.PAGE_SETTLE_STATE]() if with_settle else None
+        return {"elements": elements, "settle": settle}
+
+    def _css_path(self, node):
+        if node.get("id"):
+            return f"#{node.get('id')}"
+        name = node.get("name")
+        if name and len(self._tree.xpath(f"//{node.tag}[@name=$n]", n=name)) == 1:
+            return f'{node.tag}[name="{name}"]'
+        parts = []
+        while node is not None and node.tag != "html":
+            index = 1 + sum(1 for sib in node.itersiblings(preceding=True) if sib.tag == node.tag)
+            parts.insert(0, f"{node.tag}:nth-of-type({index})")
+            node = node.getparent()
+        return " > ".join(parts)
+
+    def _capture_state(self):
+        fields = []
+        for node in self._tree.xpath("//input | //textarea | //select"):
+            if (node.get("type") or "").lower() in ("password", "file", "hidden", "submit", "button"):
+                continue
+            element = self._wrap(node)
+            fields.append({"selector": self._css_path(node), "value": element.get_attribute("value") or "",
+                           "checked": node.get("checked") is not None})
+        return {"url": self.current_url, "local_storage": {}, "session_storage": {}, "fields": fields}
+
+    def _restore_state(self, local_storage, session_storage, fields):
+        restored = 0
+        for field in fields or ():
+            found = _find(self._tree, By.CSS_SELECTOR, field["selector"])
+            if not found:
+                continue
+            node = found[0]
+            if (node.get("type") or "").lower() in ("checkbox", "radio"):
+                if field["checked"]:
+                    node.set("checked", "checked")
+                else:
+                    node.attrib.pop("checked", None)
+            else:
+                self._set_value(self._wrap(node), field["value"])
+            restored += 1
+        return restored
+
+    def execute(self, driver_command, params=None):
+        """
+        Raw command entry point, only W3C actions (ActionChains) are supported.
+        """
+        if driver_command == Command.W3C_ACTIONS:
+            self._perform_actions(params["actions"])
+            return {"value": None}
+        if driver_command == Command.RELEASE_ACTIONS:
+            return {"value": None}
+        raise WebDriverException(f"{driver_command} is not supported by the fake driver")
+
+    def _perform_actions(self, devices):
+        # Input sources tick together: action i of every device runs before action i + 1
+        by_id = {element.id: element for element in self._ids.values()}
+        ticks = zip(*(device.get("actions", ()) for device in devices))
+        target = None
+        typed = []
+        for tick in ticks:
+            for action in tick:
+                kind = action.get("type")
+                if kind != "keyDown" and kind != "keyUp" and kind != "pause" and typed:
+                    self._flush_keys(typed)
+                if kind == "pointerMove":
+                    origin = action.get("origin")
+                    if isinstance(origin, dict) and _ELEMENT_KEY in origin:
+                        target = by_id.get(origin[_ELEMENT_KEY])
+                        self.events.append(("hover", target.describe() if target else "", ""))
+                elif kind == "pointerUp" and target is not None:
+                    self._click(target)
+                elif kind == "keyDown" and self._focused is not None:
+                    typed.append(action["value"])
+        if typed:
+            self._flush_keys(typed)
+
+    def _flush_keys(self, typed):
+        # Consecutive key presses are recorded as one typed string, like element.send_keys
+        self._type(self._focused, "".join(typed))
+        typed.clear()
+
+    def get_screenshot_as_png(self):
+        return _BLANK_PNG
+
+    def get_screenshot_as_file(self, filename):
+        with open(filename, "wb") as fh:
+            fh.write(_BLANK_PNG)
+        return True
+
+    def save_screenshot(self, filename):
+        return self.get_screenshot_as_file(filename)
+
+    def implicitly_wait(self, time_to_wait):
+        pass
+
+    def set_page_load_timeout(self, time_to_wait):
+        pass
+
+    def maximize_window(self):
+        pass
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def back(self):
+        pass
+
+    def delete_all_cookies(self):
+        self._cookies.clear()
+
+    def add_cookie(self, cookie_dict):
+        self._cookies[cookie_dict["name"]] = dict(cookie_dict)
+
+    def get_cookie(self, name):
+        return self._cookies.get(name)
+
+    def get_cookies(self):
+        return list(self._cookies.values())
+
+    def close(self):
+        pass
+
+    def quit(self):
+        self.events.clear()
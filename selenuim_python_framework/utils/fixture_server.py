@@ -0,0 +1,79 @@
+import mimetypes
+import os
+import re
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+from common.constants import *
+
+_GENERATED = re.compile(r"^/(?:.*/)?bytes/(\d+)(\.\w+)$")
+
+
+class _FixtureRequestHandler(SimpleHTTPRequestHandler):
+    """
+    Serves static fixture pages plus generated payloads: [/<prefix>]/bytes/<size>.<ext>
+    returns <size> bytes with the content type of <ext>.
+    """
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if not self._send_generated(with_body=True):
+            super().do_GET()
+
+    def do_HEAD(self):
+        if not self._send_generated(with_body=False):
+            super().do_HEAD()
+
+    def _send_generated(self, with_body):
+        match = _GENERATED.match(self.path.split("?", 1)[0])
+        if not match:
+            return False
+        size, ext = int(match.group(1)), match.group(2)
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.types_map.get(ext, "application/octet-stream"))
+        self.send_header("Content-Length", str(size))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if with_body:
+            self.wfile.write(b"\0" * size)
+        return True
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+class FixtureServer:
+    """
+    Local HTTP server for the fixture sites, started on a free port in a background thread.
+    Every requested path is recorded in `requests`.
+    """
+
+    def __init__(self, directory=None, host="127.0.0.1", port=0):
+        directory = directory or os.path.join(PROJECT_ROOT, FIXTURE_SITES_DIR)
+        handler = partial(_FixtureRequestHandler, directory=directory)
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.requests = []
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def url(self, path=""):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/{path.lstrip('/')}"
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,336 @@
+import itertools
+import json
+import logging
+import threading
+import time
+import urllib.request
+
+from selenium import webdriver
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+
+import utils.logger_utility as log_utils
+
+GRID_SECTION = "GRID"
+DEFAULT_ENDPOINT = "http://localhost:4444/wd/hub"
+LOCAL_PREFIX = "local"
+STRATEGIES = ("least_loaded", "round_robin")
+
+
+class GridCapacityError(TimeoutError):
+    """
+    Raised when no grid endpoint could start a session within the queue timeout.
+    """
+
+
+class _PooledConnection(RemoteConnection):
+    """
+    RemoteConnection shared by every session of an endpoint. driver.quit() closes the
+    command executor, which would drop the keep-alive pool, so closing is left to the executor.
+    """
+
+    def close(self):
+        pass
+
+    def close_pool(self):
+        super().close()
+
+
+def parse_status(payload):
+    """
+    Read a /status response of a Selenium Grid or a standalone driver.
+    :return: Tuple (ready, free slots or None when the endpoint does not report slots).
+    """
+    value = json.loads(payload).get("value", {})
+    nodes = value.get("nodes")
+    if nodes is None:
+        return bool(value.get("ready")), None
+    free = sum(1 for node in nodes if node.get("availability", "UP") == "UP"
+               for slot in node.get("slots", []) if not slot.get("session"))
+    return bool(value.get("ready")), free
+
+
+class GridEndpoint:
+    """
+    One hub or node: its pooled connection, session count and health. max_sessions 0 leaves
+    the capacity to the slots the hub reports.
+    'local' and 'local:fake' endpoints start local drivers instead, to stand in for grid nodes in tests.
+    """
+
+    def __init__(self, url, max_sessions, pool_maxsize=None, command_timeout=120):
+        self.url = url.rstrip("/")
+        self.max_sessions = max_sessions
+        self.local = self.url == LOCAL_PREFIX or self.url.startswith(LOCAL_PREFIX + ":")
+        self.active = 0
+        self.healthy = True
+        self.failures = 0
+        self.free_slots = None
+        self.sessions_started = 0
+        self.connection = None
+        if not self.local:
+            # One keep-alive connection per session that can run at once, never blocking on the pool
+            self.connection = _PooledConnection(client_config=ClientConfig(
+                remote_server_addr=self.url,
+                keep_alive=True,
+                timeout=command_timeout,
+                init_args_for_pool_manager={"init_args_for_pool_manager": {
+                    "maxsize": pool_maxsize or max_sessions or 10, "block": False}},
+            ))
+
+    @property
+    def load(self):
+        return self.active / self.max_sessions if self.max_sessions else self.active
+
+    @property
+    def has_capacity(self):
+        if self.max_sessions and self.active >= self.max_sessions:
+            return False
+        # Slots reported by the hub also account for sessions of other processes
+        return self.free_slots is None or self.free_slots > 0
+
+    def __repr__(self):
+        return f"GridEndpoint({self.url}, {self.active}/{self.max_sessions}, healthy={self.healthy})"
+
+
+class GridExecutor:
+    """
+    Places remote sessions on a list of grid endpoints read from the [GRID] section of the suite .ini:
+
+        [GRID]
+        endpoints = http://grid-a:4444/wd/hub|4, http://grid-b:4444/wd/hub|2
+        max_sessions = 0
+        strategy = least_loaded
+        queue_timeout = 300
+        health_check_interval = 30
+        eject_after_failures = 2
+
+    Every endpoint keeps one pooled keep-alive connection shared by its sessions. Sessions go
+    to the healthy endpoint with the lowest load (or round robin); when every endpoint is at
+    capacity, callers queue until a session is released or the queue timeout expires.
+    A background thread polls /status, ejects endpoints after consecutive failures and
+    re-admits them once they answer again.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+    _shared = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, endpoints, strategy="least_loaded", queue_timeout=300.0, health_check_interval=30.0,
+                 eject_after_failures=2):
+        """
+        :param endpoints: List of GridEndpoint.
+        :param strategy: least_loaded or round_robin.
+        :param queue_timeout: Seconds a session request waits for a free slot.
+        :param health_check_interval: Seconds between two /status checks of every endpoint, 0 disables them.
+        :param eject_after_failures: Consecutive failures (health checks or session starts) that eject an endpoint.
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unsupported grid strategy: {strategy}")
+        if not endpoints:
+            raise ValueError("Grid executor needs at least one endpoint")
+        self.endpoints = list(endpoints)
+        self.strategy = strategy
+        self.queue_timeout = queue_timeout
+        self.health_check_interval = health_check_interval
+        self.eject_after_failures = eject_after_failures
+        self._round_robin = itertools.cycle(range(len(self.endpoints)))
+        self._condition = threading.Condition()
+        self._stopped = threading.Event()
+        self._health_thread = None
+        if health_check_interval and any(not endpoint.local for endpoint in self.endpoints):
+            self._health_thread = threading.Thread(target=self._health_loop, name="grid-health", daemon=True)
+            self._health_thread.start()
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        Build an executor from the [GRID] section, or for the single default endpoint without one.
+        """
+        section = config[GRID_SECTION] if config.has_section(GRID_SECTION) else {}
+        max_sessions = int(section.get("max_sessions", 0))
+        command_timeout = float(section.get("command_timeout", 120))
+        endpoints = []
+        for item in section.get("endpoints", DEFAULT_ENDPOINT).replace("\n", ",").split(","):
+            if not item.strip():
+                continue
+            url, _, sessions = item.strip().partition("|")
+            endpoints.append(GridEndpoint(url.strip(), int(sessions or max_sessions), command_timeout=command_timeout))
+        return cls(
+            endpoints,
+            strategy=section.get("strategy", "least_loaded").strip(),
+            queue_timeout=float(section.get("queue_timeout", 300)),
+            health_check_interval=float(section.get("health_check_interval", 30)),
+            eject_after_failures=int(section.get("eject_after_failures", 2)),
+        )
+
+    @classmethod
+    def for_config(cls, config):
+        """
+        Process-wide executor of a grid configuration, so every driver of the session
+        shares the same connection pools and session counts.
+        """
+        section = dict(config[GRID_SECTION]) if config.has_section(GRID_SECTION) else {}
+        key = tuple(sorted(section.items()))
+        with cls._shared_lock:
+            executor = cls._shared.get(key)
+            if executor is None:
+                executor = cls._shared[key] = cls.from_config(config)
+            return executor
+
+    @classmethod
+    def close_shared(cls):
+        """
+        Close every process-wide executor of for_config, called at the end of the session.
+        """
+        with cls._shared_lock:
+            executors = list(cls._shared.values())
+            cls._shared.clear()
+        for executor in executors:
+            executor.close()
+
+    def create_session(self, options, local_factory=None):
+        """
+        Start a session on the best endpoint with a free slot, queueing while every endpoint is busy.
+        A failed session start counts against the endpoint and the next endpoint is tried.
+        :param options: Browser options of the session.
+        :param local_factory: Callable(browser, options) -> driver used by 'local' endpoints.
+        :return: WebDriver instance, released with release(driver) or release_session(driver).
+        :raises GridCapacityError: if no session could be started within the queue timeout.
+        """
+        deadline = time.monotonic() + self.queue_timeout
+        last_error = None
+        while True:
+            endpoint = self._reserve(deadline, last_error)
+            started = time.perf_counter()
+            try:
+                driver = self._start(endpoint, options, local_factory)
+            except Exception as e:
+                last_error = e
+                self.log.warning(f"Session start on {endpoint.url} failed. Exception: {e}")
+                self._release_slot(endpoint, failed=True)
+                continue
+            with self._condition:
+                endpoint.failures = 0
+                endpoint.sessions_started += 1
+            self.log.info(f"Session started on {endpoint.url} in {time.perf_counter() - started:.2f}s "
+                          f"({endpoint.active}/{endpoint.max_sessions})")
+            driver.grid_executor = self
+            driver.grid_endpoint = endpoint
+            return driver
+
+    def _start(self, endpoint, options, local_factory):
+        if endpoint.local:
+            _, _, browser = endpoint.url.partition(":")
+            if local_factory is None:
+                raise ValueError(f"{endpoint.url} needs a local driver factory")
+            return local_factory(browser or None, options)
+        return webdriver.Remote(command_executor=endpoint.connection, options=options)
+
+    def _reserve(self, deadline, last_error=None):
+        with self._condition:
+            while True:
+                candidates = [endpoint for endpoint in self.endpoints if endpoint.healthy and endpoint.has_capacity]
+                if candidates:
+                    endpoint = self._pick(candidates)
+                    endpoint.active += 1
+                    if endpoint.free_slots is not None:
+                        endpoint.free_slots -= 1
+                    return endpoint
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise GridCapacityError(f"No grid endpoint could start a session within {self.queue_timeout}s: "
+                                            f"{self.endpoints}, last error: {last_error}")
+                if not any(endpoint.healthy for endpoint in self.endpoints):
+                    # Every endpoint is ejected, re-check them instead of waiting for the health thread
+                    self._condition.release()
+                    try:
+                        self.check_health()
+                    finally:
+                        self._condition.acquire()
+                    if not any(endpoint.healthy for endpoint in self.endpoints):
+                        if all(endpoint.local for endpoint in self.endpoints):
+                            # Local stand-ins have no health check to bring them back
+                            raise GridCapacityError(f"Every grid endpoint was ejected: {self.endpoints}, "
+                                                    f"last error: {last_error}")
+                        self._condition.wait(min(remaining, max(self.health_check_interval, 1.0)))
+                    continue
+                self._condition.wait(remaining)
+
+    def _pick(self, candidates):
+        if self.strategy == "round_robin":
+            for _ in range(len(self.endpoints)):
+                endpoint = self.endpoints[next(self._round_robin)]
+                if endpoint in candidates:
+                    return endpoint
+        # Least loaded, ties go to the endpoint listed first
+        return min(candidates, key=lambda endpoint: endpoint.load)
+
+    def _release_slot(self, endpoint, failed=False):
+        with self._condition:
+            endpoint.active = max(0, endpoint.active - 1)
+            if endpoint.free_slots is not None and not failed:
+                endpoint.free_slots += 1
+            if failed:
+                endpoint.failures += 1
+                if endpoint.failures >= self.eject_after_failures and endpoint.healthy:
+                    endpoint.healthy = False
+                    self.log.warning(f"Grid endpoint {endpoint.url} ejected after {endpoint.failures} failures")
+            self._condition.notify_all()
+
+    def release(self, driver):
+        """
+        Free the slot of a session after driver.quit().
+        """
+        endpoint = getattr(driver, "grid_endpoint", None)
+        if endpoint is not None:
+            driver.grid_endpoint = None
+            self._release_slot(endpoint)
+
+    def check_health(self):
+        """
+        Poll /status of every remote endpoint once: eject endpoints that keep failing,
+        re-admit the ones that answer ready and record the free slots reported by hubs.
+        """
+        for endpoint in self.endpoints:
+            if endpoint.local:
+                continue
+            try:
+                with urllib.request.urlopen(f"{endpoint.url}/status", timeout=5) as response:
+                    ready, free = parse_status(response.read())
+            except (OSError, ValueError) as e:
+                ready, free = False, None
+                self.log.debug(f"Health check of {endpoint.url} failed: {e}")
+            with self._condition:
+                endpoint.free_slots = free
+                if ready:
+                    if not endpoint.healthy:
+                        self.log.info(f"Grid endpoint {endpoint.url} is back")
+                    endpoint.healthy = True
+                    endpoint.failures = 0
+                else:
+                    endpoint.failures += 1
+                    if endpoint.failures >= self.eject_after_failures and endpoint.healthy:
+                        endpoint.healthy = False
+                        self.log.warning(f"Grid endpoint {endpoint.url} ejected, /status not ready")
+                self._condition.notify_all()
+
+    def _health_loop(self):
+        while not self._stopped.wait(self.health_check_interval):
+            self.check_health()
+
+    def close(self):
+        """
+        Stop the health checks and close the connection pools.
+        """
+        self._stopped.set()
+        for endpoint in self.endpoints:
+            if endpoint.connection is not None:
+                endpoint.connection.close_pool()
+
+
+def release_session(driver):
+    """
+    Free the grid slot of a driver after it was quit, no-op for drivers not started by a GridExecutor.
+    """
+    executor = getattr(driver, "grid_executor", None)
+    if executor is not None:
+        executor.release(driver)
@@ -0,0 +1,340 @@
+import base64
+import http.client
+import json
+import logging
+import os
+import re
+import ssl
+import subprocess
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import utils.logger_utility as log_utils
+from common.constants import *
+
+REPLAY_SECTION = "REPLAY"
+
+# Headers that only make sense on one connection and are never recorded or forwarded
+_HOP_BY_HOP = {"connection", "keep-alive", "proxy-authenticate", "proxy-authorization", "proxy-connection",
+               "te", "trailers", "transfer-encoding", "upgrade"}
+
+
+class MatchRules:
+    """
+    How a browser request is matched against recorded entries. Read from the
+    [REPLAY] section of the suite .ini:
+
+        [REPLAY]
+        ignore_query_params = _, cb, timestamp
+        ignore_url_patterns = .*/collect\\?.*
+        match_body = false
+
+    Requests matching ignore_url_patterns are answered with an empty 204 in replay mode.
+    """
+
+    def __init__(self, ignore_query_params=(), ignore_url_patterns=(), match_body=False):
+        self.ignore_query_params = set(ignore_query_params)
+        self.ignore_url_patterns = [re.compile(pattern) for pattern in ignore_url_patterns]
+        self.match_body = match_body
+
+    @classmethod
+    def from_config(cls, config):
+        if not config.has_section(REPLAY_SECTION):
+            return cls()
+        section = config[REPLAY_SECTION]
+        split = lambda value: [item.strip() for item in value.split(",") if item.strip()]
+        return cls(
+            ignore_query_params=split(section.get("ignore_query_params", "")),
+            ignore_url_patterns=split(section.get("ignore_url_patterns", "")),
+            match_body=section.getboolean("match_body", fallback=False),
+        )
+
+    def is_ignored(self, url):
+        return any(pattern.match(url) for pattern in self.ignore_url_patterns)
+
+    def key(self, method, url, body=b""):
+        parts = urlsplit(url)
+        query = urlencode(sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                                 if k not in self.ignore_query_params))
+        normalized = urlunsplit((parts.scheme, parts.netloc, parts.path, query, ""))
+        return method.upper(), normalized, body if self.match_body else b""
+
+
+class HarArchive:
+    """
+    HAR 1.2 file of recorded exchanges. Bodies are stored base64 encoded, as received
+    (still content-encoded), so replay returns byte-identical responses.
+    """
+
+    def __init__(self, path, load=True):
+        self.path = path
+        self.entries = []
+        if load and os.path.exists(path):
+            with open(path, encoding="utf-8") as fh:
+                self.entries = json.load(fh)["log"]["entries"]
+
+    def add(self, method, url, request_headers, request_body, status, reason, response_headers, body, elapsed_ms):
+        entry = {
+            "startedDateTime": datetime.now(timezone.utc).isoformat(),
+            "time": round(elapsed_ms, 3),
+            "request": {
+                "method": method,
+                "url": url,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": k, "value": v} for k, v in request_headers],
+                "queryString": [],
+                "headersSize": -1,
+                "bodySize": len(request_body),
+            },
+            "response": {
+                "status": status,
+                "statusText": reason,
+                "httpVersion": "HTTP/1.1",
+                "headers": [{"name": k, "value": v} for k, v in response_headers],
+                "content": {
+                    "size": len(body),
+                    "mimeType": dict((k.lower(), v) for k, v in response_headers).get("content-type", ""),
+                    "text": base64.b64encode(body).decode("ascii"),
+                    "encoding": "base64",
+                },
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": len(body),
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": round(elapsed_ms, 3), "receive": 0},
+        }
+        if request_body:
+            entry["request"]["postData"] = {"mimeType": "", "text": base64.b64encode(request_body).decode("ascii"),
+                                            "encoding": "base64"}
+        self.entries.append(entry)
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as fh:
+            json.dump({"log": {"version": "1.2", "creator": {"name": "har_proxy", "version": "1.0"},
+                               "entries": self.entries}}, fh)
+
+
+class ReplayIndex:
+    """
+    Recorded responses indexed by MatchRules.key. Repeated requests get the
+    recorded responses in order, the last one is repeated once exhausted.
+    """
+
+    def __init__(self, archive, rules):
+        self._responses = {}
+        self._served = {}
+        self._lock = threading.Lock()
+        for entry in archive.entries:
+            request = entry["request"]
+            body = base64.b64decode(request["postData"]["text"]) if "postData" in request else b""
+            key = rules.key(request["method"], request["url"], body)
+            self._responses.setdefault(key, []).append(entry)
+
+    def __len__(self):
+        return sum(len(entries) for entries in self._responses.values())
+
+    def lookup(self, key):
+        with self._lock:
+            entries = self._responses.get(key)
+            if not entries:
+                return None
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+            return entries[min(index, len(entries) - 1)]
+
+
+def ensure_certificate(cert_dir):
+    """
+    Self-signed certificate used to terminate TLS in the proxy. Browsers are started
+    with accept_insecure_certs, so one certificate serves every host.
+    :return: Tuple (cert path, key path)
+    """
+    cert_path = os.path.join(cert_dir, "proxy_cert.pem")
+    key_path = os.path.join(cert_dir, "proxy_key.pem")
+    if not (os.path.exists(cert_path) and os.path.exists(key_path)):
+        os.makedirs(cert_dir, exist_ok=True)
+        subprocess.run(["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "3650",
+                        "-subj", "/CN=har-proxy", "-keyout", key_path, "-out", cert_path],
+                       check=True, capture_output=True)
+    return cert_path, key_path
+
+
+class _ProxyHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    tunnel_host = None
+
+    def do_CONNECT(self):
+        """
+        Terminate the TLS tunnel locally and handle the inner requests as https://<host>.
+        """
+        host, _, port = self.path.rpartition(":")
+        self.send_response(200, "Connection Established")
+        self.end_headers()
+        try:
+            tls = self.server.ssl_context.wrap_socket(self.connection, server_side=True)
+        except (ssl.SSLError, OSError) as e:
+            self.server.proxy.log.debug(f"TLS handshake with browser failed for {self.path}: {e}")
+            self.close_connection = True
+            return
+        self.connection = tls
+        self.rfile = tls.makefile("rb", self.rbufsize)
+        self.wfile = tls.makefile("wb", 0)
+        self.tunnel_host = host if port == "443" else self.path
+        self.close_connection = False
+        while not self.close_connection:
+            self.handle_one_request()
+
+    def _handle(self):
+        if self.tunnel_host:
+            url = f"https://{self.tunnel_host}{self.path}"
+        else:
+            url = self.path
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, reason, headers, payload = self.server.proxy.handle(self.command, url, self.headers, body)
+        self.send_response(status, reason)
+        for name, value in headers:
+            if name.lower() not in _HOP_BY_HOP and name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = _handle
+
+    def log_message(self, fmt, *args):
+        pass
+
+
+class HarProxy:
+    """
+    In-process HTTP(S) proxy the browser is routed through.
+
+    record: forwards every request upstream and stores the exchange in the active HAR archive.
+    replay: serves responses from the active archive only, never touching the network.
+            Unmatched requests get a 404 and are counted as misses.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, mode, latency_ms=0.0, use_recorded_timing=False, host="127.0.0.1", port=0):
+        """
+        :param mode: record or replay.
+        :param latency_ms: Fixed latency injected into every replayed response.
+        :param use_recorded_timing: Replay with the recorded response time instead of latency_ms.
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported proxy mode: {mode}")
+        self.mode = mode
+        self.latency_ms = latency_ms
+        self.use_recorded_timing = use_recorded_timing
+        self.archive = None
+        self.rules = MatchRules()
+        self.index = None
+        self.misses = []
+        self._lock = threading.Lock()
+        cert_path, key_path = ensure_certificate(os.path.join(PROJECT_ROOT, HAR_CERT_DIR))
+        self.httpd = ThreadingHTTPServer((host, port), _ProxyHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.proxy = self
+        self.httpd.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.httpd.ssl_context.load_cert_chain(cert_path, key_path)
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def address(self):
+        host, port = self.httpd.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self):
+        self._thread.start()
+        self.log.info(f"HAR proxy in {self.mode} mode listening on {self.address}")
+        return self
+
+    def stop(self):
+        self.save()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def use_archive(self, path, rules=None):
+        """
+        Switch the active archive, e.g. at the start of every test class.
+        In record mode the previous archive is saved and the new one starts empty.
+        """
+        with self._lock:
+            self._save_locked()
+            self.rules = rules or MatchRules()
+            self.misses = []
+            if self.mode == "record":
+                self.archive = HarArchive(path, load=False)
+            else:
+                if not os.path.exists(path):
+                    raise FileNotFoundError(f"No HAR recording at {path}, run once with --network-mode=record")
+                self.archive = HarArchive(path)
+                self.index = ReplayIndex(self.archive, self.rules)
+                self.log.info(f"Replaying {len(self.index)} recorded exchanges from {path}")
+
+    def save(self):
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self):
+        if self.mode == "record" and self.archive is not None and self.archive.entries:
+            self.archive.save()
+            self.log.info(f"Recorded {len(self.archive.entries)} exchanges to {self.archive.path}")
+
+    def handle(self, method, url, headers, body):
+        """
+        :return: Tuple (status, reason, header list, body bytes) sent back to the browser.
+        """
+        if self.mode == "record":
+            return self._record(method, url, headers, body)
+        return self._replay(method, url, body)
+
+    def _record(self, method, url, headers, body):
+        parts = urlsplit(url)
+        path = urlunsplit(("", "", parts.path or "/", parts.query, ""))
+        request_headers = [(k, v) for k, v in headers.items() if k.lower() not in _HOP_BY_HOP]
+        connection_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        start = time.perf_counter()
+        connection = connection_cls(parts.netloc, timeout=30)
+        try:
+            connection.request(method, path, body=body or None, headers=dict(request_headers))
+            response = connection.getresponse()
+            payload = response.read()
+            response_headers = [(k, v) for k, v in response.getheaders() if k.lower() not in _HOP_BY_HOP]
+            status, reason = response.status, response.reason
+        except OSError as e:
+            self.log.warning(f"Upstream request {method} {url} failed: {e}")
+            return 502, "Bad Gateway", [], b""
+        finally:
+            connection.close()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        with self._lock:
+            if self.archive is not None:
+                self.archive.add(method, url, request_headers, body, status, reason, response_headers,
+                                 payload, elapsed_ms)
+        return status, reason, response_headers, payload
+
+    def _replay(self, method, url, body):
+        if self.index is None or self.rules.is_ignored(url):
+            return 204, "No Content", [], b""
+        entry = self.index.lookup(self.rules.key(method, url, body))
+        if entry is None:
+            with self._lock:
+                self.misses.append(f"{method} {url}")
+            return 404, "Not Recorded", [("X-Har-Replay", "miss")], b""
+        delay = entry["time"] if self.use_recorded_timing else self.latency_ms
+        if delay:
+            time.sleep(delay / 1000)
+        response = entry["response"]
+        content = response["content"]
+        payload = base64.b64decode(content.get("text", "")) if content.get("encoding") == "base64" \
+            else content.get("text", "").encode("utf-8")
+        headers = [(h["name"], h["value"]) for h in response["headers"]]
+        return response["status"], response["statusText"], headers, payload
@@ -1,4 +1,3 @@
-import inspect
 import json
 import logging
 import os
@@ -6,6 +5,7 @@ import os.path
 from configparser import ConfigParser
 import utils.logger_utility as log_utils
 from common.constants import *
+from utils.test_data_store import DataStore, DataValidationError
 
 log = log_utils.custom_logger(logging.INFO)
 
@@ -25,13 +25,15 @@ def parse_json(filepath):
 def get_test_data(test_cls):
     """
     Retrieve test data for a given test class from a JSON file in the data directory.
+    The file is parsed (and validated against its optional schema) once per session.
     :param test_cls: The test class object.
-    :return: Parsed JSON data or None if error occurs.
+    :return: Parsed JSON data or None if the file cannot be read.
+    :raises DataValidationError: if the data does not match its schema.
     """
     try:
-        current_file = inspect.getfile(test_cls)
-        data_file_path = os.path.dirname(os.path.dirname(current_file) + "/data/")
-        return  parse_json(os.path.join(data_file_path, test_cls.__name__))
+        return DataStore.load(test_cls)
+    except DataValidationError:
+        raise
     except Exception as e:
         log.error(f"Failed to get test data for {test_cls.__name__}. Exception: {e}")
         return None
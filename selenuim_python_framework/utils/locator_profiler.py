@@ -0,0 +1,325 @@
+import json
+import os
+import re
+import statistics
+import threading
+import time
+
+from selenium.webdriver.common.by import By
+
+_BY = {"id": By.ID, "name": By.NAME, "xpath": By.XPATH, "css": By.CSS_SELECTOR,
+       "class": By.CLASS_NAME, "link": By.LINK_TEXT}
+
+# Step separators of an XPath and their CSS combinator, longest first
+_SEPARATORS = (
+    ("//descendant::", " "),
+    ("/descendant::", " "),
+    ("/child::", " > "),
+    ("/following-sibling::", " ~ "),
+    ("//", " "),
+    ("/", " > "),
+)
+_STEP = re.compile(r"^(\*|[A-Za-z][\w-]*)((?:\[.*\])?)$")
+_QUOTED = r"""('[^']*'|"[^"]*")"""
+_PREDICATES = (
+    (re.compile(rf"^@([\w-]+)\s*=\s*{_QUOTED}$"), "[{0}={1}]"),
+    (re.compile(rf"^contains\(\s*@([\w-]+)\s*,\s*{_QUOTED}\s*\)$"), "[{0}*={1}]"),
+    (re.compile(rf"^starts-with\(\s*@([\w-]+)\s*,\s*{_QUOTED}\s*\)$"), "[{0}^={1}]"),
+    (re.compile(r"^@([\w-]+)$"), "[{0}]"),
+)
+_CLASS_TOKEN = re.compile(
+    r"""^contains\(\s*concat\(\s*(['"]) \1\s*,\s*normalize-space\(\s*@class\s*\)\s*,\s*(['"]) \2\s*\)\s*,\s*"""
+    r"""(['"]) ([\w-]+) \3\s*\)$""")
+
+
+def _split_top_level(expression, separators):
+    """
+    Split an expression on separators that are outside brackets and quotes.
+    :return: List of (separator, part) tuples, separator is '' for the first part.
+    """
+    parts = []
+    depth = 0
+    quote = None
+    separator = ""
+    start = 0
+    i = 0
+    while i < len(expression):
+        char = expression[i]
+        if quote:
+            quote = None if char == quote else quote
+        elif char in ("'", '"'):
+            quote = char
+        elif char in "[(":
+            depth += 1
+        elif char in "])":
+            depth -= 1
+        elif depth == 0:
+            matched = next((sep for sep in separators if expression.startswith(sep, i)), None)
+            if matched:
+                parts.append((separator, expression[start:i]))
+                separator = matched
+                i += len(matched)
+                start = i
+                continue
+        i += 1
+    parts.append((separator, expression[start:]))
+    return parts
+
+
+def _bracketed(predicates):
+    """
+    Split '[a][b]' into ['a', 'b'], brackets inside quotes or nested predicates are kept.
+    """
+    items = []
+    depth = 0
+    quote = None
+    start = 0
+    for i, char in enumerate(predicates):
+        if quote:
+            quote = None if char == quote else quote
+        elif char in ("'", '"'):
+            quote = char
+        elif char == "[":
+            if depth == 0:
+                start = i + 1
+            depth += 1
+        elif char == "]":
+            depth -= 1
+            if depth == 0:
+                items.append(predicates[start:i].strip())
+    return items
+
+
+def _css_string(quoted):
+    value = quoted[1:-1]
+    return f"'{value}'" if "'" not in value else f'"{value}"'
+
+
+def _predicate_to_css(tag, predicate, first):
+    """
+    :return: CSS fragment equivalent to one XPath predicate, or None.
+    """
+    conditions = _split_top_level(predicate.strip(), (" and ",))
+    if len(conditions) > 1:
+        fragments = [_predicate_to_css(tag, condition, False) for _, condition in conditions]
+        return None if None in fragments else "".join(fragments)
+    if predicate.isdigit():
+        # tag[n] counts siblings of the same tag, only when it is the first predicate
+        return f":nth-of-type({predicate})" if first and tag != "*" else None
+    if predicate == "last()":
+        return ":last-of-type" if first and tag != "*" else None
+    match = _CLASS_TOKEN.match(predicate)
+    if match:
+        return f".{match.group(4)}"
+    for pattern, template in _PREDICATES:
+        match = pattern.match(predicate)
+        if match:
+            groups = [match.group(1)] + [_css_string(group) for group in match.groups()[1:]]
+            return template.format(*groups)
+    return None
+
+
+def xpath_to_css(xpath):
+    """
+    Rewrite an XPath into an equivalent CSS selector when it only uses steps and predicates
+    CSS can express: descendant/child/following-sibling steps, attribute equality, presence,
+    contains/starts-with on attributes, class tokens and positional [n] on named tags.
+    Text matches, parent/ancestor axes and unions have no CSS equivalent.
+    :return: CSS selector or None.
+    """
+    xpath = xpath.strip()
+    if not xpath.startswith("//") and not xpath.startswith("/html"):
+        return None
+    parts = _split_top_level(xpath, [sep for sep, _ in _SEPARATORS])
+    if parts[0][1]:
+        return None
+    css = []
+    combinators = dict(_SEPARATORS)
+    for index, (separator, step) in enumerate(parts[1:]):
+        match = _STEP.match(step)
+        if not match:
+            return None
+        tag, predicates = match.groups()
+        fragment = "" if tag == "*" else tag
+        for position, predicate in enumerate(_bracketed(predicates)):
+            condition = _predicate_to_css(tag, predicate, position == 0)
+            if condition is None:
+                return None
+            fragment += condition
+        if index == 0:
+            # The leading /html (document root) or // (anywhere) needs no combinator
+            css.append(fragment or "*")
+        else:
+            css.append(combinators[separator] + (fragment or "*"))
+    return "".join(css)
+
+
+class LocatorStats:
+    """
+    Resolution timings and match counts of one named locator.
+    """
+    __slots__ = ("page", "name", "locate", "template", "calls", "misses", "wait_seconds", "lookup_ms",
+                 "matches", "css", "css_ms", "verified", "mismatch")
+
+    def __init__(self, page, name, locate, template):
+        self.page = page
+        self.name = name
+        self.locate = locate
+        self.template = template
+        self.calls = 0
+        self.misses = 0
+        self.wait_seconds = 0.0
+        self.lookup_ms = []
+        self.matches = []
+        self.css = xpath_to_css(template) if locate == "xpath" else None
+        self.css_ms = []
+        # None: never compared on a DOM with matches, True: same elements every time, False: differed
+        self.verified = None
+        self.mismatch = None
+
+    def flags(self, slow_ms):
+        flags = []
+        if self.misses:
+            flags.append("missing")
+        if self.matches and max(self.matches) > 1:
+            flags.append("ambiguous")
+        if self.lookup_ms and statistics.median(self.lookup_ms) > slow_ms:
+            flags.append("slow")
+        if self.locate == "xpath":
+            flags.append("xpath")
+        return flags
+
+    def as_dict(self, slow_ms):
+        median = lambda samples: round(statistics.median(samples), 3) if samples else None
+        return {
+            "page": self.page,
+            "name": self.name,
+            "locate": self.locate,
+            "locator": self.template,
+            "calls": self.calls,
+            "misses": self.misses,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "lookup_ms_p50": median(self.lookup_ms),
+            "lookup_ms_max": round(max(self.lookup_ms), 3) if self.lookup_ms else None,
+            "max_matches": max(self.matches) if self.matches else 0,
+            "flags": self.flags(slow_ms),
+            "css_suggestion": self.css,
+            "css_ms_p50": median(self.css_ms),
+            "css_verified": self.verified,
+            "css_mismatch": self.mismatch,
+        }
+
+
+class LocatorProfiler:
+    """
+    Profiles every locator resolved through SeleniumBase.get_element/get_element_list, by
+    page object and locator name (attributed through Locators.page_locators).
+
+    Each profiled lookup costs one extra find_elements round trip to count the matches
+    (plus one for the CSS rewrite of an XPath, which checks that it returns the same
+    elements on the current DOM), so profiling is off by default (--profile-locators).
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self._names = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def register(self, page, name, locate, template, value):
+        """
+        Attribute the resolved locator value to a page object and locator name.
+        """
+        if self.enabled:
+            with self._lock:
+                self._names[(locate.lower(), value)] = (page, name, template)
+
+    def record(self, driver, locate, value, wait_seconds, found):
+        """
+        Record one resolution: the time get_element waited, then time a single lookup
+        to count the matches and compare the CSS rewrite.
+        """
+        locate = locate.lower()
+        page, name, template = self._names.get((locate, value), ("", value, value))
+        with self._lock:
+            stats = self._stats.get((page, name))
+            if stats is None:
+                stats = self._stats[(page, name)] = LocatorStats(page, name, locate, template)
+        stats.calls += 1
+        stats.wait_seconds += wait_seconds
+        if not found:
+            stats.misses += 1
+        try:
+            start = time.perf_counter()
+            elements = driver.find_elements(_BY[locate], value)
+            stats.lookup_ms.append((time.perf_counter() - start) * 1000)
+            stats.matches.append(len(elements))
+            if stats.css and stats.verified is not False:
+                self._verify(driver, stats, value, elements)
+        except Exception:
+            # Unsupported locator type or the page moved on (navigation, stale DOM),
+            # the wait timing is still recorded
+            pass
+
+    @staticmethod
+    def _verify(driver, stats, value, elements):
+        css = xpath_to_css(value)
+        start = time.perf_counter()
+        css_elements = driver.find_elements(By.CSS_SELECTOR, css)
+        stats.css_ms.append((time.perf_counter() - start) * 1000)
+        if css_elements != elements:
+            stats.verified = False
+            stats.mismatch = f"{css} matched {len(css_elements)} elements, the XPath {len(elements)}"
+        elif elements:
+            stats.verified = True
+
+    def report(self, slow_ms=50.0):
+        """
+        Locators ranked for action: flagged ones (missing, ambiguous, slow) first,
+        then by the total time spent resolving them.
+        :return: List of dicts.
+        """
+        with self._lock:
+            rows = [stats.as_dict(slow_ms) for stats in self._stats.values()]
+        actionable = {"missing", "ambiguous", "slow"}
+        rows.sort(key=lambda row: (not actionable.intersection(row["flags"]), -row["wait_seconds"],
+                                   -(row["lookup_ms_p50"] or 0)))
+        for rank, row in enumerate(rows, 1):
+            row["rank"] = rank
+        return rows
+
+    def export(self, path, slow_ms=50.0):
+        """
+        Write the ranked report as JSON.
+        :return: The ranked rows.
+        """
+        rows = self.report(slow_ms)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump({"slow_ms": slow_ms, "locators": rows}, fh, indent=1)
+        return rows
+
+    def clear(self):
+        with self._lock:
+            self._names.clear()
+            self._stats.clear()
+
+
+def format_report(rows, limit=15):
+    """
+    Plain text table of the top ranked locators for the terminal summary.
+    """
+    lines = [f"{'#':>3} {'page.locator':<40} {'calls':>5} {'wait s':>7} {'ms p50':>7} {'hits':>4}  flags / suggestion"]
+    for row in rows[:limit]:
+        suggestion = ""
+        if row["css_suggestion"]:
+            status = {True: "verified", False: "MISMATCH", None: "unverified"}[row["css_verified"]]
+            suggestion = f" -> css {row['css_suggestion']} ({status})"
+        label = f"{row['page']}.{row['name']}" if row["page"] else row["name"]
+        lines.append(f"{row['rank']:>3} {label[:40]:<40} {row['calls']:>5} "
+                     f"{row['wait_seconds']:>7.3f} {row['lookup_ms_p50'] or 0:>7.2f} {row['max_matches']:>4}  "
+                     f"{','.join(row['flags'])}{suggestion}")
+    return "\n".join(lines)
+
+
+locator_profile = LocatorProfiler()
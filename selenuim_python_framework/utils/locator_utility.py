@@ -1,26 +1,210 @@
 import json
 import logging
 import os
+import re
+import threading
+from lxml import etree
+from lxml.cssselect import CSSSelector
 import utils.logger_utility as log_utils
 from common.constants import *
+from utils.locator_profiler import locator_profile
+
+# Locator types understood by SeleniumBase.get_by_type
+SUPPORTED_LOCATOR_TYPES = ("id", "name", "xpath", "css", "class", "link")
+
+
+class LocatorValidationError(ValueError):
+    """
+    Raised when a locator file contains malformed or duplicate entries.
+    """
+
+    def __init__(self, filename, errors):
+        self.filename = filename
+        self.errors = errors
+        super().__init__(f"Invalid locator file {filename}:\n  " + "\n  ".join(errors))
+
+
+class CompiledLocator:
+    """
+    A single locator entry, parsed once and ready to be resolved.
+    """
+    __slots__ = ("name", "locate", "locator", "is_dynamic", "_format")
+
+    def __init__(self, entry):
+        self.name = entry["name"]
+        self.locate = entry["locate"]
+        self.locator = entry["locator"]
+        self.is_dynamic = entry.get("is_dynamic", False)
+        # Bound str.format of the template, so resolving skips the attribute lookup
+        self._format = self.locator.format
+
+    def resolve(self, **kwargs):
+        """
+        Return the (locate, locator_value) tuple, formatting dynamic templates with kwargs.
+        :param kwargs: Dynamic values for formatting the locator string.
+        :return: Tuple (locate, locator_value)
+        """
+        if not self.is_dynamic:
+            return self.locate, self.locator
+        return self.locate, self._format(**kwargs)
+
+
+def _sample_value(locator):
+    """
+    Substitute every template field with a placeholder value so the selector can be syntax checked.
+    """
+    return re.sub(r"\{[^{}]*\}", "x", locator)
+
+
+def check_selector_syntax(locate, locator):
+    """
+    Validate XPath/CSS syntax of a locator without a browser, with lxml.
+    :param locate: Locator type (xpath, css, ...).
+    :param locator: Locator value, with template fields already substituted.
+    :return: Error message or None when the locator is valid.
+    """
+    if locate == "xpath":
+        try:
+            etree.XPath(locator)
+        except etree.XPathSyntaxError as e:
+            return f"invalid XPath: {e}"
+    elif locate == "css":
+        try:
+            CSSSelector(locator)
+        except Exception as e:
+            return f"invalid CSS selector: {e}"
+    return None
+
+
+def validate_locator_entries(filename, entries):
+    """
+    Validate the raw entries of a locator file.
+    :param filename: Path of the locator file, used for messages.
+    :param entries: Parsed JSON content of the file.
+    :return: List of error messages, empty when the file is valid.
+    """
+    if not isinstance(entries, list):
+        return ["top level JSON value must be a list of locators"]
+    errors = []
+    seen = set()
+    for index, entry in enumerate(entries):
+        if not isinstance(entry, dict):
+            errors.append(f"entry #{index} is not an object")
+            continue
+        missing = [key for key in ("name", "locate", "locator") if not entry.get(key)]
+        if missing:
+            errors.append(f"entry #{index} is missing {', '.join(missing)}")
+            continue
+        not_strings = [key for key in ("name", "locate", "locator") if not isinstance(entry[key], str)]
+        if not_strings:
+            errors.append(f"entry #{index}: {', '.join(not_strings)} must be a string")
+            continue
+        name = entry["name"]
+        if name in seen:
+            errors.append(f"duplicate locator name '{name}'")
+        seen.add(name)
+        locate = entry["locate"].lower()
+        if locate not in SUPPORTED_LOCATOR_TYPES:
+            errors.append(f"'{name}': unsupported locate type '{entry['locate']}'")
+            continue
+        locator = _sample_value(entry["locator"]) if entry.get("is_dynamic") else entry["locator"]
+        error = check_selector_syntax(locate, locator)
+        if error:
+            errors.append(f"'{name}': {error} -> {entry['locator']}")
+    return errors
+
+
+class LocatorRegistry:
+    """
+    Process-wide cache of compiled locator files.
+    Each file is parsed and validated once and re-loaded only when its mtime changes.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+    _files = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, filename):
+        """
+        Return the name -> CompiledLocator index for a locator file.
+        :param filename: Path to the locator JSON file.
+        :return: Dict of compiled locators.
+        :raises OSError: if the file cannot be read.
+        :raises LocatorValidationError: if the file content is invalid.
+        """
+        mtime = os.stat(filename).st_mtime_ns
+        cached = cls._files.get(filename)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        with cls._lock:
+            cached = cls._files.get(filename)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+            index = cls._compile(filename)
+            cls._files[filename] = (mtime, index)
+            return index
+
+    @classmethod
+    def _compile(cls, filename):
+        with open(filename, 'r', encoding='utf-8') as fh:
+            entries = json.load(fh)
+        errors = validate_locator_entries(filename, entries)
+        if errors:
+            raise LocatorValidationError(filename, errors)
+        cls.log.debug(f"Compiled {len(entries)} locators from {filename}")
+        return {entry["name"]: CompiledLocator(entry) for entry in entries}
+
+    @classmethod
+    def clear(cls):
+        """
+        Drop every cached locator file.
+        """
+        with cls._lock:
+            cls._files.clear()
+
+
+def validate_locator_repo(locator_dir=None):
+    """
+    Compile every locator file in the locator repository.
+    :param locator_dir: Root of the locator repository, defaults to PROJECT_ROOT/locators_repo.
+    :return: List of error messages, empty when every file is valid.
+    """
+    locator_dir = locator_dir or os.path.join(PROJECT_ROOT, LOCATOR_REPO_DIR)
+    errors = []
+    for root, _, files in os.walk(locator_dir):
+        for name in sorted(files):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(root, name)
+            try:
+                LocatorRegistry.get(path)
+            except LocatorValidationError as e:
+                errors.append(str(e))
+            except (OSError, ValueError) as e:
+                errors.append(f"Invalid locator file {path}: {e}")
+    return errors
+
 
 class Locators:
     log = log_utils.custom_logger(logging.INFO)
 
-    def __init__(self,page_cls):
+    def __init__(self, page_cls, folder):
+        """
+        :param page_cls: Page object class, its name is the locator file name.
+        :param folder: Locator folder of the suite (SuiteContext.locator_folder).
+        """
         self.page_cls = page_cls
-        locator_dir = os.path.join(PROJECT_ROOT, "locators_repo")
-        loc_web_repo_dir = os.path.join(os.getenv("TEST_FOLDER"), self.page_cls.__name__ + ".json")
+        locator_dir = os.path.join(PROJECT_ROOT, LOCATOR_REPO_DIR)
+        loc_web_repo_dir = os.path.join(folder, self.page_cls.__name__ + ".json")
         self.filename = os.path.join(locator_dir, loc_web_repo_dir)
 
     def read_json(self):
         """
-        Read and parse the locator JSON file for the page class.
-        :return: Parsed JSON data or None if error occurs.
+        Read the compiled locator index for the page class from the shared registry.
+        :return: Dict of name -> CompiledLocator or None if error occurs.
         """
         try:
-            with open(self.filename, 'r', encoding='utf-8') as fh:
-                return json.load(fh)
+            return LocatorRegistry.get(self.filename)
         except Exception as e:
             self.log.error(f"Failed to read locator JSON file at {self.filename}. Exception: {e}")
             return None
@@ -33,18 +217,19 @@ class Locators:
         :param kwargs: Dynamic values for formatting the locator string.
         :return: Tuple (locate, locator_value) or None if not found.
         """
-        locator_json_data = self.read_json()
-        if not locator_json_data:
+        locators = self.read_json()
+        if not locators:
             self.log.error(f"No locator data found for {self.filename}")
             return None
-        for locator in locator_json_data:
-            if locator.get('name') == locator_name:
-                is_dynamic = locator.get("is_dynamic", False)
-                try:
-                    locator_value = locator['locator'].format(**kwargs) if is_dynamic else locator['locator']
-                except Exception as e:
-                    self.log.error(f"Failed to format locator '{locator_name}' with args {kwargs}. Exception: {e}")
-                    return None
-                return locator['locate'], locator_value
-        self.log.error(f"Locator '{locator_name}' not found in {self.filename}")
-        return None
+        locator = locators.get(locator_name)
+        if locator is None:
+            self.log.error(f"Locator '{locator_name}' not found in {self.filename}")
+            return None
+        try:
+            resolved = locator.resolve(**kwargs)
+        except Exception as e:
+            self.log.error(f"Failed to format locator '{locator_name}' with args {kwargs}. Exception: {e}")
+            return None
+        if locator_profile.enabled:
+            locator_profile.register(self.page_cls.__name__, locator_name, locator.locate, locator.locator, resolved[1])
+        return resolved
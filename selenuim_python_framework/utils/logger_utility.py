@@ -1,31 +1,183 @@
-import inspect
+import atexit
 import logging
 import os
+import queue
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Mapping
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+_setup_lock = threading.Lock()
+_listener = None
+_failure_buffer = None
+
+# Log arguments of these types may change after the call, records holding them are formatted eagerly
+_MUTABLE_ARGS = (Mapping, list, set, bytearray)
+
+
+def freeze_args(record):
+    """
+    Format the message of a record whose arguments are mutable containers (e.g. the element
+    snapshots SeleniumBase logs), so later changes of those objects do not leak into the log.
+    Records with immutable arguments are left for the listener thread to format.
+    :return: The record.
+    """
+    args = record.args
+    if args and (isinstance(args, Mapping) or any(isinstance(arg, _MUTABLE_ARGS) for arg in args)):
+        record.msg = record.getMessage()
+        record.args = None
+    return record
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that hands the record over unformatted, so the message is
+    formatted by the listener thread instead of the calling test thread.
+    Only records with mutable arguments are formatted here (freeze_args).
+    """
+
+    def prepare(self, record):
+        return freeze_args(record)
+
+
+class FailureLogBuffer(logging.Handler):
+    """
+    Root handler of the --log-on-failure mode, in place of DeferredQueueHandler. Records of the
+    running test are kept in a bounded ring and only queued for the log file when the test
+    fails; a passing test writes one summary line. Records outside a test are queued directly.
+    """
+
+    def __init__(self, log_queue, capacity=2000):
+        super().__init__()
+        self.queue = log_queue
+        self.capacity = capacity
+        self.failed = False
+        self.dropped = 0
+        self._records = None
+        self._started = 0.0
+
+    def emit(self, record):
+        freeze_args(record)
+        records = self._records
+        if records is None:
+            self.queue.put_nowait(record)
+            return
+        if len(records) == records.maxlen:
+            self.dropped += 1
+        records.append(record)
+
+    def start(self):
+        """
+        Start buffering the records of a test.
+        """
+        self._records = deque(maxlen=self.capacity)
+        self.failed = False
+        self.dropped = 0
+        self._started = time.perf_counter()
+
+    def _line(self, message, level=logging.INFO):
+        self.queue.put_nowait(logging.makeLogRecord(
+            {"name": __name__, "levelno": level, "levelname": logging.getLevelName(level), "msg": message}))
+
+    def finish(self, nodeid):
+        """
+        Stop buffering: write the records when the test failed, else a summary line.
+        :return: Number of buffered records.
+        """
+        records, self._records = self._records, None
+        if records is None:
+            return 0
+        took = time.perf_counter() - self._started
+        if not self.failed:
+            self._line(f"PASSED {nodeid} in {took:.2f}s, {len(records) + self.dropped} log records discarded")
+            return len(records)
+        self._line(f"FAILED {nodeid} in {took:.2f}s, {len(records)} buffered log records follow", logging.ERROR)
+        if self.dropped:
+            self._line(f"{self.dropped} earlier log records of {nodeid} were dropped from the buffer", logging.WARNING)
+        for record in records:
+            self.queue.put_nowait(record)
+        return len(records)
+
+
+def log_file_path():
+    """
+    Path of the log file of this process: logs/<dd-mm-YYYY>/log<ddmmYYYY-HHMM>.log
+    """
+    now = datetime.now()
+    log_dir = os.path.join(os.path.abspath(os.path.dirname(__file__)), "..", "logs",
+                           now.strftime('%d-%m-%Y'))
+    return os.path.join(log_dir, "log" + now.strftime('%d%m%Y-%H%M') + ".log")
+
+
+def setup_logging():
+    """
+    Create the log directory, the file handler and the background QueueListener once per process.
+    Root logger records are queued and written to disk by the listener thread.
+    :return: The running QueueListener.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+    with _setup_lock:
+        if _listener is not None:
+            return _listener
+        log_filename = log_file_path()
+        os.makedirs(os.path.dirname(log_filename), exist_ok=True)
+        file_handler = logging.FileHandler(log_filename, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+        listener.start()
+        logging.getLogger().addHandler(DeferredQueueHandler(log_queue))
+        atexit.register(listener.stop)
+        _listener = listener
+        return listener
+
+
+def buffer_until_failure(capacity=2000, level=logging.DEBUG):
+    """
+    Switch the root logger to a FailureLogBuffer, records are then only written for failing tests.
+    :param capacity: Records kept per test, the oldest ones are dropped first.
+    :param level: Root logger level while buffering. Loggers without a level of their own
+                  (SeleniumBase, the WaitEngine) are filtered by it before reaching the buffer.
+    :return: The FailureLogBuffer, its start/finish calls delimit the tests.
+    """
+    global _failure_buffer
+    listener = setup_logging()
+    with _setup_lock:
+        if _failure_buffer is None:
+            root = logging.getLogger()
+            root.setLevel(level)
+            for handler in list(root.handlers):
+                if isinstance(handler, DeferredQueueHandler):
+                    root.removeHandler(handler)
+            _failure_buffer = FailureLogBuffer(listener.queue, capacity)
+            root.addHandler(_failure_buffer)
+        return _failure_buffer
+
+
+def failure_buffer():
+    """
+    :return: The FailureLogBuffer of the process, None unless buffer_until_failure was called.
+    """
+    return _failure_buffer
 
 
 def custom_logger(log_level=logging.DEBUG):
     """
     This is logging method.
+    The logger is named after the calling module, so every class of a module shares one logger;
+    the log file format does not include the name, log_cli shows file and line of each record.
     :param log_level: Log levels
     :return: logger
     """
-    log_filename = None
-    cur_path = os.path.abspath(os.path.dirname(__file__))
-    log_dir = os.path.join(cur_path, r"../logs/")
-    if not os.path.exists(log_dir):
-        os.mkdir(log_dir)
-    date_dir = os.path.join(log_dir, str(datetime.strftime(datetime.now(), '%d-%m-%Y')))
-    if not os.path.exists(date_dir):
-        os.mkdir(date_dir)
-    current_time = datetime.strftime(datetime.now(), '%d%m%Y-%H%M')
-    if log_filename is None:
-        temp_file = "log" + current_time + ".log"
-        log_filename = os.path.join(date_dir, temp_file)
-    caller_name = inspect.stack()[1][1] + " - \tLN:" + str(inspect.stack()[1][2])
-    caller_name = str(caller_name)
-    logging.basicConfig(filename=log_filename, format='%(asctime)s - %(levelname)s - %(message)s')
-    logger = logging.getLogger(caller_name)
+    setup_logging()
+    logger = logging.getLogger(sys._getframe(1).f_globals.get("__name__", "__main__"))
     # Set logging level for logger
     logger.setLevel(log_level)
     return logger
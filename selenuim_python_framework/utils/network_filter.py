@@ -0,0 +1,204 @@
+import logging
+import os
+import threading
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from fnmatch import fnmatch
+from urllib.parse import urlsplit
+
+import utils.logger_utility as log_utils
+
+NETWORK_SECTION = "NETWORK"
+MEASURE_TIMEOUT = 5
+
+# Fallback for drivers whose BiDi request events carry no resource type (only Chrome sends goog:resourceType)
+_EXTENSION_TYPES = {
+    "image": (".png", ".jpg", ".jpeg", ".gif", ".webp", ".svg", ".ico", ".avif", ".bmp"),
+    "font": (".woff", ".woff2", ".ttf", ".otf", ".eot"),
+    "media": (".mp4", ".webm", ".mp3", ".ogg", ".wav", ".m3u8"),
+    "stylesheet": (".css",),
+    "script": (".js", ".mjs"),
+}
+
+
+def resource_type(url, reported=None):
+    """
+    Resource type of a request: the type reported by the browser when there is one
+    (image, font, media, stylesheet, script, xhr, fetch, ...), else a best effort
+    guess from the URL extension, 'other' when unknown.
+    :param reported: Request.resource_type of the BiDi event (goog:resourceType), if any.
+    """
+    if reported:
+        return reported.lower()
+    ext = os.path.splitext(urlsplit(url).path)[1].lower()
+    for kind, extensions in _EXTENSION_TYPES.items():
+        if ext in extensions:
+            return kind
+    return "other"
+
+
+def _split(value):
+    return tuple(item.strip() for item in value.replace("\n", ",").split(",") if item.strip())
+
+
+class NetworkPolicy:
+    """
+    Per-site request blocking rules read from the [NETWORK] section of the suite .ini:
+
+        [NETWORK]
+        block_patterns = *doubleclick.net*, *google-analytics.com*
+        allow_patterns = *goibibo.com/bus*
+        block_resource_types = font, media
+        images = false
+        measure_blocked_bytes = false
+
+    Allow patterns win over every block rule. measure_blocked_bytes sends a real HEAD
+    request from the test machine (not the browser) once per blocked URL to count the bytes saved.
+    """
+
+    def __init__(self, block_patterns=(), allow_patterns=(), block_resource_types=(), images=True,
+                 measure_blocked_bytes=False):
+        self.block_patterns = tuple(block_patterns)
+        self.allow_patterns = tuple(allow_patterns)
+        self.block_resource_types = set(block_resource_types)
+        self.images = images
+        self.measure_blocked_bytes = measure_blocked_bytes
+        if not images:
+            self.block_resource_types.add("image")
+
+    @classmethod
+    def from_config(cls, config):
+        """
+        :return: NetworkPolicy or None when the config has no [NETWORK] section.
+        """
+        if not config.has_section(NETWORK_SECTION):
+            return None
+        section = config[NETWORK_SECTION]
+        return cls(
+            block_patterns=_split(section.get("block_patterns", "")),
+            allow_patterns=_split(section.get("allow_patterns", "")),
+            block_resource_types=_split(section.get("block_resource_types", "")),
+            images=section.getboolean("images", fallback=True),
+            measure_blocked_bytes=section.getboolean("measure_blocked_bytes", fallback=False),
+        )
+
+    @property
+    def key(self):
+        """
+        Hashable identity of the policy, part of the driver pool key.
+        """
+        return self.block_patterns, self.allow_patterns, tuple(sorted(self.block_resource_types))
+
+    def block_reason(self, url, reported_type=None):
+        """
+        :param reported_type: Resource type reported by the browser, if any.
+        :return: Reason string ('pattern' or the resource type) if the URL is blocked, else None.
+        """
+        if any(fnmatch(url, pattern) for pattern in self.allow_patterns):
+            return None
+        if any(fnmatch(url, pattern) for pattern in self.block_patterns):
+            return "pattern"
+        kind = resource_type(url, reported_type)
+        if kind in self.block_resource_types:
+            return kind
+        return None
+
+
+class NetworkBlocker:
+    """
+    Enforces a NetworkPolicy on a live driver through WebDriver BiDi request
+    interception (Chrome and Firefox, needs options.enable_bidi) and counts
+    blocked and allowed requests.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, driver, policy):
+        self.driver = driver
+        self.policy = policy
+        self._counts = Counter()
+        self._lock = threading.Lock()
+        self._handler_id = None
+        self._sizes = {}
+        self._pending = []
+        self._head_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="blocked-bytes") \
+            if policy.measure_blocked_bytes else None
+
+    def start(self):
+        """
+        Register the BiDi request handler.
+        :return: True if interception is active, False if the driver has no BiDi network support.
+        """
+        try:
+            # The property opens the BiDi connection and raises without a webSocketUrl capability
+            network = getattr(self.driver, "network", None)
+            if network is None:
+                self.log.warning("Driver has no BiDi network module, request blocking disabled")
+                return False
+            self._handler_id = network.add_request_handler("before_request", self._on_request)
+            return True
+        except Exception as e:
+            self.log.warning(f"Failed to enable BiDi request interception. Exception: {e}")
+            return False
+
+    def _on_request(self, request):
+        reason = self.policy.block_reason(request.url, getattr(request, "resource_type", None))
+        try:
+            if reason:
+                request.fail_request()
+                if self._head_executor:
+                    self._measure_later(request.url)
+            else:
+                request.continue_request()
+        finally:
+            with self._lock:
+                if reason:
+                    self._counts["blocked_requests"] += 1
+                    self._counts[f"blocked_{reason}"] += 1
+                else:
+                    self._counts["allowed_requests"] += 1
+
+    def _measure_later(self, url):
+        with self._lock:
+            if url in self._sizes:
+                self._counts["blocked_bytes"] += self._sizes[url]
+                return
+            self._pending.append(self._head_executor.submit(self._measure, url))
+
+    def _measure(self, url):
+        """
+        :return: Content-Length of the URL, 0 when it cannot be measured.
+        """
+        try:
+            head = urllib.request.Request(url, method="HEAD")
+            with urllib.request.urlopen(head, timeout=MEASURE_TIMEOUT) as response:
+                size = int(response.headers.get("Content-Length") or 0)
+        except (OSError, ValueError):
+            size = 0
+        with self._lock:
+            self._sizes[url] = size
+        return size
+
+    def drain(self):
+        """
+        Return and reset the counters collected since the previous drain. HEAD requests
+        of the URLs blocked since then are awaited, so their bytes are counted in this drain.
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        done, _ = wait(pending, timeout=MEASURE_TIMEOUT)
+        with self._lock:
+            counts, self._counts = self._counts, Counter()
+        if self._head_executor:
+            counts["blocked_bytes"] += sum(future.result() for future in done)
+        return dict(counts)
+
+    def stop(self):
+        if self._handler_id is not None:
+            try:
+                self.driver.network.remove_request_handler("before_request", self._handler_id)
+            except Exception as e:
+                self.log.debug(f"Failed to remove request handler: {e}")
+            self._handler_id = None
+        if self._head_executor:
+            self._head_executor.shutdown(wait=False)
@@ -0,0 +1,202 @@
+"""
+Multi-process test runner.
+
+Shards the collected test classes across N pytest worker processes, each with
+its own driver pool, and merges the per-worker JUnit results into one report.
+Shards are scheduled longest-first from the timing history recorded by every run.
+
+Usage (from the framework root):
+    python -m utils.parallel_runner tests/ --workers 4 -- --browser=chrome
+"""
+import argparse
+import html
+import os
+import subprocess
+import sys
+import xml.etree.ElementTree as ET
+
+from common.constants import *
+from utils.report_archiver import ReportArchiver
+from utils.timing_history import TimingHistory, shard_key
+
+# Assumed duration of one test when there is no timing history at all
+DEFAULT_TEST_SECONDS = 5.0
+
+
+def collect_shards(paths, pytest_args):
+    """
+    Collect test node ids in a subprocess and group them into shards.
+    :return: Dict of shard key -> list of node ids, in collection order.
+    """
+    cmd = [sys.executable, "-m", "pytest", "--collect-only", "-q",
+           f"--html={os.path.join(WORKER_DIR, 'collect.html')}", *paths, *pytest_args]
+    env = dict(os.environ, **{WORKER_ID_ENV: "collect"})
+    result = subprocess.run(cmd, capture_output=True, text=True, env=env)
+    if result.returncode not in (0, 5):
+        sys.stdout.write(result.stdout)
+        sys.stderr.write(result.stderr)
+        raise SystemExit(result.returncode)
+    shards = {}
+    for line in result.stdout.splitlines():
+        if "::" in line and not line.startswith(" "):
+            nodeid = line.strip()
+            shards.setdefault(shard_key(nodeid), []).append(nodeid)
+    return shards
+
+
+def estimate_durations(shards, history):
+    """
+    Expected duration of every shard: its recorded duration, or its test count times
+    the median test duration for shards without history.
+    :param shards: Dict of shard key -> list of node ids.
+    :param history: TimingHistory instance.
+    :return: Dict of shard key -> seconds.
+    """
+    known = history.shard_durations()
+    per_test = history.test_duration() or DEFAULT_TEST_SECONDS
+    return {key: known.get(key, len(nodeids) * per_test) for key, nodeids in shards.items()}
+
+
+def assign_shards(shards, workers, durations=None):
+    """
+    Assign shards to workers, longest shard first to the least loaded worker.
+    Every worker runs its shards longest first.
+    :param shards: Dict of shard key -> list of node ids.
+    :param workers: Number of worker processes.
+    :param durations: Dict of shard key -> expected seconds, defaults to the test count.
+    :return: List (one per worker) of shard keys.
+    """
+    weight = durations or {key: len(nodeids) for key, nodeids in shards.items()}
+    buckets = [[] for _ in range(workers)]
+    load = [0] * workers
+    for key in sorted(shards, key=lambda k: weight[k], reverse=True):
+        index = load.index(min(load))
+        buckets[index].append(key)
+        load[index] += weight[key]
+    return [bucket for bucket in buckets if bucket]
+
+
+def start_worker(index, shard_keys, pytest_args):
+    """
+    Start one pytest worker process over the given shards.
+    Node ids are passed through an @args file to avoid command line length limits.
+    :return: Tuple (Popen, junit xml path, html report path)
+    """
+    worker_id = f"gw{index}"
+    args_file = os.path.join(WORKER_DIR, f"{worker_id}.args")
+    junit_path = os.path.join(WORKER_DIR, f"{worker_id}.xml")
+    html_path = os.path.join(WORKER_DIR, f"{worker_id}.html")
+    with open(args_file, "w", encoding="utf-8") as fh:
+        fh.write("\n".join(shard_keys))
+    cmd = [sys.executable, "-m", "pytest", f"@{args_file}", f"--junitxml={junit_path}",
+           f"--html={html_path}", "--self-contained-html", *pytest_args]
+    env = dict(os.environ, **{WORKER_ID_ENV: worker_id})
+    log_file = open(os.path.join(WORKER_DIR, f"{worker_id}.log"), "w", encoding="utf-8")
+    process = subprocess.Popen(cmd, stdout=log_file, stderr=subprocess.STDOUT, env=env)
+    process.log_file = log_file
+    return process, junit_path, html_path
+
+
+def merge_junit(junit_paths, output_path):
+    """
+    Merge worker JUnit files into a single <testsuites> document.
+    :return: List of (worker, classname, name, outcome, time) rows.
+    """
+    merged = ET.Element("testsuites")
+    rows = []
+    for worker, path in junit_paths:
+        if not os.path.exists(path):
+            rows.append((worker, "", "worker produced no results", "error", 0.0))
+            continue
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else list(root)
+        for suite in suites:
+            suite.set("name", f"{suite.get('name', 'pytest')}[{worker}]")
+            merged.append(suite)
+            for case in suite.iter("testcase"):
+                outcome = "passed"
+                for tag in ("failure", "error", "skipped"):
+                    if case.find(tag) is not None:
+                        outcome = tag
+                        break
+                rows.append((worker, case.get("classname", ""), case.get("name", ""),
+                             outcome, float(case.get("time", 0))))
+    for attr in ("tests", "failures", "errors", "skipped"):
+        merged.set(attr, str(sum(int(s.get(attr, 0)) for s in merged)))
+    merged.set("time", f"{sum(float(s.get('time', 0)) for s in merged):.3f}")
+    ET.ElementTree(merged).write(output_path, encoding="utf-8", xml_declaration=True)
+    return rows
+
+
+def write_summary(rows, html_paths, output_path):
+    """
+    Write a single HTML summary over every worker with links to the worker reports.
+    """
+    totals = {}
+    for row in rows:
+        totals[row[3]] = totals.get(row[3], 0) + 1
+    links = " | ".join(
+        f'<a href="{html.escape(os.path.relpath(path, os.path.dirname(output_path)))}">{worker}</a>'
+        for worker, path in html_paths)
+    body = "\n".join(
+        f"<tr class='{outcome}'><td>{worker}</td><td>{html.escape(cls)}</td><td>{html.escape(name)}</td>"
+        f"<td>{outcome}</td><td>{duration:.2f}</td></tr>"
+        for worker, cls, name, outcome, duration in rows)
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(totals.items()))
+    with open(output_path, "w", encoding="utf-8") as fh:
+        fh.write(f"""<html><head><title>Parallel test report</title>
+<style>td,th{{padding:2px 8px}} .failure,.error{{color:#b00}} .skipped{{color:#888}}</style></head>
+<body><h2>Parallel test report</h2><p>{summary}</p><p>Worker reports: {links}</p>
+<table><tr><th>Worker</th><th>Class</th><th>Test</th><th>Outcome</th><th>Duration (s)</th></tr>
+{body}
+</table></body></html>""")
+
+
+def run(paths, workers, pytest_args):
+    """
+    Collect, shard, run and merge.
+    :return: Process exit code, 0 when every worker passed.
+    """
+    os.makedirs(WORKER_DIR, exist_ok=True)
+    archiver = ReportArchiver(os.path.join(PROJECT_ROOT, REPORT_CONFIG))
+    shards = collect_shards(paths, pytest_args)
+    if not shards:
+        print("No tests collected.")
+        return 5
+    durations = estimate_durations(shards, TimingHistory(os.path.join(PROJECT_ROOT, TIMING_DB)))
+    buckets = assign_shards(shards, workers, durations)
+    print(f"Running {len(shards)} shards on {len(buckets)} workers")
+    for index, bucket in enumerate(buckets):
+        print(f"  gw{index}: {len(bucket)} shards, estimated {sum(durations[key] for key in bucket):.1f}s")
+    processes = [start_worker(index, bucket, pytest_args) for index, bucket in enumerate(buckets)]
+    exit_code = 0
+    for index, (process, _, _) in enumerate(processes):
+        code = process.wait()
+        process.log_file.close()
+        print(f"Worker gw{index} finished with exit code {code}")
+        exit_code = exit_code or code
+    junit_paths = [(f"gw{i}", junit) for i, (_, junit, _) in enumerate(processes)]
+    html_paths = [(f"gw{i}", report) for i, (_, _, report) in enumerate(processes)]
+    rows = merge_junit(junit_paths, os.path.join(PROJECT_ROOT, PARALLEL_JUNIT_FILENAME))
+    write_summary(rows, html_paths, os.path.join(PROJECT_ROOT, PARALLEL_REPORT_FILENAME))
+    print(f"Merged report generated: {os.path.join(PROJECT_ROOT, PARALLEL_REPORT_FILENAME)}")
+    archiver.add_modified_since(os.path.join(PROJECT_ROOT, TEMP_DIR))
+    print(f"Session artifacts archived, manifest: {archiver.finalize()}")
+    return exit_code
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run pytest test classes in parallel worker processes.")
+    parser.add_argument("paths", nargs="*", default=["tests"], help="Test paths to collect")
+    parser.add_argument("-n", "--workers", type=int, default=os.cpu_count() or 1, help="Number of worker processes")
+    argv = sys.argv[1:] if argv is None else argv
+    pytest_args = []
+    if "--" in argv:
+        split = argv.index("--")
+        argv, pytest_args = argv[:split], argv[split + 1:]
+    args = parser.parse_args(argv)
+    return run(args.paths, max(1, args.workers), pytest_args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
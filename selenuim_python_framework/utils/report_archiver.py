@@ -0,0 +1,139 @@
+"""
+Incremental, content-addressed report archive.
+
+Every artifact of a session is gzip-compressed on a thread pool into
+reports/objects/<sha256[:2]>/<sha256>.gz (stored once across runs) and the
+run is described by a manifest reports/<timestamp>.json.
+
+Restore a run (from the framework root):
+    python -m utils.report_archiver extract reports/<timestamp>.json <destination>
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import utils.logger_utility as log_utils
+from common.constants import *
+
+
+class ReportArchiver:
+    """
+    Archives the artifacts produced by the current session only.
+    Artifacts are compressed as soon as they are added, so the archive is
+    built while tests are still running instead of at shutdown.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, archive_dir, workers=4):
+        """
+        :param archive_dir: Directory holding the manifests and the objects store.
+        :param workers: Number of compression threads.
+        """
+        self.archive_dir = archive_dir
+        self.objects_dir = os.path.join(archive_dir, "objects")
+        self.started = time.time()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archiver")
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def add(self, path, arcname=None):
+        """
+        Queue a file for archiving. Adding the same arcname again replaces the previous version.
+        :param path: File to archive.
+        :param arcname: Name inside the archive, defaults to the path relative to PROJECT_ROOT.
+        """
+        arcname = arcname or os.path.relpath(os.path.abspath(path), PROJECT_ROOT)
+        with self._lock:
+            self._entries[arcname] = self._executor.submit(self._store, path)
+
+    def add_modified_since(self, directory, since=None):
+        """
+        Queue every file of a directory modified during this session and not added yet.
+        :param since: Timestamp, defaults to the archiver creation time.
+        """
+        since = self.started if since is None else since
+        for root, _, files in os.walk(directory):
+            for name in files:
+                path = os.path.join(root, name)
+                arcname = os.path.relpath(os.path.abspath(path), PROJECT_ROOT)
+                with self._lock:
+                    if arcname not in self._entries and os.path.getmtime(path) >= since:
+                        self._entries[arcname] = self._executor.submit(self._store, path)
+
+    def _object_path(self, digest):
+        return os.path.join(self.objects_dir, digest[:2], digest + ".gz")
+
+    def _store(self, path):
+        with open(path, "rb") as fh:
+            data = fh.read()
+        digest = hashlib.sha256(data).hexdigest()
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            os.makedirs(os.path.dirname(object_path), exist_ok=True)
+            tmp_path = f"{object_path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as fh:
+                fh.write(gzip.compress(data, compresslevel=6))
+            os.replace(tmp_path, object_path)
+        return {"sha256": digest, "size": len(data)}
+
+    def finalize(self, run_name=None):
+        """
+        Wait for pending compressions and write the run manifest.
+        :param run_name: Manifest name, defaults to the current timestamp.
+        :return: Path of the manifest.
+        """
+        run_name = run_name or datetime.strftime(datetime.now(), '%d_%m_%Y-%H_%M_%S')
+        with self._lock:
+            entries = dict(self._entries)
+        files = {}
+        for arcname, future in sorted(entries.items()):
+            try:
+                files[arcname] = future.result()
+            except OSError as e:
+                self.log.error(f"Failed to archive {arcname}. Exception: {e}")
+        self._executor.shutdown(wait=True)
+        os.makedirs(self.archive_dir, exist_ok=True)
+        manifest_path = os.path.join(self.archive_dir, f"{run_name}.json")
+        with open(manifest_path, "w", encoding="utf-8") as fh:
+            json.dump({"run": run_name, "created": time.time(), "files": files}, fh, indent=2)
+        return manifest_path
+
+
+def extract_run(manifest_path, destination):
+    """
+    Restore the files of an archived run.
+    :param manifest_path: Run manifest written by ReportArchiver.finalize.
+    :param destination: Directory to restore into.
+    """
+    archive_dir = os.path.dirname(os.path.abspath(manifest_path))
+    with open(manifest_path, encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    for arcname, entry in manifest["files"].items():
+        digest = entry["sha256"]
+        target = os.path.join(destination, arcname)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with gzip.open(os.path.join(archive_dir, "objects", digest[:2], digest + ".gz"), "rb") as src, \
+                open(target, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Restore an archived test run.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    extract = sub.add_parser("extract", help="Restore the files of a run manifest")
+    extract.add_argument("manifest")
+    extract.add_argument("destination")
+    args = parser.parse_args()
+    extract_run(args.manifest, args.destination)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+import logging
+import os
+import time
+from collections import deque, namedtuple
+
+import utils.logger_utility as log_utils
+
+ResourceSample = namedtuple("ResourceSample", "time memory_mb cpu_percent processes js_heap_mb")
+ResourceLimits = namedtuple("ResourceLimits", "memory_mb js_heap_mb cpu_percent")
+
+_PROC = "/proc"
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+_CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+JS_HEAP = """
+const m = window.performance && performance.memory;
+return m ? m.usedJSHeapSize : null;
+"""
+
+
+def _read(path):
+    try:
+        with open(path, encoding="ascii", errors="replace") as fh:
+            return fh.read()
+    except OSError:
+        return None
+
+
+def _stat_fields(pid):
+    """
+    Fields of /proc/<pid>/stat after the command name: [state, ppid, ..., utime (11), stime (12), ...].
+    """
+    stat = _read(f"{_PROC}/{pid}/stat")
+    return stat[stat.rfind(")") + 2:].split() if stat else None
+
+
+def process_tree(pid):
+    """
+    The process and all its descendants, e.g. chromedriver and every Chrome process it started.
+    :return: List of pids, empty when the process is gone or /proc is not available.
+    """
+    if not os.path.isdir(f"{_PROC}/{pid}"):
+        return []
+    children = {}
+    for entry in os.listdir(_PROC):
+        if entry.isdigit():
+            fields = _stat_fields(entry)
+            if fields:
+                children.setdefault(int(fields[1]), []).append(int(entry))
+    tree, stack = [], [pid]
+    while stack:
+        current = stack.pop()
+        tree.append(current)
+        stack.extend(children.get(current, ()))
+    return tree
+
+
+def process_memory(pid):
+    """
+    Memory of a process in bytes: proportional set size when the kernel exposes it,
+    so pages shared between browser processes are not counted once per process, else RSS.
+    """
+    rollup = _read(f"{_PROC}/{pid}/smaps_rollup")
+    if rollup:
+        for line in rollup.splitlines():
+            if line.startswith("Pss:"):
+                return int(line.split()[1]) * 1024
+    statm = _read(f"{_PROC}/{pid}/statm")
+    return int(statm.split()[1]) * _PAGE_SIZE if statm else 0
+
+
+class ResourceMonitor:
+    """
+    Samples the memory and CPU of a local driver's process tree (driver service and the
+    browser processes it started) from /proc, and the JavaScript heap where the browser
+    exposes performance.memory (Chromium). Remote and fake drivers only report the heap.
+
+    Attached to every driver created by utils.driver_utility.WebDriver; the driver pool
+    recycles a driver between test classes once a sample crosses the ResourceLimits.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, driver, max_samples=200):
+        self.driver = driver
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        self.pid = getattr(process, "pid", None)
+        self.samples = deque(maxlen=max_samples)
+        self.last_check = None
+        self._last_cpu = None
+
+    def _cpu_seconds(self, pids):
+        total = 0
+        for pid in pids:
+            fields = _stat_fields(pid)
+            if fields:
+                total += int(fields[11]) + int(fields[12])
+        return total / _CLOCK_TICKS
+
+    def sample(self, js_heap=True):
+        """
+        Take a sample: one /proc walk, plus one execute_script round trip for the JS heap.
+        :return: ResourceSample, memory/CPU are None without a local process tree,
+                 cpu_percent is the average since the previous sample.
+        """
+        now = time.monotonic()
+        memory_mb = cpu_percent = None
+        pids = process_tree(self.pid) if self.pid else []
+        if pids:
+            memory_mb = round(sum(process_memory(pid) for pid in pids) / 2 ** 20, 1)
+            cpu = self._cpu_seconds(pids)
+            if self._last_cpu is not None and now > self._last_cpu[0]:
+                cpu_percent = round(100 * (cpu - self._last_cpu[1]) / (now - self._last_cpu[0]), 1)
+            self._last_cpu = (now, cpu)
+        heap_mb = None
+        if js_heap:
+            try:
+                heap = self.driver.execute_script(JS_HEAP)
+                heap_mb = round(heap / 2 ** 20, 1) if heap else None
+            except Exception as e:
+                self.log.debug(f"JS heap not available: {e}")
+        sample = ResourceSample(now, memory_mb, cpu_percent, len(pids), heap_mb)
+        self.samples.append(sample)
+        return sample
+
+    def over_limits(self, limits, sample=None):
+        """
+        :param limits: ResourceLimits, a 0/None limit is not checked.
+        :return: Reason string when the sample crosses a limit, else None.
+        """
+        sample = sample or self.sample()
+        for name in ResourceLimits._fields:
+            limit, value = getattr(limits, name), getattr(sample, name)
+            if limit and value is not None and value > limit:
+                return f"{name} {value} > {limit}"
+        return None
+
+    def check(self, limits):
+        """
+        Sample at the end of a test class, kept in last_check for the report until it is taken.
+        :param limits: ResourceLimits or None to only sample.
+        :return: Reason string when the driver should be recycled, else None.
+        """
+        sample = self.sample()
+        reason = self.over_limits(limits, sample) if limits else None
+        self.last_check = (sample, reason)
+        return reason
+
+    def take_check(self):
+        """
+        :return: Tuple (sample, recycle reason) of the last class end check, None once taken.
+        """
+        check, self.last_check = self.last_check, None
+        return check
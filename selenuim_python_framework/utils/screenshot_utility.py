@@ -0,0 +1,104 @@
+import hashlib
+import io
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import utils.logger_utility as log_utils
+
+try:
+    from PIL import Image
+except ImportError:  # Pinned in requirements.txt, without it screenshots are stored as captured PNG
+    Image = None
+
+_EXTENSIONS = {"jpeg": "jpg", "webp": "webp", "png": "png"}
+
+
+class ScreenshotPipeline:
+    """
+    Captures screenshots in memory on the test thread and encodes/writes them on a thread pool.
+    Identical images (same content hash) are written once and share one file.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+
+    def __init__(self, directory, image_format="jpeg", quality=70, scale=0.5, workers=2, on_written=None):
+        """
+        :param directory: Directory the encoded screenshots are written to.
+        :param image_format: jpeg, webp or png. Needs Pillow, otherwise PNG is kept.
+        :param quality: Encoder quality (1-100) for jpeg/webp.
+        :param scale: Downscale factor applied before encoding, 1.0 keeps the full size.
+        :param workers: Number of encoder threads.
+        :param on_written: Optional callback called with the path of every written file.
+        """
+        self.directory = directory
+        self.image_format = image_format.lower()
+        if Image is None and (self.image_format != "png" or scale != 1.0):
+            self.log.warning(f"Pillow is not installed, screenshots are stored as full size PNG instead of "
+                             f"{self.image_format} scaled by {scale} (pip install -r requirements.txt)")
+            self.image_format = "png"
+        self.quality = quality
+        self.scale = scale
+        self.on_written = on_written
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="screenshot")
+        self._files = {}
+        self._futures = []
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def capture(self, driver, element=None, clip=None):
+        """
+        Take a screenshot and queue it for encoding.
+        :param driver: WebDriver instance
+        :param element: Capture only this WebElement instead of the viewport.
+        :param clip: Optional (x, y, width, height) region of the captured image to keep.
+        :return: File name (relative to the pipeline directory) the image will be written to.
+        """
+        png = element.screenshot_as_png if element is not None else driver.get_screenshot_as_png()
+        digest = hashlib.sha1(png + repr(clip).encode()).hexdigest()[:20]
+        with self._lock:
+            file_name = self._files.get(digest)
+            if file_name is not None:
+                return file_name
+            file_name = f"{digest}.{_EXTENSIONS[self.image_format]}"
+            self._files[digest] = file_name
+            self._futures.append(self._executor.submit(self._write, png, clip, file_name))
+        return file_name
+
+    def _encode(self, png, clip):
+        if Image is None:
+            return png
+        image = Image.open(io.BytesIO(png))
+        if clip:
+            x, y, width, height = clip
+            image = image.crop((x, y, x + width, y + height))
+        if self.scale != 1.0:
+            image = image.resize((max(1, int(image.width * self.scale)), max(1, int(image.height * self.scale))))
+        if self.image_format == "jpeg":
+            image = image.convert("RGB")
+        out = io.BytesIO()
+        image.save(out, format=self.image_format.upper(), quality=self.quality)
+        return out.getvalue()
+
+    def _write(self, png, clip, file_name):
+        path = os.path.join(self.directory, file_name)
+        try:
+            with open(path, "wb") as fh:
+                fh.write(self._encode(png, clip))
+            if self.on_written:
+                self.on_written(path)
+        except Exception as e:
+            self.log.error(f"Failed to write screenshot {file_name}. Exception: {e}")
+
+    def flush(self):
+        """
+        Block until every queued screenshot is written.
+        """
+        with self._lock:
+            futures, self._futures = self._futures, []
+        for future in futures:
+            future.result()
+
+    def shutdown(self):
+        self.flush()
+        self._executor.shutdown(wait=True)
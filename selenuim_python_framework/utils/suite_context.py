@@ -0,0 +1,33 @@
+import os
+
+from common.constants import *
+from utils.helper import ConfigUtility
+
+
+class SuiteContext:
+    """
+    Per-suite settings passed explicitly to page objects:
+    the loaded config, the locator folder and the base URL.
+    """
+
+    def __init__(self, name, config):
+        self.name = name
+        self.config = config
+        self.locator_folder = config.get('PROD', 'folder')
+        self.base_url = config.get('PROD', 'baseURL')
+
+    @classmethod
+    def load(cls, config_name):
+        """
+        Build the context from config/<config_name>.ini
+        :param config_name: Name of the ini file without extension.
+        :return: SuiteContext instance
+        """
+        return cls(config_name, ConfigUtility(config_name).load_config_file())
+
+    @property
+    def locator_dir(self):
+        return os.path.join(PROJECT_ROOT, LOCATOR_REPO_DIR, self.locator_folder)
+
+    def __repr__(self):
+        return f"SuiteContext(name={self.name!r}, folder={self.locator_folder!r}, base_url={self.base_url!r})"
@@ -0,0 +1,155 @@
+import csv
+import inspect
+import io
+import json
+import logging
+import os
+import threading
+
+import utils.logger_utility as log_utils
+
+_JSON_TYPES = {
+    "object": dict,
+    "array": list,
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "null": type(None),
+}
+
+
+class DataValidationError(ValueError):
+    """
+    Raised when test data does not match its schema.
+    """
+
+
+def validate_schema(data, schema, path="$"):
+    """
+    Validate data against the subset of JSON Schema used by the test data files:
+    type, required, properties, items and enum.
+    :return: List of error messages, empty when the data is valid.
+    """
+    errors = []
+    expected = schema.get("type")
+    if expected:
+        types = _JSON_TYPES[expected]
+        if not isinstance(data, types) or (expected in ("integer", "number") and isinstance(data, bool)):
+            return [f"{path}: expected {expected}, got {type(data).__name__}"]
+    if "enum" in schema and data not in schema["enum"]:
+        errors.append(f"{path}: {data!r} is not one of {schema['enum']}")
+    if isinstance(data, dict):
+        for key in schema.get("required", ()):
+            if key not in data:
+                errors.append(f"{path}: missing required key '{key}'")
+        for key, sub_schema in schema.get("properties", {}).items():
+            if key in data:
+                errors.extend(validate_schema(data[key], sub_schema, f"{path}.{key}"))
+    if isinstance(data, list) and "items" in schema:
+        for index, item in enumerate(data):
+            errors.extend(validate_schema(item, schema["items"], f"{path}[{index}]"))
+    return errors
+
+
+class RecordIndex:
+    """
+    Byte-offset index over a JSONL or CSV file. Only the offsets are kept in
+    memory; a record is read from disk when it is requested.
+    CSV records must fit on one line (no quoted newlines).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.is_csv = path.lower().endswith(".csv")
+        self.header = None
+        self.offsets = []
+        with open(path, "rb") as fh:
+            if self.is_csv:
+                self.header = next(csv.reader([fh.readline().decode("utf-8-sig")]))
+            offset = fh.tell()
+            for line in fh:
+                if line.strip():
+                    self.offsets.append(offset)
+                offset += len(line)
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def read(self, index):
+        """
+        :param index: Record number.
+        :return: The record as a dict.
+        """
+        with open(self.path, "rb") as fh:
+            fh.seek(self.offsets[index])
+            line = fh.readline().decode("utf-8")
+        if self.is_csv:
+            return dict(zip(self.header, next(csv.reader(io.StringIO(line)))))
+        return json.loads(line)
+
+    def __iter__(self):
+        """
+        Stream every record in file order.
+        """
+        with open(self.path, encoding="utf-8-sig" if self.is_csv else "utf-8", newline="") as fh:
+            if self.is_csv:
+                yield from csv.DictReader(fh)
+            else:
+                for line in fh:
+                    if line.strip():
+                        yield json.loads(line)
+
+
+class DataStore:
+    """
+    Session cache of test data. Class data files are parsed and validated once;
+    large JSONL/CSV data files are indexed and read lazily.
+    """
+    log = log_utils.custom_logger(logging.INFO)
+    _class_data = {}
+    _indexes = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def data_dir(test_obj):
+        """
+        The data folder next to the module defining a test class or module.
+        """
+        return os.path.join(os.path.dirname(inspect.getfile(test_obj)), "data")
+
+    @classmethod
+    def load(cls, test_cls):
+        """
+        Return the parsed data/<ClassName> file of a test class, validated against
+        data/<ClassName>.schema.json when present. The returned dict is shared, do not mutate it.
+        :raises DataValidationError: if the data does not match its schema.
+        """
+        data = cls._class_data.get(test_cls)
+        if data is not None:
+            return data
+        with cls._lock:
+            if test_cls not in cls._class_data:
+                path = os.path.join(cls.data_dir(test_cls), test_cls.__name__)
+                with open(path, 'r', encoding='utf-8') as fh:
+                    data = json.load(fh)
+                schema_path = path + ".schema.json"
+                if os.path.exists(schema_path):
+                    with open(schema_path, 'r', encoding='utf-8') as fh:
+                        errors = validate_schema(data, json.load(fh))
+                    if errors:
+                        raise DataValidationError(f"Invalid test data {path}:\n  " + "\n  ".join(errors))
+                cls._class_data[test_cls] = data
+            return cls._class_data[test_cls]
+
+    @classmethod
+    def record_index(cls, path):
+        """
+        Return the (cached) RecordIndex of a JSONL/CSV data file.
+        """
+        path = os.path.abspath(path)
+        with cls._lock:
+            if path not in cls._indexes:
+                cls._indexes[path] = RecordIndex(path)
+                cls.log.info(f"Indexed {len(cls._indexes[path])} records from {path}")
+            return cls._indexes[path]
@@ -0,0 +1,141 @@
+import os
+import sqlite3
+import statistics
+import threading
+import time
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    worker TEXT
+);
+CREATE TABLE IF NOT EXISTS test_phases (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    nodeid TEXT NOT NULL,
+    shard TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS driver_launches (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    shard TEXT NOT NULL,
+    duration REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS test_phases_shard ON test_phases(shard, run_id);
+"""
+
+
+def shard_key(nodeid):
+    """
+    Unit of scheduling for a test: its class, or its module for plain test functions.
+    Classes share one driver and state, so a class is never split across workers.
+    """
+    parts = nodeid.split("::")
+    return "::".join(parts[:2]) if len(parts) > 2 else parts[0]
+
+
+class TimingHistory:
+    """
+    Local SQLite database of test phase (setup/call/teardown) and driver launch durations.
+    A run buffers its timings in memory and writes them in one transaction with flush(),
+    so parallel workers only contend for the database once, at the end of their session.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._phases = []
+        self._launches = []
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        connection = sqlite3.connect(self.path, timeout=30)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+        return connection
+
+    def record_phase(self, nodeid, phase, duration, outcome):
+        with self._lock:
+            self._phases.append((nodeid, shard_key(nodeid), phase, duration, outcome))
+
+    def record_driver_launch(self, shard, duration):
+        with self._lock:
+            self._launches.append((shard, duration))
+
+    def flush(self, worker=None):
+        """
+        Persist the buffered timings as one run.
+        :return: Number of phase rows written.
+        """
+        with self._lock:
+            phases, self._phases = self._phases, []
+            launches, self._launches = self._launches, []
+        if not phases and not launches:
+            return 0
+        connection = self._connect()
+        try:
+            with connection:
+                run_id = connection.execute("INSERT INTO runs (started, worker) VALUES (?, ?)",
+                                            (time.time(), worker)).lastrowid
+                connection.executemany(
+                    "INSERT INTO test_phases (run_id, nodeid, shard, phase, duration, outcome) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(run_id, *row) for row in phases])
+                connection.executemany("INSERT INTO driver_launches (run_id, shard, duration) VALUES (?, ?, ?)",
+                                       [(run_id, *row) for row in launches])
+        finally:
+            connection.close()
+        return len(phases)
+
+    def shard_durations(self, last_runs=5):
+        """
+        Expected duration of every known shard: the median, over the last runs that executed
+        it, of the sum of its test phases. The class driver is launched inside the setup phase
+        of its first test, so launches are already included (see driver_launch_durations).
+        :return: Dict of shard key -> seconds.
+        """
+        return self._median_per_shard("test_phases", last_runs)
+
+    def driver_launch_durations(self, last_runs=5):
+        """
+        Median driver launch time of every known shard over its last runs, a part of its setup time.
+        :return: Dict of shard key -> seconds.
+        """
+        return self._median_per_shard("driver_launches", last_runs)
+
+    def _median_per_shard(self, table, last_runs):
+        if not os.path.exists(self.path):
+            return {}
+        connection = self._connect()
+        try:
+            rows = connection.execute(f"""
+                SELECT shard, run_id, SUM(duration) FROM {table}
+                GROUP BY shard, run_id ORDER BY shard, run_id DESC
+            """).fetchall()
+        finally:
+            connection.close()
+        totals = {}
+        for shard, _, total in rows:
+            runs = totals.setdefault(shard, [])
+            if len(runs) < last_runs:
+                runs.append(total)
+        return {shard: statistics.median(runs) for shard, runs in totals.items()}
+
+    def test_duration(self, last_runs=5):
+        """
+        Median duration of one test (all phases) over the recent history, used for unknown shards.
+        :return: Seconds, or None without history.
+        """
+        if not os.path.exists(self.path):
+            return None
+        connection = self._connect()
+        try:
+            rows = connection.execute("""
+                SELECT SUM(duration) FROM test_phases
+                WHERE run_id IN (SELECT id FROM runs ORDER BY id DESC LIMIT ?)
+                GROUP BY run_id, nodeid
+            """, (last_runs,)).fetchall()
+        finally:
+            connection.close()
+        return statistics.median(row[0] for row in rows) if rows else None